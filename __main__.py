@@ -1,3 +1,11 @@
+import sys
+
+from harshithl1777_kickoff.cmd.client import forward
+
+status = forward(sys.argv[1:])
+if status is not None:
+    sys.exit(status)
+
 from harshithl1777_kickoff.cmd.commands import app
 
 app(prog_name="kickoff")
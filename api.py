@@ -0,0 +1,298 @@
+"""Kickoff Project: api.py
+
+This module contains the Python API of Kickoff, which lets other programs load a League once and run the
+same queries as the CLI against it, without any of the CLI's parsing or console output.
+
+    from harshithl1777_kickoff.api import open_league
+
+    league = open_league()
+    league.winrate("Arsenal", season="2015-16")
+    league.winrates(season="2015-16", topx=3)
+
+Every query returns plain data, the same values the matching command prints before rounding or formatting,
+and raises ValueError for inputs the command would reject.
+
+This file is Copyright (c) 2023 Ram Raghav Sharma, Harshith Latchupatula, Vikram Makkar and Muhammad Ibrahim.
+"""
+import math
+from typing import Optional
+
+import harshithl1777_kickoff.controllers.aggregation as aggregation
+import harshithl1777_kickoff.controllers.optimization as optimization
+import harshithl1777_kickoff.controllers.predictions as predictions
+import harshithl1777_kickoff.controllers.records as records
+from harshithl1777_kickoff.models.league import League
+from harshithl1777_kickoff.utils import load
+
+
+def open_league(
+    path: Optional[str] = None,
+    cache: bool = True,
+    division: Optional[str] = None,
+    workers: Optional[int] = None,
+    csv_reader: str = "csv",
+) -> "LeagueHandle":
+    """Load the datasets in the directory at the given path and return a handle to the League of the given
+    division. If path is None, the data directory is chosen as in load.get_data_dir, and if division is None,
+    the default division is used.
+
+    If cache is True, the League is read from and saved to the snapshot of the data directory. The datasets
+    are parsed by the given number of worker processes with the given csv reader, as in load.load_leagues.
+
+    Raises ValueError if the datasets cannot be read, none were found, or the division was not found in them.
+
+    Preconditions:
+        - workers is None or workers > 0
+        - csv_reader in load.CSV_READERS
+    """
+    return LeagueHandle(load.get_data_dir(path), division, cache, workers, csv_reader)
+
+
+class LeagueHandle:
+    """A League loaded from a data directory, and the queries that can be run against it.
+
+    Each query mirrors the CLI command of the same name.
+
+    Instance Attributes:
+        - data_dir: The absolute path of the directory the League was loaded from.
+        - division: The division of the League.
+        - league: The loaded League.
+    """
+
+    data_dir: str
+    division: str
+    league: League
+    _requested_division: Optional[str]
+    _cache: bool
+    _workers: Optional[int]
+    _csv_reader: str
+    _signature: list[tuple[str, int, int]]
+
+    def __init__(
+        self, data_dir: str, division: Optional[str], cache: bool, workers: Optional[int], csv_reader: str
+    ) -> None:
+        self.data_dir = data_dir
+        self._requested_division = division
+        self._cache = cache
+        self._workers = workers
+        self._csv_reader = csv_reader
+        self.reload()
+
+    def reload(self) -> None:
+        """Load the League again from the datasets, picking up any changes to them.
+
+        Raises ValueError if the datasets cannot be read, none were found, or the division was not found in them.
+        """
+        self._signature = load.get_dataset_signature(self.data_dir)
+        try:
+            leagues = load.load_leagues(self.data_dir, self._cache, self._workers, self._csv_reader)
+        except OSError as load_error:
+            raise ValueError(str(load_error)) from load_error
+
+        if len(leagues) == 0:
+            raise ValueError(f"No datasets were found in {self.data_dir}.")
+        division = self._requested_division or load.get_default_division(leagues)
+        if division not in leagues:
+            raise ValueError(f"The given division is not one of {', '.join(sorted(leagues))}.")
+        self.division = division
+        self.league = leagues[division]
+
+    def is_stale(self) -> bool:
+        """Return whether the datasets have changed, or matches have been ingested, since the League was loaded."""
+        return load.get_dataset_signature(self.data_dir) != self._signature
+
+    def ingest(self, file_paths: list[str]) -> list[tuple[str, str, int, int]]:
+        """Add the matches in the given datasets to the League, and return a list of tuples of each division and
+        season in them, the number of matches added and the number skipped, as in load.ingest_datasets.
+
+        Raises ValueError if any of the datasets cannot be read.
+        """
+        try:
+            summary = load.ingest_datasets(file_paths, self.data_dir, self._workers, self._csv_reader)
+        except OSError as ingest_error:
+            raise ValueError(str(ingest_error)) from ingest_error
+        self.reload()
+        return summary
+
+    def seasons(self) -> list[str]:
+        """Return the seasons of the League in chronological order."""
+        return self.league.get_seasons()
+
+    def teams(self, season: Optional[str] = None) -> list[str]:
+        """Return the sorted names of the teams in the League, or only of those that played in the given season."""
+        if season is not None:
+            self._check_season(season)
+        return sorted(self.league.get_team_names(season))
+
+    def winrate(self, team: str, season: Optional[str] = None) -> float:
+        """Return the winrate percentage of the given team, across all seasons or only in the given season."""
+        self._check_team(team, season)
+        return aggregation.overall_winrate(self.league, team, season)
+
+    def averages(self, team: str, season: str) -> list[tuple[str, float, float]]:
+        """Return a list of tuples of each statistic, the given team's average of it in a match of the given
+        season and the average of all teams in that season.
+        """
+        self._check_team(team, season)
+        return aggregation.compare_to_season_averages(self.league, team, season)
+
+    def home_vs_away(self, team: str, season: Optional[str] = None) -> tuple[float, float, float]:
+        """Return the home winrate, away winrate and draw rate percentages of the given team, across all seasons
+        or only in the given season.
+        """
+        self._check_team(team, season)
+        return aggregation.home_vs_away(self.league, team, season)[0]
+
+    def winrates(self, season: Optional[str] = None, topx: int = 4) -> list[tuple[str, float]]:
+        """Return the topx teams with the highest winrate percentage, with their winrates."""
+        self._check_query(season, topx)
+        return records.highest_win_rate(self.league, season, topx)
+
+    def streaks(self, season: Optional[str] = None, topx: int = 4, kind: str = "win") -> list[tuple[str, int]]:
+        """Return the topx teams with the longest streaks of the given kind, one of records.STREAK_KINDS, in the
+        given season or across all seasons, with their streak lengths.
+        """
+        self._check_query(season, topx)
+        if kind not in records.STREAK_KINDS:
+            raise ValueError(f"The given streak kind is not one of {', '.join(records.STREAK_KINDS)}.")
+        return records.highest_win_streaks(self.league, season, topx, kind)
+
+    def comebacks(self, season: Optional[str] = None, topx: int = 4) -> list[tuple[str, str, str, int]]:
+        """Return the topx best comebacks, with each team and season, its half-time and full-time scores and the
+        number of goals it scored in the second half.
+        """
+        self._check_query(season, topx)
+        return records.best_comebacks(self.league, season, topx)
+
+    def goals(self, season: Optional[str] = None, topx: int = 4) -> list[tuple[str, int]]:
+        """Return the topx most goals scored by a team in a single match, with each team."""
+        self._check_query(season, topx)
+        return records.most_goals_scored(self.league, season, topx)
+
+    def fairplay(self, season: Optional[str] = None, topx: int = 4) -> list[tuple[str, float]]:
+        """Return the topx teams with the fewest offenses per match, with their ratios."""
+        self._check_query(season, topx)
+        return records.most_fairplay(self.league, season, topx)
+
+    def improvement(
+        self, season: str, topx: int = 4, skew: int = records.IMPROVEMENT_SKEW
+    ) -> list[tuple[str, float, float, float]]:
+        """Return the topx most improved teams in the given season, with their lowest winrates after their first
+        skew matches, their final winrates and the improvement between them.
+        """
+        self._check_query(season, topx, 20)
+        if skew < 0:
+            raise ValueError("The skew should be greater than or equal to 0")
+        matchday_count = records.get_matchday_count(self.league, season)
+        if skew >= matchday_count - 1:
+            raise ValueError(
+                f"The skew should be less than {matchday_count - 1}, as teams played at most {matchday_count} "
+                f"matches in the {season} season."
+            )
+        return records.most_improved_teams(self.league, season, topx, skew)
+
+    def progressions(self, season: str) -> dict[str, list[float]]:
+        """Return a mapping from each team that played in the given season to its winrate after each of its
+        matches of the season.
+        """
+        self._check_season(season)
+        team_names, progressions = records.get_winrate_progressions(self.league, season)
+        return {
+            team_name: [winrate for winrate in progression if not math.isnan(winrate)]
+            for team_name, progression in zip(team_names, progressions.tolist())
+        }
+
+    def optimal_fouls(self, team: Optional[str] = None, topx: int = 4) -> list[tuple[str, int, float]]:
+        """Return the topx foul ranges in which the most matches were won, for all teams or only the given team,
+        with the number of wins and the percentage of all matches won in each.
+        """
+        self._check_query(None, topx)
+        if team is not None:
+            self._check_team(team)
+        return optimization.calculate_optimal_fouls(self.league, team, topx)
+
+    def optimal_yellow_cards(self, team: Optional[str] = None, topx: int = 4) -> list[tuple[str, int, float]]:
+        """Return the topx yellow card ranges in which the most matches were won, for all teams or only the
+        given team, with the number of wins and the percentage of all matches won in each.
+        """
+        self._check_query(None, topx)
+        if team is not None:
+            self._check_team(team)
+        return optimization.calculate_optimal_yellow_cards(self.league, team, topx)
+
+    def optimal_stat(
+        self, name: str, width: int = 1, team: Optional[str] = None, topx: int = 4
+    ) -> list[tuple[str, int, int, float, float, float]]:
+        """Return the topx ranges of width values of the given match statistic in which the most games were won,
+        for all teams or only the given team, with the number of games and wins and the win, draw and loss
+        percentage of each.
+        """
+        if name not in optimization.BINNED_STATISTICS:
+            raise ValueError(f"The given statistic is not one of {', '.join(optimization.BINNED_STATISTICS)}.")
+        if width < 1:
+            raise ValueError("The width should be greater than 0")
+        self._check_query(None, topx)
+        if team is not None:
+            self._check_team(team)
+        return optimization.calculate_optimal_stat(self.league, name, width, team, topx)
+
+    def optimal_referees(self, team: str, topx: int = 4) -> list[tuple[str, int, int, float]]:
+        """Return the topx referees under whom the given team has the highest win percentage, with the number
+        of wins, the number of games refereed and the win percentage of each.
+        """
+        self._check_query(None, topx)
+        self._check_team(team)
+        return optimization.calculate_optimal_referees(self.league, team, topx)
+
+    def fairest_referees(self, topx: int = 4) -> list[tuple[str, int, float]]:
+        """Return the topx referees with the smallest average discrepancy between the overall winrates of the
+        teams they refereed and their winrates under them, with the number of games refereed and the discrepancy
+        of each.
+        """
+        self._check_query(None, topx)
+        fairest_referees = optimization.calculate_fairest_referees(self.league, topx)
+        return [(referee, games, float(discrepancy)) for referee, games, discrepancy in fairest_referees]
+
+    def referee_record(
+        self, team: str, season: Optional[str] = None
+    ) -> list[tuple[str, int, int, int, int, float, float, float]]:
+        """Return the record of the given team under each referee of its matches, in every season or only the
+        given one, with the number of games, wins, draws and losses, the win percentage and the average fouls
+        and card offenses per game of each.
+        """
+        self._check_team(team, season)
+        return optimization.calculate_referee_record(self.league, team, season)
+
+    def predict(self, home: str, away: str, season: str) -> float:
+        """Return the predicted goal difference of a match between the given home and away teams, based on the
+        given season. The prediction is negative if the home team is predicted to lose.
+        """
+        if home == away:
+            raise ValueError("Home and away teams cannot be the same.")
+        self._check_team(home, season)
+        self._check_team(away, season)
+        return float(predictions.predict(home, away, season, self.league))
+
+    def _check_season(self, season: str) -> None:
+        """Raise ValueError if the given season is not in the League."""
+        seasons = self.league.get_seasons()
+        if season not in seasons:
+            raise ValueError(f"The given season is not in the format '20XX-XX' between {seasons[0]} and {seasons[-1]}.")
+
+    def _check_team(self, team: str, season: Optional[str] = None) -> None:
+        """Raise ValueError if the given team is not in the League, or did not play in the given season."""
+        if season is not None:
+            self._check_season(season)
+        if not self.league.team_in_league(team):
+            raise ValueError("The given team is not a valid team.")
+        if season is not None and season not in self.league.get_team(team).seasons:
+            raise ValueError("This team did not play a match in the given season.")
+
+    def _check_query(self, season: Optional[str], topx: int, topx_max: Optional[int] = None) -> None:
+        """Raise ValueError if the given season is not in the League, or topx is out of range."""
+        if season is not None:
+            self._check_season(season)
+        if topx_max is not None and not 0 < topx <= topx_max:
+            raise ValueError(f"The top x value should be greater than 0 and less than {topx_max}")
+        if not 0 < topx:
+            raise ValueError("The top x value should be greater than 0")
@@ -0,0 +1,114 @@
+"""Kickoff Project: cmd / batch.py
+
+This module runs many commands in a single process against one loaded League, and reports the output of each
+as a line of JSON.
+
+Each line of a batch is either a command as it would be typed after kickoff, e.g. 'records winrates --topx 5',
+or a line of JSON holding a list of arguments, or an object with an 'args' list or a 'command' string and an
+optional 'id' that is copied to its result. Blank lines and lines starting with '#' are ignored.
+
+This file is Copyright (c) 2023 Ram Raghav Sharma, Harshith Latchupatula, Vikram Makkar and Muhammad Ibrahim.
+"""
+import json
+import shlex
+from contextlib import redirect_stderr, redirect_stdout
+from io import StringIO
+from typing import Any, Iterable, Iterator, Optional
+
+import typer
+
+import harshithl1777_kickoff.cmd.output as io
+from harshithl1777_kickoff.cmd.client import get_command
+
+# commands that cannot be run from a batch
+EXCLUDED_COMMANDS = {"batch", "serve"}
+
+# commands that change the datasets, after which earlier outputs cannot be reused
+MODIFYING_COMMANDS = {"ingest", "cache"}
+
+
+def run_batch(app: typer.Typer, lines: Iterable[str], global_args: list[str]) -> Iterator[dict[str, Any]]:
+    """Run the command on each of the given lines of a batch with the given app, and yield the result of each
+    in order. The given global options are passed to every command, before any options on its line.
+
+    Each result holds the line number of the command, its id if given, its arguments, a status of 'ok' or
+    'error', its outputs as recorded by io.capture and, if it failed, an error message. Commands with the same
+    arguments are only run once, and later occurrences reuse the outputs of the first unless the datasets
+    were modified in between.
+    """
+    outputs_by_args = {}
+    for line_number, line in enumerate(lines, start=1):
+        if not line.strip() or line.lstrip().startswith("#"):
+            continue
+
+        result = {"line": line_number}
+        try:
+            command_id, args = parse_command(line)
+        except ValueError as parse_error:
+            yield {**result, "status": "error", "outputs": [], "error": str(parse_error)}
+            continue
+
+        if command_id is not None:
+            result["id"] = command_id
+        result["args"] = args
+        command_name = get_command(args)[:1]
+        if EXCLUDED_COMMANDS.intersection(command_name):
+            yield {**result, "status": "error", "outputs": [], "error": "This command cannot be run in a batch."}
+            continue
+
+        if MODIFYING_COMMANDS.intersection(command_name):
+            outputs_by_args.clear()
+        if tuple(args) not in outputs_by_args:
+            outputs_by_args[tuple(args)] = _run_command(app, global_args + args)
+        yield {**result, **outputs_by_args[tuple(args)]}
+
+
+def parse_command(line: str) -> tuple[Optional[Any], list[str]]:
+    """Return the id and the arguments of the command on the given line of a batch. The id is None if the line
+    does not give one, and a leading 'kickoff' is dropped from the arguments.
+
+    Raises ValueError if the line is not a valid command.
+    """
+    command_id = None
+    if line.lstrip().startswith(("[", "{")):
+        command = json.loads(line)
+        if isinstance(command, dict):
+            command_id = command.get("id")
+            command = command.get("args", command.get("command"))
+        if isinstance(command, str):
+            command = shlex.split(command)
+        if not isinstance(command, list) or not all(isinstance(arg, str) for arg in command):
+            raise ValueError("The command must be a list of arguments or a string.")
+        args = command
+    else:
+        args = shlex.split(line)
+
+    if args and args[0] == "kickoff":
+        args = args[1:]
+    if not args:
+        raise ValueError("The line does not contain a command.")
+    return command_id, args
+
+
+def _run_command(app: typer.Typer, args: list[str]) -> dict[str, Any]:
+    """Run the command with the given arguments and return its status, outputs and error message, if any."""
+    outputs = []
+    stderr = StringIO()
+    status = 0
+    with redirect_stdout(StringIO()), redirect_stderr(stderr), io.capture(outputs):
+        try:
+            status = app(args=args, prog_name="kickoff", standalone_mode=False) or 0
+        except typer.TyperException as usage_error:
+            stderr.write(usage_error.format_message())
+            status = getattr(usage_error, "exit_code", 1)
+        except Exception as command_error:
+            stderr.write(f"{type(command_error).__name__}: {command_error}")
+            status = 1
+
+    errors = [output["message"] for output in outputs if output["type"] == "error"]
+    if stderr.getvalue().strip():
+        errors.append(stderr.getvalue().strip())
+    outputs = [output for output in outputs if output["type"] != "error"]
+    if status != 0 or errors:
+        return {"status": "error", "outputs": outputs, "error": "\n".join(errors) or f"Exited with status {status}."}
+    return {"status": "ok", "outputs": outputs}
@@ -0,0 +1,85 @@
+"""Kickoff Project: cmd / client.py
+
+This module forwards commands to a running Kickoff server, so that they are answered by a process that already
+has the League loaded instead of importing Kickoff and loading the datasets again.
+
+It only uses the standard library, as it runs before the rest of Kickoff is imported.
+
+This file is Copyright (c) 2023 Ram Raghav Sharma, Harshith Latchupatula, Vikram Makkar and Muhammad Ibrahim.
+"""
+import json
+import os
+import shutil
+import socket
+import sys
+from typing import Optional
+
+from harshithl1777_kickoff.utils.paths import get_socket_path
+
+# commands that are always run locally, as they manage the server, the datasets or the cache themselves,
+# or read from standard input
+LOCAL_COMMANDS = {"serve", "ingest", "bench", "cache", "batch"}
+
+# arguments that are always run locally, as their output does not depend on the League
+LOCAL_ARGUMENTS = {"--help", "--install-completion", "--show-completion"}
+
+# subcommands of the local commands that are still forwarded, as they report on the process answering commands
+FORWARDED_SUBCOMMANDS = {("cache", "memo")}
+
+# the global options given before the command name, which each take a value
+GLOBAL_OPTIONS = {"--data-dir", "--division", "--workers", "--csv-reader", "--format"}
+
+# number of seconds to wait for a server to accept a command before running it locally
+CONNECT_TIMEOUT = 0.5
+
+
+def forward(args: list[str]) -> Optional[int]:
+    """Send the given command line arguments to the running server, print its output and return its exit code.
+    Return None if the command should be run locally, because it cannot be forwarded, no server is running,
+    or $KICKOFF_NO_SERVER is set.
+    """
+    if os.environ.get("KICKOFF_NO_SERVER") or not hasattr(socket, "AF_UNIX"):
+        return None
+    command = get_command(args)
+    if not command or LOCAL_ARGUMENTS.intersection(args):
+        return None
+    if command[0] in LOCAL_COMMANDS and tuple(command) not in FORWARDED_SUBCOMMANDS:
+        return None
+
+    request = {
+        "args": args,
+        "cwd": os.getcwd(),
+        "env": {name: value for name, value in os.environ.items() if name.startswith("KICKOFF_")},
+        "width": shutil.get_terminal_size().columns,
+        "terminal": sys.stdout.isatty(),
+    }
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as connection:
+            connection.settimeout(CONNECT_TIMEOUT)
+            connection.connect(get_socket_path())
+            connection.settimeout(None)
+            connection.sendall(json.dumps(request).encode() + b"\n")
+            response = json.loads(connection.makefile("rb").readline())
+    except (OSError, ValueError):
+        return None
+
+    sys.stdout.write(response["stdout"])
+    sys.stderr.write(response["stderr"])
+    return response["status"]
+
+
+def get_command(args: list[str]) -> list[str]:
+    """Return the command name and subcommand name in the given command line arguments, which are their first two
+    positional arguments once the global options and their values are skipped. Any options or arguments of the
+    command itself come after these names, so they never decide where the command runs.
+    """
+    command = []
+    i = 0
+    while i < len(args) and len(command) < 2:
+        if args[i] in GLOBAL_OPTIONS:
+            i += 2
+            continue
+        if not args[i].startswith("-"):
+            command.append(args[i])
+        i += 1
+    return command
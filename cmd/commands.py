@@ -6,37 +6,88 @@ to other functions / classes.
 
 This file is Copyright (c) 2023 Ram Raghav Sharma, Harshith Latchupatula, Vikram Makkar and Muhammad Ibrahim.
 """
+import contextlib
+import sys
 from typing import Optional
 import harshithl1777_kickoff.cmd.output as io
 import harshithl1777_kickoff.cmd.validation as validate
-from rich.progress import Progress, SpinnerColumn, TextColumn
+import harshithl1777_kickoff.cmd.batch as batches
+from harshithl1777_kickoff.cmd.context import (
+    configure,
+    get_csv_reader,
+    get_data_dir,
+    get_division_name,
+    get_global_args,
+    get_league,
+    get_workers,
+    reload_league,
+)
 import typer
 
 from harshithl1777_kickoff.utils.constants import Constants
-from harshithl1777_kickoff.utils.load import load_csv_files
 import harshithl1777_kickoff.controllers.aggregation as aggregation
 import harshithl1777_kickoff.controllers.records as crecords
 import harshithl1777_kickoff.controllers.optimization as optimization
 import harshithl1777_kickoff.controllers.predictions as predictions
+import harshithl1777_kickoff.utils.benchmarks as benchmarks
+import harshithl1777_kickoff.utils.snapshot as snapshot
+import harshithl1777_kickoff.utils.load as load
+from harshithl1777_kickoff.utils.memo import clear_memos, get_memo_stats
+from harshithl1777_kickoff.utils.paths import get_socket_path
 
-league = load_csv_files()
 aggregate = typer.Typer(help=Constants().retrieve("AGGREGATE_COMMAND_INTRO"))
 records = typer.Typer(help=Constants().retrieve("RECORDS_COMMAND_INTRO"))
 optimal = typer.Typer(help=Constants().retrieve("OPTIMAL_COMMAND_INTRO"))
+bench = typer.Typer(help=Constants().retrieve("BENCH_COMMAND_INTRO"))
+cache = typer.Typer(help=Constants().retrieve("CACHE_COMMAND_INTRO"))
+
+# the title of the table of each kind of streak
+STREAK_TITLES = {
+    "win": "Highest Win Streaks",
+    "unbeaten": "Longest Unbeaten Streaks",
+    "loss": "Longest Losing Streaks",
+    "scoring": "Longest Scoring Streaks",
+}
 
 app = typer.Typer(help=Constants().retrieve("HELP_COMMAND_INTRO"))
 app.add_typer(aggregate, name="aggregate")
 app.add_typer(records, name="records")
 app.add_typer(optimal, name="optimal")
+app.add_typer(bench, name="bench")
+app.add_typer(cache, name="cache")
+
+
+@app.callback()
+def main(
+    data_dir: Optional[str] = typer.Option(
+        default=None, help="Directory of datasets to load. Defaults to $KICKOFF_DATA_DIR or the bundled datasets"
+    ),
+    division: Optional[str] = typer.Option(default=None, help="Division to analyze, ex. E0"),
+    workers: Optional[int] = typer.Option(
+        default=None, min=1, help="Number of processes used to parse datasets. Defaults to one per CPU"
+    ),
+    csv_reader: str = typer.Option(default="csv", help="Reader used to parse csv datasets, csv or pandas"),
+    output_format: str = typer.Option(
+        "table", "--format", help="Output format, one of table, json, ndjson or csv. Only table uses colors"
+    ),
+) -> None:
+    """Configures the datasets and division that every command loads, and the format of its output."""
+    validate.validate_format(output_format)
+    io.set_format(output_format)
+    validate.validate_csv_reader(csv_reader)
+    configure(data_dir, division, workers, csv_reader)
 
 
 @app.command()
 def teams() -> None:
     """Outputs the list of teams available in our datasets"""
+    league = get_league()
     lteams = sorted(league.get_team_names())
+    lteams += [""] * (-len(lteams) % 4)
     grouped_teams = [(lteams[i], lteams[i + 1], lteams[i + 2], lteams[i + 3]) for i in range(0, len(lteams), 4)]
+    seasons = league.get_seasons()
     io.table(
-        title="List of Teams in the 2009-10 to 2018-19 Premier League Seasons",
+        title=f"List of Teams in the {seasons[0]} to {seasons[-1]} Seasons",
         headers=["Group 1", "Group 2", "Group 3", "Group 4"],
         colors=["cyan", "magenta", "yellow", "green"],
         data=grouped_teams,
@@ -44,6 +95,64 @@ def teams() -> None:
     )
 
 
+@app.command()
+def ingest(files: list[str] = typer.Argument(..., help="Datasets of new matches to add")) -> None:
+    """Adds the matches in the given datasets to the league without rebuilding it from every dataset.
+    Matches that are already in the league are skipped, and the new matches are kept across runs.
+    """
+    with io.progress("Ingesting datasets..."):
+        try:
+            summary = load.ingest_datasets(files, get_data_dir(), get_workers(), get_csv_reader())
+        except (OSError, ValueError) as ingest_error:
+            io.error(str(ingest_error))
+    reload_league()
+
+    io.table(
+        title="Ingested Matches",
+        headers=["Division", "Season", "Added", "Skipped"],
+        colors=["cyan", "magenta", "yellow", "green"],
+        data=summary,
+        width=80,
+    )
+
+
+@app.command()
+def serve(
+    socket_path: Optional[str] = typer.Option(
+        None, "--socket", help="Unix socket to listen on. Defaults to $KICKOFF_SOCKET or kickoff.sock in the cache"
+    ),
+) -> None:
+    """Keeps the league loaded and answers the commands of every other kickoff process until interrupted.
+    While a server is running, kickoff forwards commands to it instead of loading the datasets itself.
+    """
+    from harshithl1777_kickoff.cmd import server
+
+    socket_path = socket_path or get_socket_path()
+    if server.is_server_running(socket_path):
+        io.error(f"A server is already running on {socket_path}.")
+
+    get_league()
+    io.info(message=f"Serving on [cyan]{socket_path}[/cyan]. Press Ctrl+C to stop.", color="white")
+    server.serve(app, socket_path)
+
+
+@app.command()
+def batch(file: str = typer.Argument(..., help="File of commands, one per line, or - for standard input")) -> None:
+    """Runs every command in the given file against a single loaded league, and outputs the result of each
+    as a line of JSON in the same order, or as a csv row in the csv format. Each line of the file is either a command as it would be typed
+    after kickoff, or a line of JSON holding a list of arguments or an object with an args list.
+    """
+    try:
+        lines = contextlib.nullcontext(sys.stdin) if file == "-" else open(file, encoding="utf-8")
+    except OSError as file_error:
+        io.error(str(file_error))
+
+    with lines as commands:
+        # the commands are run with the same format as the batch, so that the callback of each of them keeps it
+        for result in batches.run_batch(app, commands, get_global_args() + ["--format", io.get_format()]):
+            io.record_line(result)
+
+
 @aggregate.command()
 def winrate(
     team: str = typer.Option(...), season: Optional[str] = typer.Option(default=None, help="ex. 2009-10")
@@ -52,22 +161,24 @@ def winrate(
     If season is specified, the winrate will be calculated only for the given season.
 
     Preconditions
-        - season is in the format '20XX-XX' between 2009-10 and 2018-19
+        - season in league.get_seasons()
         - league.team_in_league(team)
         - season is None or team in league.get_team_names(season)
     """
-    validate.validate_team(league, team)
     if season is not None:
         validate.validate_season(season)
-        validate.validate_team_in_season(league, team, season)
-
-    with Progress(SpinnerColumn(), TextColumn("[progress.description]{task.description}"), transient=True) as progress:
-        progress.add_task("Compiling results...")
+    validate.validate_team(team)
+    if season is not None:
+        validate.validate_team_in_season(team, season)
 
+    league = get_league()
+    with io.progress("Compiling results..."):
         winrate_percent = round(aggregation.overall_winrate(league, team, season), 2)
 
         if season is None:
-            display_str = f"[yellow]{team}'s[/yellow] winrate across all Premier League seasons is {winrate_percent}%."
+            display_str = (
+                f"[yellow]{team}'s[/yellow] winrate across all {get_division_name()} seasons is {winrate_percent}%."
+            )
         else:
             display_str = (
                 f"[yellow]{team}'s[/yellow] winrate in the [magenta]{season}[/magenta] season is {winrate_percent}%."
@@ -81,38 +192,19 @@ def averages(team: str = typer.Option(...), season: str = typer.Option(..., help
     """Outputs various team statistics compared to the overall league statistics for the specified season.
 
     Preconditions:
-        - season is in the format '20XX-XX' between 2009-10 and 2018-19
+        - season in league.get_seasons()
         - team in league.get_team_names(season)
     """
-    validate.validate_team(league, team)
     validate.validate_season(season)
-    validate.validate_team_in_season(league, team, season)
-
-    with Progress(SpinnerColumn(), TextColumn("[progress.description]{task.description}"), transient=True) as progress:
-        progress.add_task("Compiling results...")
+    validate.validate_team(team)
+    validate.validate_team_in_season(team, season)
 
+    league = get_league()
+    with io.progress("Compiling results..."):
         updated_data = []
         average_data = [
-            [
-                "Average Goals Scored / Game",
-                round(aggregation.get_team_goals_scored(league, team, season), 2),
-                round(aggregation.get_season_goals_scored(league, season), 2),
-            ],
-            [
-                "Average Shot Accuracy (%)",
-                round(aggregation.get_team_shot_accuracy(league, team, season), 2),
-                round(aggregation.get_season_shot_accuracy(league, season), 2),
-            ],
-            [
-                "Average Fouls Committed / Game",
-                round(aggregation.get_team_fouls(league, team, season), 2),
-                round(aggregation.get_season_fouls(league, season), 2),
-            ],
-            [
-                "Average Card Offenses / Game",
-                round(aggregation.get_team_cards(league, team, season), 2),
-                round(aggregation.get_season_cards(league, season), 2),
-            ],
+            (statistic, round(team_average, 2), round(season_average, 2))
+            for statistic, team_average, season_average in aggregation.compare_to_season_averages(league, team, season)
         ]
 
         for row in average_data:
@@ -121,7 +213,7 @@ def averages(team: str = typer.Option(...), season: str = typer.Option(..., help
             else:
                 updated_data.append((row[0], row[1], row[2], round(row[1] - row[2], 2)))
 
-        title = f"{team} Statistics Compared to League Averages in the {season} Premier League Season"
+        title = f"{team} Statistics Compared to League Averages in the {season} {get_division_name()} Season"
     io.table(
         title=title,
         headers=["Statistic", f"{team}", "League", "Difference"],
@@ -141,25 +233,24 @@ def homevsaway(
     If season is specified, winrates will be calculated only for the given season.
 
     Preconditions:
-        - season is in the format '20XX-XX' between 2009-10 and 2018-19 or season is None
+        - season is None or season in league.get_seasons()
         - team is None or league.team_in_league(team)
         - (season is None or team is None) or team in league.get_team_names(season)
     """
     if season is not None:
         validate.validate_season(season)
     if team is not None:
-        validate.validate_team(league, team)
+        validate.validate_team(team)
     if team is not None and season is not None:
-        validate.validate_team_in_season(league, team, season)
-
-    with Progress(SpinnerColumn(), TextColumn("[progress.description]{task.description}"), transient=True) as progress:
-        progress.add_task("Compiling results...")
+        validate.validate_team_in_season(team, season)
 
+    league = get_league()
+    with io.progress("Compiling results..."):
         home_vs_away = aggregation.home_vs_away(league, team, season)
         if season is not None:
-            title = f"Home vs Away Winrates for {team} in the {season} Premier League Season"
+            title = f"Home vs Away Winrates for {team} in the {season} {get_division_name()} Season"
         else:
-            title = f"Home vs Away Winrates for {team} in the Premier League"
+            title = f"Home vs Away Winrates for {team} in the {get_division_name()}"
 
     io.table(
         title=title,
@@ -179,44 +270,52 @@ def winrates(
     If season is specified, winrates will be calculated only for the given season.
 
     Preconditions:
-        - season is in the format '20XX-XX' between 2009-10 and 2018-19 or season is None
+        - season is None or season in league.get_seasons()
         - topx > 0
     """
     if season is not None:
         validate.validate_season(season)
     validate.validate_topx(topx)
 
-    with Progress(SpinnerColumn(), TextColumn("[progress.description]{task.description}"), transient=True) as progress:
-        progress.add_task("Compiling results...")
+    league = get_league()
+    with io.progress("Compiling results..."):
         top_win_rates = crecords.highest_win_rate(league, season, topx)
 
         if season is None:
-            title = "Highest Win Rates in the Premier League"
+            title = f"Highest Win Rates in the {get_division_name()}"
         else:
-            title = f"Top {len(top_win_rates)} Highest Win Rates in the {season} Premier League Season"
+            title = f"Top {len(top_win_rates)} Highest Win Rates in the {season} {get_division_name()} Season"
 
     io.table(title=title, headers=["Team", "Winrate (%)"], colors=["cyan", "yellow"], data=top_win_rates, width=100)
 
 
 @records.command()
 def streaks(
-    season: str = typer.Option(..., help="ex. 2009-10"),
+    season: str = typer.Option(default=None, help="ex. 2009-10"),
     topx: int = typer.Option(default=4, help="Enter the top x values to output"),
+    kind: str = typer.Option(default="win", help="The kind of streak: win, unbeaten, loss or scoring"),
 ) -> None:
-    """Outputs the topx longest win streaks for the specified season.
+    """Outputs the topx longest streaks of the given kind for the specified season.
+    If no season is specified, streaks are counted across every season.
 
     Preconditions:
-        - season is in the format '20XX-XX' between 2009-10 and 2018-19
+        - season is None or season in league.get_seasons()
     """
     validate.validate_season(season)
     validate.validate_topx(topx)
+    validate.validate_streak_kind(kind)
 
-    with Progress(SpinnerColumn(), TextColumn("[progress.description]{task.description}"), transient=True) as progress:
-        progress.add_task("Compiling results...")
+    league = get_league()
+    with io.progress("Compiling results..."):
+        highest_streaks = crecords.highest_win_streaks(league, season, topx, kind)
 
-        highest_streaks = crecords.highest_win_streaks(league, season, topx)
+    streak_name = STREAK_TITLES[kind]
+    if season is None:
+        title = f"Top {len(highest_streaks)} {streak_name} in the {get_division_name()}"
+    else:
+        title = f"Top {len(highest_streaks)} {streak_name} in the {season} {get_division_name()}"
     io.table(
-        title=f"Top {len(highest_streaks)} Highest Win Streaks in the {season} Premier League",
+        title=title,
         headers=["Team", "Streak Length"],
         colors=["cyan", "magenta"],
         data=highest_streaks,
@@ -233,22 +332,21 @@ def comebacks(
     If season is specified, comebacks will be calculated only for the given season.
 
     Preconditions
-        - season is in the format '20XX-XX' between 2009-10 and 2018-19 or season is None
+        - season is None or season in league.get_seasons()
         - topx > 0
     """
     if season is not None:
         validate.validate_season(season)
     validate.validate_topx(topx)
 
-    with Progress(SpinnerColumn(), TextColumn("[progress.description]{task.description}"), transient=True) as progress:
-        progress.add_task("Compiling results...")
-
+    league = get_league()
+    with io.progress("Compiling results..."):
         best_comebacks = crecords.best_comebacks(league, season, topx)
 
         if season is None:
-            title = f"Top {len(best_comebacks)} Best Comebacks Teams in the Premier League"
+            title = f"Top {len(best_comebacks)} Best Comebacks Teams in the {get_division_name()}"
         else:
-            title = f"Top {len(best_comebacks)} Best Comebacks Teams in the {season} Premier League Season"
+            title = f"Top {len(best_comebacks)} Best Comebacks Teams in the {season} {get_division_name()} Season"
 
     io.table(
         title=title,
@@ -268,21 +366,20 @@ def goals(
     If season is specified, the highest goals will be calculated only for the given season.
 
     Preconditions
-        - season is in the format '20XX-XX' between 2009-10 and 2018-19 or season is None
+        - season is None or season in league.get_seasons()
         - topx > 0
     """
     if season is not None:
         validate.validate_season(season)
     validate.validate_topx(topx)
 
-    with Progress(SpinnerColumn(), TextColumn("[progress.description]{task.description}"), transient=True) as progress:
-        progress.add_task("Compiling results...")
-
+    league = get_league()
+    with io.progress("Compiling results..."):
         most_goals = crecords.most_goals_scored(league, season, topx)
         if season is None:
-            title = f"Top {len(most_goals)} Most Goals Scored Games in the Premier League"
+            title = f"Top {len(most_goals)} Most Goals Scored Games in the {get_division_name()}"
         else:
-            title = f"Top {len(most_goals)} Most Goals Scored Games in the {season} Premier League Season"
+            title = f"Top {len(most_goals)} Most Goals Scored Games in the {season} {get_division_name()} Season"
     io.table(
         title=title, headers=["Team", "Most Goals In a Game"], colors=["cyan", "magenta"], data=most_goals, width=90
     )
@@ -297,22 +394,21 @@ def fairplay(
     If season is specified, fairplay will be calculated only for the given season.
 
     Preconditions
-        - season is in the format '20XX-XX' between 2009-10 and 2018-19 or season is None
+        - season is None or season in league.get_seasons()
         - topx > 0
     """
     if season is not None:
         validate.validate_season(season)
     validate.validate_topx(topx)
 
-    with Progress(SpinnerColumn(), TextColumn("[progress.description]{task.description}"), transient=True) as progress:
-        progress.add_task("Compiling results...")
-
+    league = get_league()
+    with io.progress("Compiling results..."):
         most_fairplay = crecords.most_fairplay(league, season, topx)
 
         if season is None:
-            title = f"Top {len(most_fairplay)} Most Fairplay Teams in the Premier League"
+            title = f"Top {len(most_fairplay)} Most Fairplay Teams in the {get_division_name()}"
         else:
-            title = f"Top {len(most_fairplay)} Most fairplay teams in the {season} Premier League Season"
+            title = f"Top {len(most_fairplay)} Most fairplay teams in the {season} {get_division_name()} Season"
 
     io.table(
         title=title,
@@ -327,21 +423,26 @@ def fairplay(
 def improvement(
     season: str = typer.Option(..., help="ex. 2009-10"),
     topx: int = typer.Option(default=4, help="Enter the top x values to output"),
+    skew: int = typer.Option(
+        default=crecords.IMPROVEMENT_SKEW, min=0, help="Enter the number of early matches to ignore for lowest winrates"
+    ),
 ) -> None:
-    """Output the topx most improved teams in the given season.
+    """Output the topx most improved teams in the given season. Each team's lowest winrate is taken after its
+    first skew matches, as winrates early in a season swing widely.
 
     Preconditions
-        - season is in the format '20XX-XX' between 2009-10 and 2018-19
+        - season in league.get_seasons()
         - 0 < topx <= 20
+        - 0 <= skew < get_matchday_count(league, season) - 1
     """
     validate.validate_season(season)
     validate.validate_topx(topx, 20)
+    validate.validate_skew(skew, season)
 
-    with Progress(SpinnerColumn(), TextColumn("[progress.description]{task.description}"), transient=True) as progress:
-        progress.add_task("Compiling results...")
-
-        most_improved = crecords.most_improved_teams(league, season, topx)
-        title = f"Top {len(most_improved)} Most Improved Teams in the {season} Premier League Season"
+    league = get_league()
+    with io.progress("Compiling results..."):
+        most_improved = crecords.most_improved_teams(league, season, topx, skew)
+        title = f"Top {len(most_improved)} Most Improved Teams in the {season} {get_division_name()} Season"
 
     io.table(
         title=title,
@@ -365,16 +466,16 @@ def fouls(
         - team is None or league.team_in_league(team)
         - topx > 0
     """
-    if team is not None:
-        validate.validate_team(league, team)
     validate.validate_topx(topx)
+    if team is not None:
+        validate.validate_team(team)
 
-    with Progress(SpinnerColumn(), TextColumn("[progress.description]{task.description}"), transient=True) as progress:
-        progress.add_task("Compiling results...")
+    league = get_league()
+    with io.progress("Compiling results..."):
         optimal_fouls = optimization.calculate_optimal_fouls(league, team, topx)
 
         if team is None:
-            title = f"Top {len(optimal_fouls)} Optimal Foul Ranges for all Premier League Teams"
+            title = f"Top {len(optimal_fouls)} Optimal Foul Ranges for all {get_division_name()} Teams"
         else:
             title = f"Top {len(optimal_fouls)} Optimal Foul Ranges for {team}"
     io.table(
@@ -398,16 +499,16 @@ def yellowcards(
         - team is None or league.team_in_league(team)
         - topx > 0
     """
-    if team is not None:
-        validate.validate_team(league, team)
     validate.validate_topx(topx)
+    if team is not None:
+        validate.validate_team(team)
 
-    with Progress(SpinnerColumn(), TextColumn("[progress.description]{task.description}"), transient=True) as progress:
-        progress.add_task("Compiling results...")
+    league = get_league()
+    with io.progress("Compiling results..."):
         optimal_yellows = optimization.calculate_optimal_yellow_cards(league, team, topx)
 
         if team is None:
-            title = f"Top {len(optimal_yellows)} Optimal Yellow Card Ranges for all Premier League Teams"
+            title = f"Top {len(optimal_yellows)} Optimal Yellow Card Ranges for all {get_division_name()} Teams"
         else:
             title = f"Top {len(optimal_yellows)} Optimal Yellow Card Ranges for {team}"
     io.table(
@@ -419,6 +520,45 @@ def yellowcards(
     )
 
 
+@optimal.command()
+def stat(
+    name: str = typer.Option(..., help="ex. shots"),
+    width: int = typer.Option(default=1, min=1, help="Enter the number of values in each range"),
+    team: str = typer.Option(default=None),
+    topx: int = typer.Option(default=4, help="Enter the top x values to output"),
+) -> None:
+    """Outputs the ranges of the given match statistic in which the most games were won.
+    If team is specified, the ranges will be calculated only for the given team.
+
+    Preconditions
+        - name in BINNED_STATISTICS
+        - width > 0
+        - team is None or league.team_in_league(team)
+        - topx > 0
+    """
+    validate.validate_binned_statistic(name)
+    validate.validate_topx(topx)
+    if team is not None:
+        validate.validate_team(team)
+
+    league = get_league()
+    with io.progress("Compiling results..."):
+        optimal_ranges = optimization.calculate_optimal_stat(league, name, width, team, topx)
+
+        range_name = optimization.BINNED_STATISTICS[name]
+        if team is None:
+            title = f"Top {len(optimal_ranges)} Optimal {range_name} Ranges for all {get_division_name()} Teams"
+        else:
+            title = f"Top {len(optimal_ranges)} Optimal {range_name} Ranges for {team}"
+    io.table(
+        title=title,
+        headers=[f"{range_name} Range", "Games", "Wins", "Win (%)", "Draw (%)", "Loss (%)"],
+        colors=["cyan", "magenta", "green", "green", "yellow", "red"],
+        data=optimal_ranges,
+        width=100,
+    )
+
+
 @optimal.command()
 def referees(
     team: str = typer.Option(...),
@@ -430,14 +570,14 @@ def referees(
         - league.team_in_league(team)
         - topx > 0
     """
-    validate.validate_team(league, team)
     validate.validate_topx(topx)
+    validate.validate_team(team)
 
-    with Progress(SpinnerColumn(), TextColumn("[progress.description]{task.description}"), transient=True) as progress:
-        progress.add_task("Compiling results...")
+    league = get_league()
+    with io.progress("Compiling results..."):
         optimal_referees = optimization.calculate_optimal_referees(league, team, topx)
 
-        title = f"Top {len(optimal_referees)} Optimal Referees for {team} in the Premier League"
+        title = f"Top {len(optimal_referees)} Optimal Referees for {team} in the {get_division_name()}"
     io.table(
         title=title,
         headers=["Referee Name", "Number of Wins Recorded", "Games Refereed", "Win Percentage (%)"],
@@ -458,11 +598,11 @@ def fairestreferees(
     """
     validate.validate_topx(topx)
 
-    with Progress(SpinnerColumn(), TextColumn("[progress.description]{task.description}"), transient=True) as progress:
-        progress.add_task("Compiling results...")
+    league = get_league()
+    with io.progress("Compiling results..."):
         fairest_referees = optimization.calculate_fairest_referees(league, topx)
 
-        title = f"Top {len(fairest_referees)} Fairest Referees for all Premier League Teams"
+        title = f"Top {len(fairest_referees)} Fairest Referees for all {get_division_name()} Teams"
     io.table(
         title=title,
         headers=["Referee Name", "Number of Games Refereed", "Winrate Discrepancy"],
@@ -472,6 +612,41 @@ def fairestreferees(
     )
 
 
+@optimal.command()
+def refereerecord(
+    team: str = typer.Option(...),
+    season: Optional[str] = typer.Option(default=None, help="ex. 2009-10"),
+) -> None:
+    """Outputs the record of the provided team under each referee of its matches.
+    If season is specified, the record will be calculated only for the given season.
+
+    Preconditions
+        - league.team_in_league(team)
+        - season is None or team in league.get_team_names(season)
+    """
+    if season is not None:
+        validate.validate_season(season)
+    validate.validate_team(team)
+    if season is not None:
+        validate.validate_team_in_season(team, season)
+
+    league = get_league()
+    with io.progress("Compiling results..."):
+        referee_record = optimization.calculate_referee_record(league, team, season)
+
+        if season is None:
+            title = f"Record of {team} under each Referee across all {get_division_name()} Seasons"
+        else:
+            title = f"Record of {team} under each Referee in the {season} {get_division_name()} Season"
+    io.table(
+        title=title,
+        headers=["Referee Name", "Games", "Wins", "Draws", "Losses", "Win (%)", "Fouls / Game", "Cards / Game"],
+        colors=["cyan", "magenta", "green", "yellow", "red", "green", "magenta", "yellow"],
+        data=referee_record,
+        width=110,
+    )
+
+
 @app.command()
 def predict(
     home: str = typer.Option(...),
@@ -482,20 +657,20 @@ def predict(
     between the home and away team based on data from the given season.
 
     Preconditions:
-        - season is in the format '20XX-XX' between 2009-10 and 2018-19
+        - season in league.get_seasons()
         - home in league.get_team_names(season)
         - away in league.get_team_names(season)
     """
     if home == away:
         io.error("Home and away teams cannot be the same.")
-    validate.validate_team(league, home)
-    validate.validate_team(league, away)
     validate.validate_season(season)
-    validate.validate_team_in_season(league, home, season)
-    validate.validate_team_in_season(league, away, season)
+    validate.validate_team(home)
+    validate.validate_team(away)
+    validate.validate_team_in_season(home, season)
+    validate.validate_team_in_season(away, season)
 
-    with Progress(SpinnerColumn(), TextColumn("[progress.description]{task.description}"), transient=True) as progress:
-        progress.add_task("Compiling results...")
+    league = get_league()
+    with io.progress("Compiling results..."):
         prediction = round(predictions.predict(home, away, season, league), 2)
 
         prefix = "[yellow]Prediction: [/yellow]"
@@ -511,3 +686,163 @@ def predict(
             )
 
     io.info(message=display_str, color="white")
+
+
+@bench.command()
+def startup(repeat: int = typer.Option(default=5, min=1, help="Enter the number of times to run each stage")) -> None:
+    """Outputs the time taken by each stage of a cold start: importing modules, parsing the datasets
+    and building the graph, along with the total time of a `kickoff --help` invocation.
+
+    Preconditions
+        - repeat > 0
+    """
+    with io.progress("Running benchmarks..."):
+        timings = benchmarks.benchmark_startup(get_data_dir(), repeat, get_workers(), get_csv_reader())
+
+    io.table(
+        title=f"Cold Start Timings over {repeat} Runs",
+        headers=["Stage", "Best (ms)", "Median (ms)"],
+        colors=["cyan", "magenta", "yellow"],
+        data=timings,
+        width=70,
+    )
+
+
+@bench.command()
+def build(repeat: int = typer.Option(default=5, min=1, help="Enter the number of times to build each season")) -> None:
+    """Outputs the time taken to build the graph for each season, before and after extracting whole
+    dataframe columns at once.
+
+    Preconditions
+        - repeat > 0
+    """
+    with io.progress("Running benchmarks..."):
+        timings = benchmarks.benchmark_build(get_data_dir(), repeat)
+
+    io.table(
+        title=f"Graph Build Timings per Season over {repeat} Runs",
+        headers=["Division", "Season", "Cell Indexing (ms)", "Column Extraction (ms)", "Speedup"],
+        colors=["cyan", "cyan", "magenta", "yellow", "green"],
+        data=timings,
+        width=90,
+    )
+
+
+@bench.command()
+def parse(
+    files: list[int] = typer.Option(default=[10, 50, 200], min=1, help="Enter the numbers of season files to parse"),
+    repeat: int = typer.Option(default=3, min=1, help="Enter the number of times to parse the files"),
+) -> None:
+    """Outputs the time taken to parse various numbers of season files serially, with a thread pool
+    and with a process pool. The pools use the number of workers given to kickoff.
+
+    Preconditions
+        - all(count > 0 for count in files)
+        - repeat > 0
+    """
+    with io.progress("Running benchmarks..."):
+        timings = benchmarks.benchmark_parse(files, get_workers(), repeat, get_csv_reader())
+
+    io.table(
+        title=f"Dataset Parsing Timings over {repeat} Runs",
+        headers=["Season Files", "Serial (ms)", "Thread Pool (ms)", "Process Pool (ms)"],
+        colors=["cyan", "magenta", "yellow", "green"],
+        data=timings,
+        width=90,
+    )
+
+
+@bench.command()
+def topk(
+    topx: list[int] = typer.Option(default=[4, 1000], min=1, help="Enter the numbers of items to select"),
+    size: int = typer.Option(default=100000, min=1, help="Enter the number of items to select from"),
+    repeat: int = typer.Option(default=5, min=1, help="Enter the number of times to select the items"),
+) -> None:
+    """Outputs the time taken to select the topx items out of many by sorting all of them, with a heap,
+    and with a partition of a NumPy array.
+
+    Preconditions
+        - all(count > 0 for count in topx)
+        - size > 0
+        - repeat > 0
+    """
+    league = get_league()
+    with io.progress("Running benchmarks..."):
+        timings = benchmarks.benchmark_topk(league, topx, size, repeat)
+
+    io.table(
+        title=f"Top-k Selection Timings over {repeat} Runs",
+        headers=["Top X", "Items", "Full Sort (ms)", "Heap (ms)", "Partition (ms)"],
+        colors=["cyan", "cyan", "magenta", "yellow", "green"],
+        data=timings,
+        width=90,
+    )
+
+
+@bench.command()
+def memory() -> None:
+    """Outputs the memory used by the object graph, the match table and the statistics cube, in total and per match."""
+    with io.progress("Running benchmarks..."):
+        sizes = benchmarks.benchmark_memory(get_data_dir())
+
+    io.table(
+        title="Memory Used by the Loaded Datasets",
+        headers=["Representation", "Matches", "Total (KB)", "Bytes per Match"],
+        colors=["cyan", "magenta", "yellow", "green"],
+        data=sizes,
+        width=90,
+    )
+
+
+@cache.command()
+def status() -> None:
+    """Outputs the location and state of the League snapshot of the data directory.
+    A snapshot is valid if it was built from the current datasets and stale otherwise.
+    """
+    io.table(
+        title="League Snapshot Status",
+        headers=["Property", "Value"],
+        colors=["cyan", "yellow"],
+        data=snapshot.get_snapshot_status(get_data_dir(), load.get_dataset_paths(get_data_dir())),
+        width=100,
+    )
+
+
+@cache.command()
+def clear(
+    ingested: bool = typer.Option(default=False, help="Also delete the journals of ingested matches"),
+) -> None:
+    """Deletes the League snapshots of every data directory so that the next command rebuilds them.
+    If ingested is specified, every match added with the ingest command is discarded as well.
+    """
+    cleared = snapshot.clear_snapshots()
+    message = f"Deleted {cleared} snapshot(s)"
+    if ingested:
+        message += f" and {snapshot.clear_journals()} journal(s)"
+    io.info(message=f"{message} from [cyan]{snapshot.get_cache_dir()}[/cyan].", color="white")
+
+
+@cache.command()
+def memo(
+    reset: bool = typer.Option(default=False, help="Discard the cached query results and reset the counters"),
+) -> None:
+    """Outputs how often the cached result of each query was reused rather than recomputed. The cache lives in
+    the process answering commands, so this reports on the running server, or on the commands before it in a batch.
+    """
+    if reset:
+        clear_memos()
+        io.info(message="Discarded every cached query result.", color="white")
+        return
+
+    stats = get_memo_stats()
+    if len(stats) == 0:
+        io.info(message="No queries have been answered by this process yet.", color="white")
+        return
+
+    io.table(
+        title="Query Result Cache",
+        headers=["Query", "Hits", "Misses", "Cached", "Evictions", "Invalidations"],
+        colors=["cyan", "green", "red", "yellow", "magenta", "blue"],
+        data=stats,
+        width=110,
+    )
@@ -0,0 +1,105 @@
+"""Kickoff Project: cmd / context.py
+
+This module contains the state shared by all commands in a single invocation of the CLI.
+The League is only loaded the first time a command asks for it, so help text, shell completion
+and argument errors never pay for parsing the datasets. A server keeps the League loaded across commands.
+
+This file is Copyright (c) 2023 Ram Raghav Sharma, Harshith Latchupatula, Vikram Makkar and Muhammad Ibrahim.
+"""
+from functools import cache
+from typing import Any, Optional
+
+import harshithl1777_kickoff.cmd.output as io
+from harshithl1777_kickoff.models.league import League
+from harshithl1777_kickoff.utils import load
+from harshithl1777_kickoff.utils.constants import Constants
+
+_settings: dict[str, Any] = {"data_dir": None, "division": None, "workers": None, "csv_reader": "csv"}
+
+# the dataset signature of the data directory and the division of the League when it was last loaded
+_loaded: dict[str, Any] = {"signature": None, "division": None}
+
+
+def configure(
+    data_dir: Optional[str] = None,
+    division: Optional[str] = None,
+    workers: Optional[int] = None,
+    csv_reader: str = "csv",
+) -> None:
+    """Set the data directory and the division that commands load the League from, and the number of workers
+    and the reader used to parse the datasets. A value of None means the default data directory, division
+    or workers.
+
+    Preconditions:
+        - csv_reader in load.CSV_READERS
+    """
+    settings = {"data_dir": data_dir, "division": division, "workers": workers, "csv_reader": csv_reader}
+    if settings != _settings:
+        _settings.update(settings)
+        reload_league()
+
+
+def reload_league() -> None:
+    """Discard the loaded League, so that the next command to ask for it loads it again."""
+    get_league.cache_clear()
+
+
+def is_league_stale() -> bool:
+    """Return whether the datasets have changed, or matches have been ingested, since the League was loaded.
+    This lets a long-running process such as the server pick up new data.
+    """
+    if get_league.cache_info().currsize == 0:
+        return False
+    return load.get_dataset_signature(get_data_dir()) != _loaded["signature"]
+
+
+def get_global_args() -> list[str]:
+    """Return the global command line options that configure a command the same way as the current settings."""
+    args = []
+    for name, value in _settings.items():
+        if value is not None:
+            args += ["--" + name.replace("_", "-"), str(value)]
+    return args
+
+
+def get_data_dir() -> str:
+    """Return the absolute path of the data directory that commands load the League from."""
+    return load.get_data_dir(_settings["data_dir"])
+
+
+def get_workers() -> Optional[int]:
+    """Return the number of workers used to parse the datasets, or None for one per CPU."""
+    return _settings["workers"]
+
+
+def get_csv_reader() -> str:
+    """Return the name of the reader used to parse csv datasets."""
+    return _settings["csv_reader"]
+
+
+@cache
+def get_league() -> League:
+    """Return the League of the configured division built from the datasets, loading it on the first call only."""
+    _loaded["signature"] = load.get_dataset_signature(get_data_dir())
+    with io.progress("Loading datasets..."):
+        try:
+            leagues = load.load_leagues(get_data_dir(), workers=get_workers(), csv_reader=get_csv_reader())
+        except (OSError, ValueError) as load_error:
+            io.error(str(load_error))
+
+    if len(leagues) == 0:
+        io.error(f"No datasets were found in {get_data_dir()}.")
+
+    division = _settings["division"] or load.get_default_division(leagues)
+    if division not in leagues:
+        io.error(f"The given division is not one of {', '.join(sorted(leagues))}.")
+    _loaded["division"] = division
+    return leagues[division]
+
+
+def get_division_name() -> str:
+    """Return the name of the division of the League that commands use, such as 'Premier League', or its
+    division code if its name is not known.
+    """
+    get_league()
+    return Constants().retrieve("DIVISION_NAMES").get(_loaded["division"], _loaded["division"])
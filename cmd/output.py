@@ -2,27 +2,86 @@
 
 This module contains helper functions to output various messages to the console using rich.
 
+Output can also be written in a machine-readable format, in which case rich is never imported: tables are
+streamed to stdout row by row as JSON, newline-delimited JSON or CSV, and messages are written without markup.
+
 This file is Copyright (c) 2023 Ram Raghav Sharma, Harshith Latchupatula, Vikram Makkar and Muhammad Ibrahim.
 """
 
-from typing import Any
-from rich.console import Console
-from rich.table import Table
-from rich.style import Style
-from rich import box
+import csv
+import json
+import re
+import sys
+import threading
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Any, Iterator, Optional, TextIO
 import typer
 
+if TYPE_CHECKING:
+    from rich.console import Console
+
+# number of seconds a task may run before a progress spinner is displayed
+PROGRESS_DELAY = 0.3
+
+# the formats output can be written in, where table renders it with rich
+OUTPUT_FORMATS = ["table", "json", "ndjson", "csv"]
+
+# a rich markup tag, such as [cyan] or [/cyan]
+MARKUP_TAG = re.compile(r"(?<!\\)\[([a-z#/@][^[]*?)\]")
+
+# the format output is written in, one of OUTPUT_FORMATS
+_format: dict[str, str] = {"format": "table"}
+
+# keyword arguments of every Console, set while output is redirected
+_console_options: dict[str, Any] = {}
+
+# the console printed to, reused until the console options change
+_consoles: dict[str, Any] = {"console": None, "options": None}
+
+# the list output is recorded in instead of being printed, set while output is captured
+_capture: dict[str, Optional[list[dict[str, Any]]]] = {"results": None}
+
+
+def set_format(output_format: str) -> None:
+    """Set the format every following output is written in.
+
+    Preconditions:
+        - output_format in OUTPUT_FORMATS
+    """
+    _format["format"] = output_format
+
+
+def get_format() -> str:
+    """Return the format output is currently written in, one of OUTPUT_FORMATS."""
+    return _format["format"]
+
 
 def info(message: str, color: str) -> None:
     """Uses rich to print a colored information message."""
-    console = Console()
+    if _capture["results"] is not None:
+        _capture["results"].append({"type": "info", "message": strip_markup(message)})
+        return
+    if _format["format"] != "table":
+        _write_record({"message": strip_markup(message)}, ["message"])
+        return
+    console = _console()
     console.line()
     console.print(message, style=color)
 
 
 def error(message: str) -> None:
-    """Uses rich to print a colored error message."""
-    console = Console()
+    """Uses rich to print a colored error message.
+
+    In a machine-readable format, the message is written to stderr instead and the exit code is 1,
+    so that it is never mistaken for a result.
+    """
+    if _capture["results"] is not None:
+        _capture["results"].append({"type": "error", "message": message})
+        raise typer.Exit()
+    if _format["format"] != "table":
+        sys.stderr.write(f"Error: {message}\n")
+        raise typer.Exit(code=1)
+    console = _console()
     console.line()
     error_message = "Error: " + message
     console.print(error_message, style="red")
@@ -32,12 +91,28 @@ def error(message: str) -> None:
 def table(title: str, headers: list[str], colors: list[str], data: list[tuple[Any]], width: int) -> None:
     """Uses rich to print a table with the specified table, headers, colors and data.
 
+    In a machine-readable format, the rows are written as they are, without converting them to strings:
+    json writes a single object holding the title and a list of rows, ndjson writes a line per row,
+    and csv writes a header line followed by a line per row. In json and ndjson each row is an object
+    keyed by the headers.
+
     Preconditions:
         - len({len(headers), len(colors), len(data[0])}) == 1
         - len({len(row) for row in data}) == 1
     """
     if len(data) == 0:
         error("No data found for the given input.")
+    if _capture["results"] is not None:
+        _capture["results"].append({"type": "table", "title": title, "headers": headers, "rows": data})
+        return
+    if _format["format"] != "table":
+        _write_table(title, headers, data)
+        return
+
+    from rich import box
+    from rich.style import Style
+    from rich.table import Table
+
     title_style = Style(bold=True)
     output_table = Table(title=title, width=width, box=box.HORIZONTALS, show_footer=False, title_style=title_style)
 
@@ -48,6 +123,137 @@ def table(title: str, headers: list[str], colors: list[str], data: list[tuple[An
         renderable_row = [str(cell) for cell in row]
         output_table.add_row(*renderable_row)
 
-    console = Console()
+    console = _console()
     console.line()
     console.print(output_table)
+
+
+def record_line(record: dict[str, Any]) -> None:
+    """Write the given record as a single line, flushed immediately so that a reader of a pipe receives it
+    as soon as it is written.
+
+    The record is written as a line of JSON in every format but csv, since its values may be nested. In csv,
+    it is written like a message, as a header line followed by its values, with nested values written as JSON.
+    """
+    if _capture["results"] is not None:
+        _capture["results"].append({"type": "record", "record": record})
+        return
+    file = _console_options.get("file") or sys.stdout
+    if _format["format"] == "csv":
+        values = {
+            key: json.dumps(value, default=to_json) if isinstance(value, (list, dict)) else value
+            for key, value in record.items()
+        }
+        _write_record(values, list(values))
+    else:
+        file.write(json.dumps(record, default=to_json) + "\n")
+    file.flush()
+
+
+@contextmanager
+def progress(description: str) -> Iterator[None]:
+    """Uses rich to display a transient spinner with the given description while the wrapped block runs.
+
+    The spinner is only displayed when stdout is attached to a terminal and the block takes longer than
+    PROGRESS_DELAY seconds, so fast commands and piped output never pay for rendering it.
+    No spinner is displayed while output is captured or written in a machine-readable format.
+    """
+    if not sys.stdout.isatty() or _capture["results"] is not None or _format["format"] != "table":
+        yield
+        return
+
+    from rich.progress import Progress, SpinnerColumn, TextColumn
+
+    spinner = Progress(SpinnerColumn(), TextColumn("[progress.description]{task.description}"), transient=True)
+    spinner.add_task(description=description, total=None)
+    timer = threading.Timer(PROGRESS_DELAY, spinner.start)
+    timer.daemon = True
+    timer.start()
+    try:
+        yield
+    finally:
+        timer.cancel()
+        timer.join()
+        spinner.stop()
+
+
+@contextmanager
+def redirect(file: TextIO, width: Optional[int] = None, terminal: bool = False) -> Iterator[None]:
+    """Send everything printed by this module while the wrapped block runs to the given file instead of stdout.
+    The output is rendered for a terminal of the given width, and styled if terminal is True.
+    """
+    previous_options = dict(_console_options)
+    _console_options.update(file=file, width=width, force_terminal=terminal, no_color=not terminal)
+    try:
+        yield
+    finally:
+        _console_options.clear()
+        _console_options.update(previous_options)
+
+
+@contextmanager
+def capture(results: list[dict[str, Any]]) -> Iterator[None]:
+    """Record everything output by this module while the wrapped block runs in the given list instead of
+    printing it. Each output is recorded as a dictionary with a 'type' of 'info', 'error', 'table' or 'record':
+    messages have a 'message' without markup, tables have a 'title', 'headers' and 'rows', and records have
+    the 'record' itself.
+    """
+    previous_results = _capture["results"]
+    _capture["results"] = results
+    try:
+        yield
+    finally:
+        _capture["results"] = previous_results
+
+
+def strip_markup(message: str) -> str:
+    """Return the given message without its rich markup tags."""
+    return MARKUP_TAG.sub("", message)
+
+
+def to_json(value: Any) -> Any:
+    """Return a JSON serializable version of the given value found in the output of a command, such as
+    a NumPy scalar.
+    """
+    if hasattr(value, "item"):
+        return value.item()
+    return str(value)
+
+
+def _write_table(title: str, headers: list[str], data: list[tuple[Any]]) -> None:
+    """Write the given table to stdout in the current machine-readable format."""
+    file = _console_options.get("file") or sys.stdout
+    if _format["format"] == "json":
+        rows = [dict(zip(headers, row)) for row in data]
+        file.write(json.dumps({"title": title, "rows": rows}, default=to_json) + "\n")
+        return
+
+    if _format["format"] == "csv":
+        writer = csv.writer(file, lineterminator="\n")
+        writer.writerow(headers)
+        writer.writerows(data)
+        return
+
+    for row in data:
+        file.write(json.dumps(dict(zip(headers, row)), default=to_json) + "\n")
+
+
+def _write_record(record: dict[str, Any], headers: list[str]) -> None:
+    """Write the given record, with the given keys, to stdout in the current machine-readable format."""
+    file = _console_options.get("file") or sys.stdout
+    if _format["format"] == "csv":
+        writer = csv.writer(file, lineterminator="\n")
+        writer.writerow(headers)
+        writer.writerow([record[header] for header in headers])
+    else:
+        file.write(json.dumps(record, default=to_json) + "\n")
+
+
+def _console() -> "Console":
+    """Return a rich console to print to. The same console is reused until the output is redirected."""
+    if _consoles["console"] is None or _consoles["options"] != _console_options:
+        from rich.console import Console
+
+        _consoles["console"] = Console(**_console_options)
+        _consoles["options"] = dict(_console_options)
+    return _consoles["console"]
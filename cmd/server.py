@@ -0,0 +1,114 @@
+"""Kickoff Project: cmd / server.py
+
+This module contains a server that keeps the League loaded and runs the commands forwarded to it by the client
+over a Unix socket.
+
+Each request is a single line of JSON holding the command line arguments of a command, and the response is a
+single line of JSON holding its output and exit code. Commands are run one at a time in the server process,
+exactly as they would be run by the CLI.
+
+This file is Copyright (c) 2023 Ram Raghav Sharma, Harshith Latchupatula, Vikram Makkar and Muhammad Ibrahim.
+"""
+import json
+import os
+import signal
+import socket
+import socketserver
+import traceback
+from contextlib import redirect_stderr, redirect_stdout
+from io import StringIO
+from typing import Any
+
+import typer
+
+import harshithl1777_kickoff.cmd.output as io
+from harshithl1777_kickoff.cmd.context import is_league_stale, reload_league
+
+
+def serve(app: typer.Typer, socket_path: str) -> None:
+    """Answer the commands of the given app sent to the given socket until interrupted or terminated.
+
+    Preconditions:
+        - not is_server_running(socket_path)
+    """
+    if os.path.exists(socket_path):
+        os.remove(socket_path)
+    os.makedirs(os.path.dirname(socket_path) or ".", exist_ok=True)
+
+    server = socketserver.UnixStreamServer(socket_path, _RequestHandler)
+    server.app = app
+    signal.signal(signal.SIGTERM, _terminate)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        os.remove(socket_path)
+
+
+def is_server_running(socket_path: str) -> bool:
+    """Return whether a server is accepting connections on the given socket."""
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as connection:
+            connection.connect(socket_path)
+    except OSError:
+        return False
+    return True
+
+
+def run_command(app: typer.Typer, request: dict[str, Any]) -> dict[str, Any]:
+    """Run the command described by the given request with the given app and return its output and exit code.
+
+    The command runs in the working directory and with the Kickoff environment variables of the client that
+    sent it, and the League is reloaded first if the datasets have changed since it was loaded.
+    """
+    stdout = StringIO()
+    stderr = StringIO()
+    status = 0
+    previous_cwd = os.getcwd()
+    previous_env = {name: value for name, value in os.environ.items() if name.startswith("KICKOFF_")}
+    try:
+        os.chdir(request["cwd"])
+        _set_kickoff_env(request["env"])
+        if is_league_stale():
+            reload_league()
+        with redirect_stdout(stdout), redirect_stderr(stderr):
+            with io.redirect(stdout, request["width"], request["terminal"]):
+                app(args=request["args"], prog_name="kickoff")
+    except SystemExit as exit_error:
+        status = exit_error.code if isinstance(exit_error.code, int) else int(exit_error.code is not None)
+    except Exception:
+        stderr.write(traceback.format_exc())
+        status = 1
+    finally:
+        os.chdir(previous_cwd)
+        _set_kickoff_env(previous_env)
+
+    return {"stdout": stdout.getvalue(), "stderr": stderr.getvalue(), "status": status}
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    """Runs the command sent over a connection and writes back its output."""
+
+    def handle(self) -> None:
+        """Handle a single request."""
+        try:
+            request = json.loads(self.rfile.readline())
+        except ValueError:
+            return
+        response = run_command(self.server.app, request)
+        self.wfile.write(json.dumps(response).encode() + b"\n")
+
+
+def _terminate(signum: int, frame: Any) -> None:
+    """Stop the server when the process is terminated."""
+    raise KeyboardInterrupt
+
+
+def _set_kickoff_env(env: dict[str, str]) -> None:
+    """Replace the Kickoff environment variables of this process with the given ones."""
+    for name in [name for name in os.environ if name.startswith("KICKOFF_")]:
+        if name not in env:
+            del os.environ[name]
+    os.environ.update(env)
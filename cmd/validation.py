@@ -4,30 +4,79 @@ This module contains various error checking functions for the commands.py file.
 
 This file is Copyright (c) 2023 Ram Raghav Sharma, Harshith Latchupatula, Vikram Makkar and Muhammad Ibrahim.
 """
+import re
+
 import harshithl1777_kickoff.cmd.output as io
-from harshithl1777_kickoff.models.league import League
-from harshithl1777_kickoff.utils.constants import Constants
+from harshithl1777_kickoff.cmd.context import get_league
+from harshithl1777_kickoff.controllers.optimization import BINNED_STATISTICS
+from harshithl1777_kickoff.controllers.records import STREAK_KINDS, get_matchday_count
+from harshithl1777_kickoff.utils.load import CSV_READERS
 
 
-def validate_team(league: League, team_input: str) -> None:
+def validate_team(team_input: str) -> None:
     """Check if the given team is in the League. If not, print an error."""
-    if not league.team_in_league(team_input):
+    if not get_league().team_in_league(team_input):
         io.error("The given team is not a valid team.")
 
 
 def validate_season(season_input: str) -> None:
-    """Check if the given season is in the list of datasets. If not, print an error."""
-    constants = Constants()
-    if season_input is not None and season_input not in constants.retrieve("VALID_SEASONS"):
-        io.error("The given season is not in the format '20XX-XX' between 2009-10 and 2018-19.")
+    """Check if the given season is in the list of datasets. If not, print an error.
+    The format of the season is checked before the datasets are loaded.
+    """
+    if season_input is None:
+        return
+    if re.fullmatch(r"\d{4}-\d{2}", season_input) is None:
+        io.error("The given season is not in the format '20XX-XX'.")
+
+    seasons = get_league().get_seasons()
+    if season_input not in seasons:
+        io.error(f"The given season is not in the format '20XX-XX' between {seasons[0]} and {seasons[-1]}.")
 
 
-def validate_team_in_season(league: League, team_input: str, season_input: str) -> None:
+def validate_team_in_season(team_input: str, season_input: str) -> None:
     """Check if the given team played in the given season. If not, print an error."""
-    if season_input is not None and season_input not in league.get_team(team_input).seasons:
+    if season_input is not None and season_input not in get_league().get_team(team_input).seasons:
         io.error("This team did not play a match in the given season.")
 
 
+def validate_csv_reader(csv_reader_input: str) -> None:
+    """Check if the given csv reader is one of the available csv readers. If not, print an error."""
+    if csv_reader_input not in CSV_READERS:
+        io.error(f"The given csv reader is not one of {', '.join(CSV_READERS)}.")
+
+
+def validate_format(format_input: str) -> None:
+    """Check if the given output format is one of the available formats. If not, print an error."""
+    if format_input not in io.OUTPUT_FORMATS:
+        io.error(f"The given format is not one of {', '.join(io.OUTPUT_FORMATS)}.")
+
+
+def validate_streak_kind(kind_input: str) -> None:
+    """Check if the given streak kind is one of the kinds of streaks that can be found. If not, print an error."""
+    if kind_input not in STREAK_KINDS:
+        io.error(f"The given streak kind is not one of {', '.join(STREAK_KINDS)}.")
+
+
+def validate_binned_statistic(statistic_input: str) -> None:
+    """Check if the given statistic is one of the statistics whose optimal ranges can be calculated.
+    If not, print an error.
+    """
+    if statistic_input not in BINNED_STATISTICS:
+        io.error(f"The given statistic is not one of {', '.join(BINNED_STATISTICS)}.")
+
+
+def validate_skew(skew_input: int, season_input: str) -> None:
+    """Check if the given skew leaves at least one match of the given season, other than the last, in which a
+    team's lowest winrate can be found. If not, print an error.
+    """
+    matchday_count = get_matchday_count(get_league(), season_input)
+    if skew_input >= matchday_count - 1:
+        io.error(
+            f"The skew should be less than {matchday_count - 1}, as teams played at most {matchday_count} "
+            f"matches in the {season_input} season."
+        )
+
+
 def validate_topx(topx_input: int, topx_max: int = None) -> None:
     """Check if the given topx input is less than the given topx maximum. If not, print an error."""
     if topx_max is not None:
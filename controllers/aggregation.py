@@ -4,41 +4,49 @@ This module contains functionality for computing various basic statistics.
 
 This file is Copyright (c) 2023 Ram Raghav Sharma, Harshith Latchupatula, Vikram Makkar and Muhammad Ibrahim.
 """
+import math
 from typing import Optional
 
+import numpy as np
+
 from harshithl1777_kickoff.models.league import League
+from harshithl1777_kickoff.models.stats_cube import VENUE_AWAY, VENUE_HOME
+from harshithl1777_kickoff.utils.memo import memoize
+
+# the statistics averaged by get_team_averages, mapped to their labels in the averages command
+AVERAGE_STATISTICS = {
+    "goals_scored": "Average Goals Scored / Game",
+    "shot_accuracy": "Average Shot Accuracy (%)",
+    "fouls": "Average Fouls Committed / Game",
+    "cards": "Average Card Offenses / Game",
+}
 
 
+@memoize()
 def overall_winrate(league: League, team_name: str, season: Optional[str] = None) -> float:
     """Return the overall winrate percentage of the team with team_name in the League.
     If the season is provided, only consider matches played in the given season.
 
     Preconditons:
-        - season is in the format '20XX-XX' between 2009-10 and 2018-19 or season is None
+        - season is None or season in league.get_seasons()
         - league.team_in_league(team_name)
         - season is None or team_name in league.get_team_names(season)
     """
-    total_matches = 0
-    total_wins = 0
-
-    team = league.get_team(team_name)
-    for match in team.matches:
-        if season is not None and match.season != season:
-            continue
-        total_matches += 1
-        if match.result == team:
-            total_wins += 1
-
-    return (total_wins / total_matches) * 100
+    cube = league.get_stats_cube()
+    return (cube.get_team("wins", team_name, season) / cube.get_team("matches", team_name, season)) * 100
 
 
+@memoize()
 def home_vs_away(league: League, team_name: str, season: Optional[str] = None) -> list[tuple[float, float, float]]:
     """Return the home winrate and away winrate percentages in the League.
     If the season is provided, only consider matches played in the given season.
     If the team_name is provided, only consider matches played the corresponding team.
 
+    When a season is provided, the home and away winrates are the percentages of the team's matches it won
+    at home and away. Otherwise, they are the percentages of the team's matches won by the home and away side.
+
     Preconditons:
-        - season is in the format '20XX-XX' between 2009-10 and 2018-19 or season is None
+        - season is None or season in league.get_seasons()
         - league.team_in_league(team_name)
         - (season is None or team is None) or team in league.get_team_names(season)
     """
@@ -46,41 +54,59 @@ def home_vs_away(league: League, team_name: str, season: Optional[str] = None) -
     away_win_rate = 0
     draw_rate = 0
 
-    if team_name is not None and season is not None:
-        team = league.get_team(team_name)
-        total_matches = len([match for match in team.matches if match.season == season])
+    if team_name is not None:
+        cube = league.get_stats_cube()
+        total_matches = cube.get_team("matches", team_name, season)
+        home_wins = cube.get_team("wins", team_name, season, VENUE_HOME)
+        away_wins = cube.get_team("wins", team_name, season, VENUE_AWAY)
+        if season is None:
+            home_wins, away_wins = (
+                home_wins + cube.get_team("losses", team_name, season, VENUE_AWAY),
+                away_wins + cube.get_team("losses", team_name, season, VENUE_HOME),
+            )
+
+        home_win_rate = (home_wins / total_matches) * 100
+        away_win_rate = (away_wins / total_matches) * 100
+        draw_rate = (cube.get_team("draws", team_name, season) / total_matches) * 100
 
-        for match in team.matches:
-            if season is not None and match.season != season:
-                continue
-
-            if match.result is None:
-                draw_rate += 1
-
-            if match.home_team == team and match.result == team:
-                home_win_rate += 1
-            elif match.away_team == team and match.result == team:
-                away_win_rate += 1
+    return [(round(home_win_rate, 2), round(away_win_rate, 2), round(draw_rate, 2))]
 
-        home_win_rate = (home_win_rate / total_matches) * 100
-        away_win_rate = (away_win_rate / total_matches) * 100
-        draw_rate = (draw_rate / total_matches) * 100
 
-    elif season is None:
-        matches = league.get_team(team_name).matches
-        for match in matches:
-            if match.home_team == match.result:
-                home_win_rate += 1
-            elif match.away_team == match.result:
-                away_win_rate += 1
-            else:
-                draw_rate += 1
+@memoize()
+def get_team_averages(league: League, season: Optional[str] = None) -> dict[str, dict[str, float]]:
+    """Return a mapping from the name of each team that played in the given season to its average of each
+    statistic in AVERAGE_STATISTICS in a match of that season. If the season is None, consider all matches.
 
-        home_win_rate = (home_win_rate / len(matches)) * 100
-        away_win_rate = (away_win_rate / len(matches)) * 100
-        draw_rate = (draw_rate / len(matches)) * 100
+    The averages are read from the League's StatsCube, so every team is computed from a handful of sums.
+    The shot accuracy only considers matches in which the team took a shot, and is nan if it never did.
 
-    return [(round(home_win_rate, 2), round(away_win_rate, 2), round(draw_rate, 2))]
+    Preconditions:
+        - season is None or season in league.get_seasons()
+    """
+    cube = league.get_stats_cube()
+    matches_played = cube.get("matches", season)
+    goals = cube.get("goals_for", season)
+    fouls = cube.get("fouls", season)
+    cards = cube.get("yellow_cards", season) + 2 * cube.get("red_cards", season)
+    accuracy = cube.get("accuracy", season)
+    accuracy_matches = cube.get("accuracy_matches", season)
+
+    played = np.flatnonzero(matches_played)
+    matches_played = matches_played[played]
+    shot_accuracy = np.full(len(played), math.nan)
+    np.divide(accuracy[played], accuracy_matches[played], out=shot_accuracy, where=accuracy_matches[played] > 0)
+
+    columns = {
+        "goals_scored": goals[played] / matches_played,
+        "shot_accuracy": shot_accuracy * 100,
+        "fouls": fouls[played] / matches_played,
+        "cards": cards[played] / matches_played,
+    }
+    columns = {statistic: column.tolist() for statistic, column in columns.items()}
+    return {
+        cube.team_names[team_id]: {statistic: column[i] for statistic, column in columns.items()}
+        for i, team_id in enumerate(played)
+    }
 
 
 def get_team_goals_scored(league: League, team_name: str, season: Optional[str] = None) -> float:
@@ -88,21 +114,11 @@ def get_team_goals_scored(league: League, team_name: str, season: Optional[str]
     If the season is provided, only consider matches played in the given season.
 
     Preconditions:
-        - season is in the format '20XX-XX' between 2009-10 and 2018-19 or season is None
+        - season is None or season in league.get_seasons()
         - league.team_in_league(team_name)
         - season is None or team_name in league.get_team_names(season)
     """
-    total_matches = 0
-    goals_scored = 0
-    team = league.get_team(team_name)
-
-    for match in team.matches:
-        if season is not None and match.season != season:
-            continue
-        total_matches += 1
-        goals_scored += match.details[team_name].full_time_goals
-
-    return goals_scored / total_matches
+    return get_team_averages(league, season)[team_name]["goals_scored"]
 
 
 def get_team_shot_accuracy(league: League, team_name: str, season: Optional[str] = None) -> float:
@@ -110,25 +126,11 @@ def get_team_shot_accuracy(league: League, team_name: str, season: Optional[str]
     If the season is provided, only consider matches played in the given season.
 
     Preconditions:
-        - season is in the format '20XX-XX' between 2009-10 and 2018-19 or season is None
+        - season is None or season in league.get_seasons()
         - league.team_in_league(team_name)
         - season is None or team_name in league.get_team_names(season)
     """
-    total_matches = 0
-    accuracy = 0
-    team = league.get_team(team_name)
-
-    for match in team.matches:
-        if season is not None and match.season != season:
-            continue
-        shots = match.details[team_name].shots
-        if shots == 0:
-            continue
-        total_matches += 1
-        shots_target = match.details[team_name].shots_on_target
-        accuracy += shots_target / shots
-
-    return (accuracy / total_matches) * 100
+    return get_team_averages(league, season)[team_name]["shot_accuracy"]
 
 
 def get_team_fouls(league: League, team_name: str, season: Optional[str] = None) -> float:
@@ -136,21 +138,11 @@ def get_team_fouls(league: League, team_name: str, season: Optional[str] = None)
     If the season is provided, only consider matches played in the given season.
 
     Preconditions:
-        - season is in the format '20XX-XX' between 2009-10 and 2018-19 or season is None
+        - season is None or season in league.get_seasons()
         - league.team_in_league(team_name)
         - season is None or team_name in league.get_team_names(season)
     """
-    total_matches = 0
-    fouls = 0
-    team = league.get_team(team_name)
-
-    for match in team.matches:
-        if season is not None and match.season != season:
-            continue
-        total_matches += 1
-        fouls += match.details[team_name].fouls
-
-    return fouls / total_matches
+    return get_team_averages(league, season)[team_name]["fouls"]
 
 
 def get_team_cards(league: League, team_name: str, season: Optional[str] = None) -> float:
@@ -159,79 +151,84 @@ def get_team_cards(league: League, team_name: str, season: Optional[str] = None)
     If the season is provided, only consider matches played in the given season.
 
     Preconditions:
-        - season is in the format '20XX-XX' between 2009-10 and 2018-19 or season is None
+        - season is None or season in league.get_seasons()
         - league.team_in_league(team_name)
         - season is None or team_name in league.get_team_names(season)
     """
-    total_matches = 0
-    cards = 0
-    team = league.get_team(team_name)
+    return get_team_averages(league, season)[team_name]["cards"]
 
-    for match in team.matches:
-        if season is not None and match.season != season:
-            continue
-        total_matches += 1
-        cards += match.details[team_name].yellow_cards
-        cards += 2 * (match.details[team_name].red_cards)
 
-    return cards / total_matches
+@memoize()
+def get_season_averages(league: League, season: str) -> dict[str, float]:
+    """Return a mapping from each statistic in AVERAGE_STATISTICS to the average of all teams in the given
+    season, where each team's average in a match of the season counts equally.
+
+    Preconditions:
+        - season in league.get_seasons()
+    """
+    return _average_teams(get_team_averages(league, season))
 
 
 def get_season_goals_scored(league: League, season: str) -> float:
     """Return the average number of goals scored in a match by all teams in a season.
 
     Preconditions:
-        - season is in the format '20XX-XX' between 2009-10 and 2018-19
+        - season in league.get_seasons()
     """
-    team_names = league.get_team_names(season)
-    team_goals_scored = []
-
-    for name in team_names:
-        team_goals_scored.append(get_team_goals_scored(league, name, season))
-
-    return (sum(team_goals_scored)) / len(team_goals_scored)
+    return get_season_averages(league, season)["goals_scored"]
 
 
 def get_season_shot_accuracy(league: League, season: str) -> float:
     """Return the average shot accuracy in a match by all teams in a season.
 
     Preconditions:
-        - season is in the format '20XX-XX' between 2009-10 and 2018-19
+        - season in league.get_seasons()
     """
-    team_names = league.get_team_names(season)
-    team_accuracy = []
-
-    for name in team_names:
-        team_accuracy.append(get_team_shot_accuracy(league, name, season))
-
-    return (sum(team_accuracy)) / len(team_accuracy)
+    return get_season_averages(league, season)["shot_accuracy"]
 
 
 def get_season_fouls(league: League, season: str) -> float:
     """Return the average fouls committed in a match by all teams in a season.
 
     Preconditions:
-        - season is in the format '20XX-XX' between 2009-10 and 2018-19
+        - season in league.get_seasons()
     """
-    team_names = league.get_team_names(season)
-    team_fouls = []
-
-    for name in team_names:
-        team_fouls.append(get_team_fouls(league, name, season))
-
-    return (sum(team_fouls)) / len(team_fouls)
+    return get_season_averages(league, season)["fouls"]
 
 
 def get_season_cards(league: League, season: str) -> float:
     """Return the average card offenses received in a match by all teams in a season.
 
     Preconditions:
-        - season is in the format '20XX-XX' between 2009-10 and 2018-19
+        - season in league.get_seasons()
     """
-    team_names = league.get_team_names(season)
-    team_cards = []
+    return get_season_averages(league, season)["cards"]
 
-    for name in team_names:
-        team_cards.append(get_team_cards(league, name, season))
 
-    return sum(team_cards) / len(team_cards)
+@memoize()
+def compare_to_season_averages(league: League, team_name: str, season: str) -> list[tuple[str, float, float]]:
+    """Return a list of tuples of each statistic compared by the averages command, the average of the team
+    with team_name in a match of the given season, and the average of all teams in that season.
+
+    Preconditions:
+        - season in league.get_seasons()
+        - team_name in league.get_team_names(season)
+    """
+    team_averages = get_team_averages(league, season)
+    season_averages = _average_teams(team_averages)
+    return [
+        (label, team_averages[team_name][statistic], season_averages[statistic])
+        for statistic, label in AVERAGE_STATISTICS.items()
+    ]
+
+
+def _average_teams(team_averages: dict[str, dict[str, float]]) -> dict[str, float]:
+    """Return a mapping from each statistic in AVERAGE_STATISTICS to the mean of the given teams' averages of it.
+
+    Preconditions:
+        - len(team_averages) > 0
+    """
+    return {
+        statistic: sum(averages[statistic] for averages in team_averages.values()) / len(team_averages)
+        for statistic in AVERAGE_STATISTICS
+    }
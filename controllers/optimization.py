@@ -6,67 +6,100 @@ This file is Copyright (c) 2023 Ram Raghav Sharma, Harshith Latchupatula, Vikram
 """
 
 from typing import Optional
-from harshithl1777_kickoff.models.league import League
-from harshithl1777_kickoff.models.match import Match
-from harshithl1777_kickoff.utils.helpers import get_all_matches
-from harshithl1777_kickoff.controllers.aggregation import overall_winrate
 
+import numpy as np
 
-def _compile_statistic_to_win_data(attr_name: str, matches: list[Match], team: Optional[str] = None) -> dict[int, int]:
-    """Returns a dictionary of specific statistic counts to the number of wins that they amass.
+from harshithl1777_kickoff.models.league import League
+from harshithl1777_kickoff.models.match_table import SIDE_DRAW, SIDE_LOSS, SIDE_WIN
+from harshithl1777_kickoff.utils.memo import memoize
+from harshithl1777_kickoff.utils.topk import top_k, top_k_indices
+
+# the number of games a referee must have refereed to be included in the optimal and fairest referees
+MIN_GAMES_REFEREED = 20
+
+# the MatchDetails statistics whose optimal ranges can be calculated, and the name each range is shown with
+BINNED_STATISTICS = {
+    "fouls": "Foul",
+    "yellow_cards": "Yellow Card",
+    "red_cards": "Red Card",
+    "shots": "Shot",
+    "shots_on_target": "Shot on Target",
+    "half_time_goals": "Half Time Goal",
+    "full_time_goals": "Goal",
+}
+
+
+def _bin_statistic(league: League, stat: str, width: int, team: Optional[str] = None) -> dict[str, np.ndarray]:
+    """Returns a mapping from 'games', 'wins', 'draws' and 'losses' to the number of sides of the league's
+    matches, or only the given team's sides, whose value of the given statistic falls in each range of width
+    values, and the number of those sides that won, drew and lost. Range i holds the values from i * width
+    to (i + 1) * width - 1, and the counts are indexed by range up to the range of the largest value.
+
+    'first_win' maps to the position of the first side that won in each range, in chronological order,
+    or the number of sides if none did.
 
     Preconditions
-        - team is a valid team
+        - stat in BINNED_STATISTICS
+        - width > 0
+        - team is None or league.team_in_league(team)
     """
-    stat_wins = {}
-    for match in matches:
-        if match.result is not None and (match.result.name == team or team is None):
-            if team is None:
-                stat = getattr(match.details[match.result.name], attr_name)
-            else:
-                stat = getattr(match.details[team], attr_name)
-            if stat not in stat_wins:
-                stat_wins[stat] = 0
-            stat_wins[stat] += 1
-
-    return stat_wins
+    table = league.get_match_table()
+    values = table.side_stats(stat).astype(np.int64)
+    results = table.side_results()
+    if team is not None:
+        sides = np.flatnonzero(table.side_teams() == table.team_ids[team])
+        values, results = values[sides], results[sides]
+
+    ranges = values // width
+    range_count = int(ranges.max()) + 1 if len(ranges) > 0 else 0
+    counts = np.bincount(ranges * 3 + results, minlength=range_count * 3).reshape(range_count, 3)
+
+    won = np.flatnonzero(results == SIDE_WIN)
+    first_win = np.full(range_count, len(ranges), dtype=np.int64)
+    np.minimum.at(first_win, ranges[won], won)
+    return {
+        "games": counts.sum(axis=1),
+        "wins": counts[:, SIDE_WIN],
+        "draws": counts[:, SIDE_DRAW],
+        "losses": counts[:, SIDE_LOSS],
+        "first_win": first_win,
+    }
+
+
+def _range_label(range_index: int, width: int) -> str:
+    """Returns the label of the range with the given index of width values, as described in _bin_statistic."""
+    if width == 1:
+        return str(range_index)
+    return str(range_index * width) + " - " + str(range_index * width + (width - 1))
 
 
 def _generate_optimal_range_data(
-    matches: list[Match], stat_wins: dict[int, int], width: int
+    league: League, stat: str, width: int, team: Optional[str] = None
 ) -> list[tuple[str, int, float]]:
-    """Returns an unsorted list of tuples of foul ranges, their corresponding number of wins
-    and the % of total wins they account for.
+    """Returns an unsorted list of tuples of the ranges of the given statistic in which the league's matches,
+    or only the given team's matches, were won, their corresponding number of wins and the % of total matches
+    won in them. Ranges are in the order of the first win in each.
 
-    Preconditions:
-        - 1 <= width < max(list(stat_wins.keys()))
+    Preconditions
+        - stat in BINNED_STATISTICS
+        - width > 0
+        - team is None or league.team_in_league(team)
     """
-    max_stat = max(list(stat_wins.keys()))
-
-    range_mappings = {}
-    for i in range(0, max_stat + 1, width):
-        range_str = str(i) + " - " + str(i + (width - 1))
-        for j in range(width):
-            range_mappings[i + j] = range_str
-
-    stat_range_wins = {}
-    for stat in stat_wins:
-        range_mapping = range_mappings[stat]
-        if range_mapping not in stat_range_wins:
-            stat_range_wins[range_mapping] = 0
-        stat_range_wins[range_mapping] += stat_wins[stat]
-
-    optimal_ranges = [
-        (
-            stat_range,
-            stat_range_wins[stat_range],
-            round((stat_range_wins[stat_range] / len(matches)) * 100, 2),
-        )
-        for stat_range in stat_range_wins
+    ranges = _bin_statistic(league, stat, width, team)
+    if team is None:
+        match_count = len(league.get_matches())
+    else:
+        match_count = len(league.get_team(team).matches)
+
+    won = np.flatnonzero(ranges["wins"] > 0)
+    won = won[np.argsort(ranges["first_win"][won], kind="stable")]
+    return [
+        (_range_label(range_index, width), wins, round((wins / match_count) * 100, 2))
+        for range_index, wins in zip(won.tolist(), ranges["wins"][won].tolist())
     ]
-    return optimal_ranges
 
 
+@memoize()
 def calculate_optimal_fouls(league: League, team: Optional[str] = None, topx: int = 4) -> list[tuple[str, int, float]]:
     """Returns a list of the topx optimal foul ranges and the % of wins they account for.
 
@@ -74,18 +107,11 @@ def calculate_optimal_fouls(league: League, team: Optional[str] = None, topx: in
         - team is None or league.team_in_league(team)
         - topx > 0
     """
-    if team is None:
-        matches = get_all_matches(league)
-    else:
-        matches = league.get_team(team).matches
-
-    stat_wins = _compile_statistic_to_win_data(attr_name="fouls", matches=matches, team=team)
-    optimal_ranges = _generate_optimal_range_data(matches, stat_wins, width=4)
-
-    sorted_optimal_ranges = sorted(optimal_ranges, key=lambda a: a[1], reverse=True)
-    return sorted_optimal_ranges[:topx]
+    optimal_ranges = _generate_optimal_range_data(league, "fouls", 4, team)
+    return top_k(optimal_ranges, topx, key=lambda a: a[1])
 
 
+@memoize()
 def calculate_optimal_yellow_cards(
     league: League, team: Optional[str] = None, topx: int = 4
 ) -> list[tuple[str, int, float]]:
@@ -95,49 +121,71 @@ def calculate_optimal_yellow_cards(
         - team is None or league.team_in_league(team)
         - topx > 0
     """
-    if team is None:
-        matches = get_all_matches(league)
-    else:
-        matches = league.get_team(team).matches
+    optimal_ranges = _generate_optimal_range_data(league, "yellow_cards", 2, team)
+    return top_k(optimal_ranges, topx, key=lambda a: a[1])
+
+
+@memoize()
+def calculate_optimal_stat(
+    league: League, stat: str, width: int = 1, team: Optional[str] = None, topx: int = 4
+) -> list[tuple[str, int, int, float, float, float]]:
+    """Returns a list of the topx ranges of width values of the given statistic in which the most games were won,
+    with the number of games played and won in each and the % of those games that were won, drawn and lost.
+    If team is provided, only the given team's games are considered, and otherwise both sides of every match.
+
+    Ranges with the same number of wins are ordered from the lowest values to the highest.
 
-    stat_wins = _compile_statistic_to_win_data(attr_name="yellow_cards", matches=matches, team=team)
-    optimal_ranges = _generate_optimal_range_data(matches, stat_wins, width=2)
+    Preconditions
+        - stat in BINNED_STATISTICS
+        - width > 0
+        - team is None or league.team_in_league(team)
+        - topx > 0
+    """
+    ranges = _bin_statistic(league, stat, width, team)
+    played = np.flatnonzero(ranges["games"] > 0)
+    optimal = played[top_k_indices(ranges["wins"][played], topx)]
 
-    sorted_optimal_ranges = sorted(optimal_ranges, key=lambda a: a[1], reverse=True)
-    return sorted_optimal_ranges[:topx]
+    columns = [ranges[column][optimal].tolist() for column in ["games", "wins", "draws", "losses"]]
+    return [
+        (
+            _range_label(range_index, width),
+            games,
+            wins,
+            round((wins / games) * 100, 2),
+            round((draws / games) * 100, 2),
+            round((losses / games) * 100, 2),
+        )
+        for range_index, games, wins, draws, losses in zip(optimal.tolist(), *columns)
+    ]
 
 
+@memoize()
 def _generate_referee_win_stats(
     league: League, team: str, limit_games_refereed: bool = True
 ) -> list[tuple[str, int, int, float]]:
     """Returns an unsorted list of tuples of a referee, the number of wins they accounted for,
     the number of games referred and total win percentage.
 
+    Only referees under whom the team won at least once are included, in the order of the team's first win
+    under each of them. The counts are read from the League's RefereeIndex.
+
     Preconditions
         - team is None or league.team_in_league(team)
     """
-    matches = league.get_team(team).matches
+    index = league.get_referee_index()
+    stats = index.get(team_name=team)
+    won = np.flatnonzero(stats["wins"] > 0)
+    won = won[np.argsort(stats["first_win"][won], kind="stable")]
 
-    stat_wins = _compile_statistic_to_win_data(attr_name="referee", matches=matches, team=team)
     optimal_referees = []
-    for referee in stat_wins:
-        games_refereed = 0
-        for match in matches:
-            if match.details[match.away_team.name].referee == referee:
-                games_refereed += 1
-        if not limit_games_refereed or games_refereed >= 20:
-            optimal_referees.append(
-                (
-                    referee,
-                    stat_wins[referee],
-                    games_refereed,
-                    round((stat_wins[referee] / games_refereed) * 100, 2),
-                )
-            )
+    for referee, wins, games in zip(*(stats[column][won].tolist() for column in ["referee", "wins", "games"])):
+        if not limit_games_refereed or games >= MIN_GAMES_REFEREED:
+            optimal_referees.append((index.referee_names[referee], wins, games, round((wins / games) * 100, 2)))
 
     return optimal_referees
 
 
+@memoize()
 def calculate_optimal_referees(league: League, team: str, topx: int = 4) -> list[tuple[str, int, int, float]]:
     """Returns a list of the topx optimal referees and their game win percentage.
 
@@ -146,27 +194,37 @@ def calculate_optimal_referees(league: League, team: str, topx: int = 4) -> list
         - topx > 0
     """
     optimal_referees = _generate_referee_win_stats(league, team)
-    sorted_optimal_ranges = sorted(optimal_referees, key=lambda a: a[3], reverse=True)
-    return sorted_optimal_ranges[:topx]
+    return top_k(optimal_referees, topx, key=lambda a: a[3])
 
 
+@memoize()
 def calculate_fairest_referees(league: League, topx: int = 4) -> list[tuple[str, int, int, float]]:
     """Returns a list of the topx fairest referees and their game win percentage.
 
+    The teams are visited in the order of the league, and the referees of each team in the order of its first
+    win under them, from a single pass over the League's RefereeIndex. Each team's overall winrate is read from
+    the League's StatsCube.
+
     Preconditions
         - topx > 0
     """
-    team_names = league.get_team_names()
+    cube = league.get_stats_cube()
+    team_matches = cube.get("matches")
+    team_wins = np.divide(cube.get("wins"), team_matches, out=np.zeros(len(team_matches)), where=team_matches > 0)
+    team_winrates = (team_wins * 100).tolist()
+
+    index = league.get_referee_index()
+    stats = index.get()
+    won = np.flatnonzero(stats["wins"] > 0)
+    won = won[np.lexsort((stats["first_win"][won], stats["team"][won]))]
 
     referee_discrepancies = {}
-    for team in team_names:
-        team_winrate = overall_winrate(league, team)
-        optimal_referees = _generate_referee_win_stats(league, team, limit_games_refereed=False)
-        for optimal_referee in optimal_referees:
-            if optimal_referee[0] not in referee_discrepancies:
-                referee_discrepancies[optimal_referee[0]] = ([], [])
-            referee_discrepancies[optimal_referee[0]][0].append(team_winrate - optimal_referee[3])
-            referee_discrepancies[optimal_referee[0]][1].append(optimal_referee[2])
+    columns = (stats[column][won].tolist() for column in ["referee", "team", "wins", "games"])
+    for referee, team, wins, games in zip(*columns):
+        team_winrate = team_winrates[team]
+        discrepancies, games_refereed = referee_discrepancies.setdefault(index.referee_names[referee], ([], []))
+        discrepancies.append(team_winrate - round((wins / games) * 100, 2))
+        games_refereed.append(games)
 
     fairest_referees = []
     for referee in referee_discrepancies:
@@ -177,7 +235,42 @@ def calculate_fairest_referees(league: League, topx: int = 4) -> list[tuple[str,
         else:
             string_avg_discrepancy = "+" + str(average_discrepancy)
 
-        if games_refereed >= 20:
+        if games_refereed >= MIN_GAMES_REFEREED:
             fairest_referees.append((referee, games_refereed, string_avg_discrepancy))
-    sorted_fairest_referees = sorted(fairest_referees, key=lambda a: abs(float(a[2][1:])))
-    return sorted_fairest_referees[:topx]
+    return top_k(fairest_referees, topx, key=lambda a: abs(float(a[2][1:])), largest=False)
+
+
+@memoize()
+def calculate_referee_record(
+    league: League, team: str, season: Optional[str] = None
+) -> list[tuple[str, int, int, int, int, float, float, float]]:
+    """Returns a list of tuples of each referee of the given team's matches, the number of games they refereed,
+    the team's wins, draws and losses under them, its win percentage, and its average fouls and card offenses
+    per game, where a red card counts as two yellow cards. If the season is provided, only consider matches
+    played in the given season.
+
+    Referees are ordered by the number of games they refereed, and then by their first match in the league.
+
+    Preconditions
+        - league.team_in_league(team)
+        - season is None or team in league.get_team_names(season)
+    """
+    index = league.get_referee_index()
+    stats = index.get(team_name=team, season=season)
+    order = np.argsort(-stats["games"], kind="stable")
+    cards = stats["yellow_cards"] + 2 * stats["red_cards"]
+
+    columns = [stats[column][order].tolist() for column in ["referee", "games", "wins", "draws", "losses", "fouls"]]
+    return [
+        (
+            index.referee_names[referee],
+            games,
+            wins,
+            draws,
+            losses,
+            round((wins / games) * 100, 2),
+            round(fouls / games, 2),
+            round(card_offenses / games, 2),
+        )
+        for referee, games, wins, draws, losses, fouls, card_offenses in zip(*columns, cards[order].tolist())
+    ]
@@ -9,8 +9,10 @@ import numpy as np
 from harshithl1777_kickoff.models.league import League
 from harshithl1777_kickoff.models.match import Match
 from harshithl1777_kickoff.models.team import Team
+from harshithl1777_kickoff.utils.memo import memoize
 
 
+@memoize()
 def predict(home: str, away: str, season: str, league: League) -> float:
     """Predict the difference between the home and away teams' scores in
     a match between them based on data from matches in the specified season.
@@ -22,7 +24,7 @@ def predict(home: str, away: str, season: str, league: League) -> float:
         - league.team_in_league(away_team)
         - home in league.get_team_names(season)
         - away in league.get_team_names(season)
-        - season is in the format '20XX-XX' between 2009-10 and 2018-19
+        - season in league.get_seasons()
     """
     # depth 4 enables fast predictions while maintaining accuracy
     PREDICTION_DEPTH = 4
@@ -38,11 +40,11 @@ def predict(home: str, away: str, season: str, league: League) -> float:
         total_diff = 0
         for i, match in enumerate(path):
             if i % 2 == 0:
-                left_team_goals = match.details[match.home_team.name].full_time_goals
-                right_team_goals = match.details[match.away_team.name].full_time_goals
+                left_team_goals = match.home_details.full_time_goals
+                right_team_goals = match.away_details.full_time_goals
             else:
-                left_team_goals = match.details[match.away_team.name].full_time_goals
-                right_team_goals = match.details[match.home_team.name].full_time_goals
+                left_team_goals = match.away_details.full_time_goals
+                right_team_goals = match.home_details.full_time_goals
 
             goal_diff = left_team_goals - right_team_goals
             total_diff += goal_diff
@@ -61,7 +63,7 @@ def _find_all_paths(home_team: Team, away_team: Team, season: str, depth: int) -
         - league.team_in_league(away_team.name)
         - home_team.name in league.get_team_names(season)
         - away_team.name in league.get_team_names(season)
-        - season is in the format '20XX-XX' between 2009-10 and 2018-19
+        - season in league.get_seasons()
     """
     paths: list[list[Match]] = []
     visited: set[str] = set()  # set of all team names that have been visited
@@ -77,14 +79,13 @@ def _find_all_paths(home_team: Team, away_team: Team, season: str, depth: int) -
 
         visited.add(team.name)
 
-        for match in team.matches:
+        for match in team.get_matches(season):
             other_team = match.get_other_team(team)
-            condition1 = match.season != season
-            condition2 = other_team.name in visited
-            condition3 = not at_home and (match.away_team == other_team)
-            condition4 = at_home and (match.home_team == other_team)
+            condition1 = other_team.name in visited
+            condition2 = not at_home and (match.away_team == other_team)
+            condition3 = at_home and (match.home_team == other_team)
 
-            if any({condition1, condition2, condition3, condition4}):
+            if any({condition1, condition2, condition3}):
                 continue
             path.append(match)
             dfs(other_team, path, not at_home)
@@ -4,116 +4,116 @@ This module contains functionality for finding various records in the datasets.
 
 This file is Copyright (c) 2023 Ram Raghav Sharma, Harshith Latchupatula, Vikram Makkar and Muhammad Ibrahim.
 """
-import heapq
 from typing import Optional
-from harshithl1777_kickoff.controllers.aggregation import overall_winrate
+
+import numpy as np
 
 from harshithl1777_kickoff.models.league import League
-from harshithl1777_kickoff.models.team import Team
-from harshithl1777_kickoff.utils.helpers import get_all_matches
+from harshithl1777_kickoff.models.match_table import RESULT_AWAY, RESULT_DRAW, RESULT_HOME, SIDE_LOSS, SIDE_WIN
+from harshithl1777_kickoff.utils.memo import memoize
+from harshithl1777_kickoff.utils.topk import top_k, top_k_indices
+
+# the kinds of streaks found by highest_win_streaks
+STREAK_KINDS = ["win", "unbeaten", "loss", "scoring"]
+
+# the number of matches at the start of a season ignored when finding a team's lowest winrate
+IMPROVEMENT_SKEW = 8
 
 
+@memoize()
 def most_goals_scored(league: League, season: Optional[str] = None, topx: int = 4) -> list[tuple[str, int]]:
     """Return a list of the topx teams that scored the most goals in the whole league
 
     Preconditions:
-        - season is in the format '20XX-XX' between 2009-10 and 2018-19 or season is None
+        - season is None or season in league.get_seasons()
         - topx > 0
     """
-    matches = get_all_matches(league)
-    goals = []
+    table = league.get_match_table()
+    rows = table.season_rows(season)
+    results = table.result[rows]
+    winner_goals = np.where(
+        results == RESULT_AWAY, table.away_stats["full_time_goals"][rows], table.home_stats["full_time_goals"][rows]
+    )
 
-    for match in matches:
-        if season is None or match.season == season:
-            if match.result is None:
-                winner_goals = match.details[match.home_team.name].full_time_goals
-                team_name = str(match.home_team.name) + " & " + str(match.away_team.name)
-            else:
-                winner_goals = match.details[match.result.name].full_time_goals
-                team_name = match.result.name
+    goals = []
+    for row in top_k_indices(winner_goals, topx) + rows.start:
+        home_name, away_name = table.team_names[table.home_team[row]], table.team_names[table.away_team[row]]
+        if table.result[row] == RESULT_DRAW:
+            team_name = home_name + " & " + away_name
+        else:
+            team_name = home_name if table.result[row] == RESULT_HOME else away_name
 
-            if season is None:
-                team_name += f" ({match.season})"
+        if season is None:
+            team_name += f" ({table.season_names[table.season[row]]})"
 
-            goals.append((team_name, winner_goals))
-    return sorted(goals, key=lambda goal: goal[1], reverse=True)[:topx]
+        goals.append((team_name, int(winner_goals[row - rows.start])))
+    return goals
 
 
+@memoize()
 def most_fairplay(league: League, season: Optional[str] = None, topx: int = 4) -> list[tuple[str, float]]:
     """Return a list of the topx most fairplay teams in the league. A fairplay team is measured by the
     least ratio of number of card offenses received and fouls commited to matches played. Consider season
     statistics if provided. Otherwise, consider stastics from all seasons.
 
     Preconditions:
-        - season is in the format '20XX-XX' between 2009-10 and 2018-19 or season is None
+        - season is None or season in league.get_seasons()
         - topx > 0
     """
-    matches = get_all_matches(league)
-    team_offenses = {}
-    offenses = []
-
-    for match in matches:
-        if season is None or match.season == season:
-            home_team = match.home_team.name
-            away_team = match.away_team.name
-
-            yellows_h = match.details[home_team].yellow_cards
-            reds_h = match.details[home_team].red_cards * 2
-            fouls_h = match.details[home_team].fouls
-
-            yellows_a = match.details[away_team].yellow_cards
-            reds_a = match.details[away_team].red_cards * 2
-            fouls_a = match.details[away_team].fouls
-
-            if home_team not in team_offenses:
-                team_offenses[home_team] = [(yellows_h + reds_h + fouls_h), 1]
-
-            else:
-                team_offenses[home_team][0] += yellows_h + reds_h + fouls_h
-                team_offenses[home_team][1] += 1
+    cube = league.get_stats_cube()
+    matches_played = cube.get("matches", season)
+    team_offenses = cube.get("yellow_cards", season) + 2 * cube.get("red_cards", season) + cube.get("fouls", season)
 
-            if away_team not in team_offenses:
-                team_offenses[away_team] = [(yellows_a + reds_a + fouls_a), 1]
-            else:
-                team_offenses[away_team][0] += yellows_a + reds_a + fouls_a
-                team_offenses[away_team][1] += 1
+    offenses = []
+    for team_id in cube.get_teams_by_appearance(season):
+        fair_play_ratio = float(team_offenses[team_id] / matches_played[team_id])
+        offenses.append((cube.team_names[team_id], round(fair_play_ratio, 2)))
 
-    for team in team_offenses:
-        fair_play_ratio = team_offenses[team][0] / team_offenses[team][1]
-        offenses.append((team, round(fair_play_ratio, 2)))
+    return top_k(offenses, topx, key=lambda fairplay: fairplay[1], largest=False)
 
-    return sorted(offenses, key=lambda fairplay: fairplay[1])[:topx]
 
+@memoize()
+def highest_win_streaks(
+    league: League, season: Optional[str] = None, topx: int = 4, kind: str = "win"
+) -> list[tuple[str, int]]:
+    """Return a list of the topx longest streaks of the given kind in the specified season, or across all
+    seasons if it is None, in which case a streak continues from the end of one season into the next.
 
-def highest_win_streaks(league: League, season: str, topx: int = 4) -> list[tuple[str, int]]:
-    """Return a list of the topx highest win streaks in the specified season
+    A win streak is a run of consecutive wins, an unbeaten streak a run without a loss, a loss streak a run of
+    consecutive losses, and a scoring streak a run of matches in which the team scored.
 
     Preconditions:
-        - season is in the format '20XX-XX' between 2009-10 and 2018-19
+        - season is None or season in league.get_seasons()
         - topx > 0
+        - kind in STREAK_KINDS
     """
-    team_names = league.get_team_names(season)
-    streaks = []
-    for name in team_names:
-        team = league.get_team(name)
-        matches = team.matches
-
-        highest_streak = 0
-        current_streak = 0
-        for i in range(len(matches)):
-            if matches[i].season == season and matches[i].result == team:
-                current_streak += 1
-                if i == len(matches) - 1 and current_streak > highest_streak:
-                    highest_streak = current_streak
-            elif matches[i].result != team and highest_streak < current_streak:
-                highest_streak = current_streak
-                current_streak = 0
-
-        streaks.append((name, highest_streak))
-    return sorted(streaks, key=lambda streak: streak[1], reverse=True)[:topx]
-
-
-def most_improved_teams(league: League, season: str, top_x: int) -> list[tuple[str, int, int, int]]:
+    table = league.get_match_table()
+    teams = table.side_teams()
+    results = table.side_results()
+    goals = table.side_stats("full_time_goals")
+    if season is not None:
+        mask = table.side_mask(table.season_mask(season))
+        teams, results, goals = teams[mask], results[mask], goals[mask]
+
+    if kind == "win":
+        in_streak = results == SIDE_WIN
+    elif kind == "unbeaten":
+        in_streak = results != SIDE_LOSS
+    elif kind == "loss":
+        in_streak = results == SIDE_LOSS
+    else:
+        in_streak = goals > 0
+
+    longest_streaks = _longest_runs(teams, in_streak, len(table.team_names))
+    played = np.flatnonzero(np.bincount(teams, minlength=len(table.team_names)))
+    top_teams = played[top_k_indices(longest_streaks[played], topx)]
+    return [(table.team_names[team_id], int(longest_streaks[team_id])) for team_id in top_teams]
+
+
+@memoize()
+def most_improved_teams(
+    league: League, season: str, top_x: int, skew: int = IMPROVEMENT_SKEW
+) -> list[tuple[str, float, float, float]]:
     """Return the top_x most improved teams in the given season in the league.
     The most improved team is calculated based on a computation on the team's winrate throughout the season.
 
@@ -127,138 +127,165 @@ def most_improved_teams(league: League, season: str, top_x: int) -> list[tuple[s
     The returned value is a list of length top_x, where each element is sorted
     in descending order by winrate improve.
 
-    * worst winrate is calculated after ignoring the first 8 matches of the season.
-    This is done because the teams winrate in the first few matches will be skewed.
+    * worst winrate is calculated after ignoring the first skew matches of the season, and before the last.
+    This is done because the teams winrate in the first few matches will be skewed. Teams that played no
+    more than skew + 1 matches in the season are left out.
 
     Preconditions:
         - 0 < topx <= 20
-        - season is in the format '20XX-XX' between 2009-10 and 2018-19
+        - season in league.get_seasons()
+        - 0 <= skew < get_matchday_count(league, season) - 1
     """
-    team_improvements = []
-    team_names = league.get_team_names(season)
+    team_names, progressions = get_winrate_progressions(league, season)
+    matches_played = np.sum(~np.isnan(progressions), axis=1)
+    final_winrates = progressions[np.arange(len(team_names)), matches_played - 1]
 
-    for team_name in team_names:
-        team = league.get_team(team_name)
-        improvement_statistic = _calculate_improvement_statistic(team, season)
-        team_improvements.append(improvement_statistic)
+    matchdays = np.arange(progressions.shape[1])
+    considered = (matchdays >= skew) & (matchdays[np.newaxis, :] < (matches_played - 1)[:, np.newaxis])
+    worst_winrates = np.min(np.where(considered, progressions, np.inf), axis=1, initial=np.inf)
 
-    return heapq.nlargest(top_x, team_improvements, key=lambda x: x[3])
+    team_improvements = []
+    for team_name, worst_winrate, final_winrate in zip(team_names, worst_winrates.tolist(), final_winrates.tolist()):
+        if worst_winrate == np.inf:
+            continue
+        team_improvements.append(
+            (team_name, round(worst_winrate, 2), round(final_winrate, 2), round(final_winrate - worst_winrate, 2))
+        )
 
+    return top_k(team_improvements, top_x, key=lambda x: x[3])
 
-def best_comebacks(league: League, season: Optional[str] = None, topx: int = 4) -> list[tuple[str, str, int]]:
-    """Return a list of the best comebacks in the specified season. The comebacks are
-    calculated only for the teams that are initially losing in the first half that end
-    up winning or drawing the game.
+
+def get_matchday_count(league: League, season: str) -> int:
+    """Return the number of matches played in the given season by the teams that played the most of them.
+    A skew of most_improved_teams must be less than this count minus one for any team to be considered.
 
     Preconditions:
-        - season is in the format '20XX-XX' between 2009-10 and 2018-19 or season is None
-        - topx > 0
+        - season in league.get_seasons()
     """
-    matches = get_all_matches(league)
-    comebacks = []
+    return get_winrate_progressions(league, season)[1].shape[1]
 
-    for match in matches:
-        if season is None or match.season == season:
-            ht_name, at_name = match.home_team.name, match.away_team.name
-
-            half_time, full_time = {
-                ht_name: match.details[ht_name].half_time_goals,
-                at_name: match.details[at_name].half_time_goals,
-            }, {
-                ht_name: match.details[ht_name].full_time_goals,
-                at_name: match.details[at_name].full_time_goals,
-            }
-
-            if half_time[at_name] == half_time[ht_name]:
-                continue
-            elif half_time[at_name] > half_time[ht_name]:
-                ht_winner = at_name
-                ht_loser = ht_name
-            else:
-                ht_winner = ht_name
-                ht_loser = at_name
-
-            ht_score = f"{half_time[ht_loser]} - {half_time[ht_winner]}"
-
-            if full_time[at_name] == full_time[ht_name]:
-                ft_draw_score = f"{full_time[ht_winner]} - {full_time[ht_loser]}"
-                comebacks.append(
-                    (f"{ht_loser} ({match.season})", ht_score, ft_draw_score, full_time[ht_name] - half_time[ht_loser])
-                )
-            elif full_time[at_name] > full_time[ht_name] and ht_loser == at_name:
-                ft_score = f"{full_time[at_name]} - {full_time[ht_name]}"
-                comebacks.append(
-                    (f"{at_name} ({match.season})", ht_score, ft_score, full_time[at_name] - half_time[ht_loser])
-                )
-            elif full_time[at_name] < full_time[ht_name] and ht_loser == ht_name:
-                ft_score = f"{full_time[ht_name]} - {full_time[at_name]}"
-                comebacks.append(
-                    (f"{ht_name} ({match.season})", ht_score, ft_score, full_time[ht_name] - half_time[ht_loser])
-                )
-
-    return sorted(comebacks, key=lambda clutch: clutch[3], reverse=True)[:topx]
-
-
-def _calculate_improvement_statistic(team: Team, season: str) -> tuple():
-    """Computed improvement statistic for the team in the specified season.
-
-    Return a tuple of the form (team name, worst winrate, final winrate, winrate improve)
-
-    The improvement statistic is calculated based on the computation described in most_improved_team.
-    worst winrate, final winrate, and winrate improve are rounded to two decimal places
+
+@memoize()
+def get_winrate_progressions(league: League, season: str) -> tuple[list[str], np.ndarray]:
+    """Return the names of the teams that played in the given season, and a matrix whose row i holds the winrate
+    percentage of team i after each of its matches of the season, where column j is its (j + 1)th match.
+    Rows of teams that played fewer matches than others end in nan.
+
+    The matrix is computed for every team at once, by placing each team's results at its matchday and taking
+    cumulative sums along the rows. It is shared between calls and must not be mutated.
 
     Preconditions:
-        - season is in the format '20XX-XX' between 2009-10 and 2018-19
+        - season in league.get_seasons()
     """
-    winrate_progression = _calculate_winrate_progression(team, season)
+    table = league.get_match_table()
+    rows = table.season_rows(season)
+    sides = slice(2 * rows.start, 2 * rows.stop)
+    teams = table.side_teams()[sides]
+    wins = table.side_results()[sides] == SIDE_WIN
 
-    SKEW_IGNORE = 8  # number of intial matches to ignore due to skew
-    final_winrate = winrate_progression[-1]
-    worst_winrate = float("inf")
-    for i in range(SKEW_IGNORE, len(winrate_progression) - 1):
-        if winrate_progression[i] < worst_winrate:
-            worst_winrate = winrate_progression[i]
+    # the matchday of each side is its position among the sides of the same team
+    order = np.argsort(teams, kind="stable")
+    sorted_teams = teams[order]
+    matchdays = np.empty(len(teams), dtype=np.int64)
+    matchdays[order] = np.arange(len(teams)) - np.searchsorted(sorted_teams, sorted_teams)
 
-    return (team.name, round(worst_winrate, 2), round(final_winrate, 2), round(final_winrate - worst_winrate, 2))
+    played_teams, matches_played = np.unique(teams, return_counts=True)
+    team_rows = np.searchsorted(played_teams, teams)
+    matchday_count = int(matches_played.max(initial=0))
 
+    wins_by_matchday = np.zeros((len(played_teams), matchday_count))
+    wins_by_matchday[team_rows, matchdays] = wins
+    progressions = (np.cumsum(wins_by_matchday, axis=1) / np.arange(1, matchday_count + 1)) * 100
+    progressions[np.arange(matchday_count)[np.newaxis, :] >= matches_played[:, np.newaxis]] = np.nan
 
-def _calculate_winrate_progression(team: Team, season: str) -> list[float]:
-    """Return a list of the team's winrate after each match in the specified season.
+    return [table.team_names[team_id] for team_id in played_teams], progressions
 
-    The returned list will always be of length 38 - which is the total number of matches
-    a team plays in a season of the Premier League.
+
+@memoize()
+def best_comebacks(league: League, season: Optional[str] = None, topx: int = 4) -> list[tuple[str, str, int]]:
+    """Return a list of the best comebacks in the specified season. The comebacks are
+    calculated only for the teams that are initially losing in the first half that end
+    up winning or drawing the game.
 
     Preconditions:
-        - season is in the format '20XX-XX' between 2009-10 and 2018-19
+        - season is None or season in league.get_seasons()
+        - topx > 0
     """
-    matches_won = 0
-    matches_played = 0
-    winrate_progression = []
-
-    for match in team.matches:
-        if match.season != season:
-            continue
-        matches_played += 1
-        if match.result == team:
-            matches_won += 1
-        winrate = (matches_won / matches_played) * 100
-        winrate_progression.append(winrate)
-
-    return winrate_progression
-
+    table = league.get_match_table()
+    rows = table.season_rows(season)
+    home_half_time = table.home_stats["half_time_goals"][rows]
+    away_half_time = table.away_stats["half_time_goals"][rows]
+    home_full_time = table.home_stats["full_time_goals"][rows]
+    away_full_time = table.away_stats["full_time_goals"][rows]
+
+    # the team losing at half time came back if it drew or won the match
+    home_behind = home_half_time < away_half_time
+    away_behind = away_half_time < home_half_time
+    came_back = (home_behind & (home_full_time >= away_full_time)) | (away_behind & (away_full_time >= home_full_time))
+
+    candidates = np.flatnonzero(came_back)
+    home_behind = home_behind[candidates]
+    candidate_rows = candidates + rows.start
+    teams = np.where(home_behind, table.home_team[candidate_rows], table.away_team[candidate_rows])
+    team_half_time = np.where(home_behind, home_half_time[candidates], away_half_time[candidates])
+    opponent_half_time = np.where(home_behind, away_half_time[candidates], home_half_time[candidates])
+    team_full_time = np.where(home_behind, home_full_time[candidates], away_full_time[candidates])
+    opponent_full_time = np.where(home_behind, away_full_time[candidates], home_full_time[candidates])
+    second_half_goals = team_full_time - team_half_time
 
+    comebacks = []
+    for i in top_k_indices(second_half_goals, topx):
+        comebacks.append(
+            (
+                f"{table.team_names[teams[i]]} ({table.season_names[table.season[candidate_rows[i]]]})",
+                f"{team_half_time[i]} - {opponent_half_time[i]}",
+                f"{team_full_time[i]} - {opponent_full_time[i]}",
+                int(second_half_goals[i]),
+            )
+        )
+    return comebacks
+
+
+@memoize()
 def highest_win_rate(league: League, season: Optional[str] = None, topx: int = 4) -> list[tuple[str, float]]:
     """Return a list of the topx teams with the highest win rate in the league. Consider season statistics
     if provided. Otherwise, consider statistics from all seasons.
 
     Preconditions:
-        - season is in the format '20XX-XX' between 2009-10 and 2018-19 or season is None
+        - season is None or season in league.get_seasons()
         - topx > 0
     """
-    names = league.get_team_names()
+    cube = league.get_stats_cube()
+    matches_played = cube.get("matches", season)
+    wins = cube.get("wins", season)
+
     win_rates = []
-    for name in names:
-        if season is None or season in league.get_team(name).seasons:
-            win_rates.append((name, round(overall_winrate(league, name, season), 2)))
+    for team_id in np.flatnonzero(matches_played):
+        win_rates.append((cube.team_names[team_id], round(float((wins[team_id] / matches_played[team_id]) * 100), 2)))
+
+    return top_k(win_rates, topx, key=lambda win_rate: win_rate[1])
+
+
+def _longest_runs(groups: np.ndarray, values: np.ndarray, group_count: int) -> np.ndarray:
+    """Return the length of the longest run of consecutive True values in each group, indexed by group id,
+    where groups holds the group id of each value and each group's values are in order.
+
+    The runs are found in a single vectorised pass: the values are ordered by group, a run starts at every
+    True value that does not continue a run of the same group, and the lengths of the runs are counted by
+    numbering them in order.
+
+    Preconditions:
+        - len(groups) == len(values)
+        - all(0 <= group < group_count for group in groups)
+    """
+    order = np.argsort(groups, kind="stable")
+    groups, values = groups[order], values[order]
+
+    run_starts = values.copy()
+    run_starts[1:] &= ~values[:-1] | (groups[1:] != groups[:-1])
+    run_ids = np.cumsum(run_starts) - 1
+    run_lengths = np.bincount(run_ids[values], minlength=int(run_starts.sum()))
 
-    return sorted(win_rates, key=lambda win_rate: win_rate[1], reverse=True)[:topx]
+    longest_runs = np.zeros(group_count, dtype=np.int64)
+    np.maximum.at(longest_runs, groups[run_starts], run_lengths)
+    return longest_runs
@@ -8,25 +8,43 @@ This file is Copyright (c) 2023 Ram Raghav Sharma, Harshith Latchupatula, Vikram
 from __future__ import annotations
 from typing import Optional
 
-from harshithl1777_kickoff.models.match import Match
+from harshithl1777_kickoff.models.match import Match, insert_match
+from harshithl1777_kickoff.models.match_table import MatchTable
+from harshithl1777_kickoff.models.referee_index import RefereeIndex
+from harshithl1777_kickoff.models.stats_cube import StatsCube
 from harshithl1777_kickoff.models.team import Team
 
 
 class League:
-    """A graph-based representation of Premier League matches and teams.
+    """A graph-based representation of the matches and teams of a football division.
 
     Instance Attributes:
         - teams: A mapping containing the teams playing in this season and the corresponding Team object.
-        - matches: A chronologically ordered list of all matches played in this season.
+        - matches: A chronologically ordered list of all matches played in this league.
+        - season_matches: A mapping from each season to a chronologically ordered list of its matches.
 
     Representation Invariants:
         - all({ name == self.teams[name].name for name in self.teams })
     """
 
     _teams: dict[str, Team]
+    _matches: list[Match]
+    _season_matches: dict[str, list[Match]]
+    _match_table: Optional[MatchTable]
+    _pending_matches: list[Match]
+    _stats_cube: Optional[StatsCube]
+    _referee_index: Optional[RefereeIndex]
+    _version: int
 
     def __init__(self) -> None:
         self._teams = {}
+        self._matches = []
+        self._season_matches = {}
+        self._match_table = None
+        self._pending_matches = []
+        self._stats_cube = None
+        self._referee_index = None
+        self._version = 0
 
     def add_team(self, name: str) -> Team:
         """Add a new team with the given team name to this league and return it.
@@ -36,6 +54,7 @@ class League:
         """
         team = Team(name=name, matches=[], seasons=set())
         self._teams[name] = team
+        self._version += 1
         return team
 
     def add_season_to_team(self, team: str, season: str) -> None:
@@ -43,12 +62,15 @@ class League:
 
         Preconditions
             - name in self._teams
-            - season is a season string in the format '20XX-XX' between 2009-10 and 2018-19
+            - season is a season string in the format '20XX-XX'
         """
-        self._teams[team].seasons.add(season)
+        seasons = self._teams[team].seasons
+        if season not in seasons:
+            seasons.add(season)
+            self._version += 1
 
     def add_match(self, team1: str, team2: str, match: Match) -> None:
-        """Add a new match between the two given teams.
+        """Add a new match between the two given teams, keeping the league's matches chronologically ordered.
         Add each team to the league if they have not been added already.
 
         Preconditions
@@ -61,8 +83,17 @@ class League:
         if team2 not in self._teams:
             self.add_team(team2)
 
-        self._teams[team1].matches.append(match)
-        self._teams[team2].matches.append(match)
+        self._teams[team1].add_match(match)
+        self._teams[team2].add_match(match)
+        insert_match(self._matches, match)
+        insert_match(self._season_matches.setdefault(match.season, []), match)
+        if self._match_table is not None:
+            self._pending_matches.append(match)
+        self._version += 1
+
+    def get_version(self) -> int:
+        """Return the version of this league, which changes every time a team, season or match is added to it."""
+        return self._version
 
     def team_in_league(self, name: str) -> bool:
         """Check if the given team exists within this league by the given name"""
@@ -81,10 +112,70 @@ class League:
         then this function will only return teams that have played in that season.
 
         Preconditions:
-            - season is a season string in the format '20XX-XX' between 2009-10 and 2018-19 or season is None
+            - season is a season string in the format '20XX-XX' or season is None
         """
         team_names = list(self._teams.keys())
         if season is None:
             return team_names
 
         return [team_name for team_name in team_names if season in self.get_team(team_name).seasons]
+
+    def get_seasons(self) -> list[str]:
+        """Return the seasons in which matches were played in this league, in chronological order."""
+        return sorted(self._season_matches)
+
+    def get_matches(self, season: Optional[str] = None) -> list[Match]:
+        """Return the chronologically ordered list of matches in the league. If the season attribute is provided
+        then this function will only return matches played in that season.
+
+        The returned list is the league's own index and must not be mutated.
+
+        Preconditions:
+            - season is a season string in the format '20XX-XX' or season is None
+        """
+        if season is None:
+            return self._matches
+        return self._season_matches.get(season, [])
+
+    def get_match_table(self) -> MatchTable:
+        """Return a columnar MatchTable of every match in the league.
+
+        The table is built on first access and brought up to date the next time it is accessed after the league
+        changes, so it is always in sync with the graph. Matches played after every match already in the table
+        are appended to it, and the table is only rebuilt from scratch when earlier matches were added.
+        """
+        table = self._match_table
+        if table is not None and (self._pending_matches or len(table.team_names) != len(self._teams)):
+            new_matches = sorted(self._pending_matches, key=lambda match: (match.season, match.order))
+            if not table.extend(new_matches, list(self._teams)):
+                self._match_table = None
+            self._pending_matches = []
+
+        if self._match_table is None:
+            ordered_matches = sorted(self._matches, key=lambda match: (match.season, match.order))
+            self._match_table = MatchTable(ordered_matches, list(self._teams))
+        return self._match_table
+
+    def get_stats_cube(self) -> StatsCube:
+        """Return a StatsCube of the per team, season and venue sums of every match in the league.
+
+        The cube is built from the MatchTable on first access and rebuilt the next time it is accessed after
+        the league changes.
+        """
+        table = self.get_match_table()
+        cube = self._stats_cube
+        if cube is None or cube.match_count != len(table) or len(cube.team_names) != len(table.team_names):
+            self._stats_cube = StatsCube(table)
+        return self._stats_cube
+
+    def get_referee_index(self) -> RefereeIndex:
+        """Return a RefereeIndex of the per referee, team and season counts of every match in the league.
+
+        The index is built from the MatchTable on first access and rebuilt the next time it is accessed after
+        the league changes.
+        """
+        table = self.get_match_table()
+        index = self._referee_index
+        if index is None or index.match_count != len(table) or len(index.team_names) != len(table.team_names):
+            self._referee_index = RefereeIndex(table)
+        return self._referee_index
@@ -6,6 +6,8 @@ This file is Copyright (c) 2023 Ram Raghav Sharma, Harshith Latchupatula, Vikram
 """
 
 from __future__ import annotations
+import bisect
+import sys
 from typing import Optional
 from dataclasses import dataclass
 
@@ -13,28 +15,31 @@ from harshithl1777_kickoff.models.team import Team
 
 
 class Match:
-    """A Premier League match between two teams in a particular season.
+    """A football match between two teams in a particular season.
 
         Instance Attributes:
             - home_team: The team playing at its home ground in this match.
             - away_team: The team playing away from its home ground in this match.
             - order: The order in which this game is played in the corresonding season.
-            - details: A mapping from each team name to its corresponding match details.
+            - home_details: The match details of the home team.
+            - away_details: The match details of the away team.
             - result: The team that won the match or None if the match was a draw
 
         Representation Invariants:
-            - self.season in {'2009-10', '2010-11', '2011-12', '2012-13', '2013-14', '2014-15', '2015-16', '2016-17', \
-            '2017-18', '2018-19'}
+            - self.season is a season string in the format '20XX-XX'
             - self.result in {self.home_team, self.away_team}
-            - self.home_team.name in self.details and self.away_team.name in self.details
+            - self.home_details.team is self.home_team and self.away_details.team is self.away_team
             - 1 <= self.order
     """
 
+    __slots__ = ("season", "home_team", "away_team", "order", "home_details", "away_details", "result")
+
     season: str
     home_team: Team
     away_team: Team
     order: int
-    details: dict[str, MatchDetails]
+    home_details: MatchDetails
+    away_details: MatchDetails
     result: Optional[Team]
 
     def __init__(
@@ -43,16 +48,36 @@ class Match:
         home_team: Team,
         away_team: Team,
         order: int,
-        details: dict[str, MatchDetails],
+        home_details: MatchDetails,
+        away_details: MatchDetails,
         result: Optional[Team],
     ) -> None:
-        self.season = season
+        self.season = sys.intern(season)
         self.home_team = home_team
         self.away_team = away_team
         self.order = order
-        self.details = details
+        self.home_details = home_details
+        self.away_details = away_details
         self.result = result
 
+    @property
+    def details(self) -> dict[str, MatchDetails]:
+        """A mapping from each team name to its corresponding match details.
+
+        This mapping is built on every access, so prefer get_details or home_details / away_details.
+        """
+        return {self.home_team.name: self.home_details, self.away_team.name: self.away_details}
+
+    def get_details(self, team_name: str) -> MatchDetails:
+        """Return the match details of the team with the given name.
+
+        Preconditions:
+            - team_name in {self.home_team.name, self.away_team.name}
+        """
+        if team_name == self.home_team.name:
+            return self.home_details
+        return self.away_details
+
     def get_other_team(self, known_team: Team) -> Team:
         """Return the other team that played in this match.
 
@@ -67,9 +92,23 @@ class Match:
         return f"Home: {self.home_team.name} vs Away: {self.away_team.name}"
 
 
-@dataclass(repr=True)
+def insert_match(matches: list[Match], new_match: Match) -> None:
+    """Insert the given match into the given chronologically ordered list of matches, keeping it ordered.
+
+    Matches are almost always added in chronological order, in which case the match is simply appended.
+
+    Preconditions:
+        - matches is sorted by (season, order)
+    """
+    if not matches or (matches[-1].season, matches[-1].order) <= (new_match.season, new_match.order):
+        matches.append(new_match)
+    else:
+        bisect.insort(matches, new_match, key=lambda match: (match.season, match.order))
+
+
+@dataclass(repr=True, slots=True)
 class MatchDetails:
-    """The details of a team's performance in a Premier League match.
+    """The details of a team's performance in a football match.
 
     Instance Attributes:
         - team: The team this MatchDetails refers to
@@ -80,7 +119,8 @@ class MatchDetails:
         - yellow_cards: number of yellow cards given to the team in the match
         - half_time_goals: number of goals scored by the team at half time
         - full_time_goals: number of goals scored by the team at full time
-        - referee: the name of the referee that officiated this match
+        - referee: the name of the referee that officiated this match, interned so that both sides of the
+          match and every match with the same referee share one string
 
     Representation Invariants:
         ...
@@ -0,0 +1,222 @@
+"""Kickoff Project: models / match_table.py
+
+This module contains the MatchTable class.
+
+This file is Copyright (c) 2023 Ram Raghav Sharma, Harshith Latchupatula, Vikram Makkar and Muhammad Ibrahim.
+"""
+
+from __future__ import annotations
+from typing import Optional
+
+import numpy as np
+
+from harshithl1777_kickoff.models.match import Match
+
+RESULT_HOME = 0
+RESULT_DRAW = 1
+RESULT_AWAY = 2
+
+# the result of a match from the perspective of one side of it
+SIDE_WIN = 0
+SIDE_DRAW = 1
+SIDE_LOSS = 2
+
+# the MatchDetails statistics stored for each side of a match
+DETAIL_STATS = [
+    "fouls",
+    "shots",
+    "shots_on_target",
+    "red_cards",
+    "yellow_cards",
+    "half_time_goals",
+    "full_time_goals",
+]
+
+
+class MatchTable:
+    """A columnar representation of every match in a League, where each attribute of a match is stored
+    as a typed NumPy array with one element per match. Teams, referees and seasons are interned to small
+    integers that index into team_names, referee_names and season_names.
+
+    This lets statistics over many matches be computed with vectorised masks and group-bys rather than
+    by walking the Match objects one at a time.
+
+    Instance Attributes:
+        - matches: The matches in this table, in chronological order. Row i of every column describes matches[i].
+        - team_names: The names of the teams, indexed by team id.
+        - referee_names: The names of the referees, indexed by referee id.
+        - season_names: The seasons, indexed by season id. Season ids are in chronological order.
+        - team_ids: A mapping from each team name to its team id.
+        - season: The season id of each match.
+        - order: The order in which each match was played in its season.
+        - home_team: The team id of the home team of each match.
+        - away_team: The team id of the away team of each match.
+        - referee: The referee id of each match.
+        - result: The result of each match, one of RESULT_HOME, RESULT_DRAW or RESULT_AWAY.
+        - home_stats: A mapping from each name in DETAIL_STATS to the home team's value of it in each match.
+        - away_stats: A mapping from each name in DETAIL_STATS to the away team's value of it in each match.
+
+    Representation Invariants:
+        - all(len(column) == len(self.matches) for column in self.home_stats.values())
+        - all(len(column) == len(self.matches) for column in self.away_stats.values())
+        - self.season_names == sorted(self.season_names)
+    """
+
+    matches: list[Match]
+    team_names: list[str]
+    referee_names: list[str]
+    season_names: list[str]
+    team_ids: dict[str, int]
+    season: np.ndarray
+    order: np.ndarray
+    home_team: np.ndarray
+    away_team: np.ndarray
+    referee: np.ndarray
+    result: np.ndarray
+    home_stats: dict[str, np.ndarray]
+    away_stats: dict[str, np.ndarray]
+
+    def __init__(self, matches: list[Match], team_names: list[str]) -> None:
+        """Build the table from the given chronologically ordered matches played by the given teams."""
+        self.matches = matches
+        self.team_names = team_names
+        self.team_ids = {name: i for i, name in enumerate(team_names)}
+        self.season_names = sorted({match.season for match in matches})
+        season_ids = {season: i for i, season in enumerate(self.season_names)}
+
+        referee_ids = {}
+        for match in matches:
+            referee_ids.setdefault(match.home_details.referee, len(referee_ids))
+        self.referee_names = list(referee_ids)
+
+        self.season = np.array([season_ids[match.season] for match in matches], dtype=np.int16)
+        self.order = np.array([match.order for match in matches], dtype=np.int16)
+        self.home_team = np.array([self.team_ids[match.home_team.name] for match in matches], dtype=np.int16)
+        self.away_team = np.array([self.team_ids[match.away_team.name] for match in matches], dtype=np.int16)
+        self.referee = np.array(
+            [referee_ids[match.home_details.referee] for match in matches], dtype=np.int16
+        )
+        self.result = np.array([_result_code(match) for match in matches], dtype=np.int8)
+
+        home_details = [match.home_details for match in matches]
+        away_details = [match.away_details for match in matches]
+        self.home_stats = {}
+        self.away_stats = {}
+        for stat in DETAIL_STATS:
+            self.home_stats[stat] = np.array([getattr(details, stat) for details in home_details], dtype=np.int16)
+            self.away_stats[stat] = np.array([getattr(details, stat) for details in away_details], dtype=np.int16)
+
+    def extend(self, matches: list[Match], team_names: list[str]) -> bool:
+        """Append the given chronologically ordered matches to this table, where team_names extends this table's
+        team names with any new teams. Return whether the matches could be appended.
+
+        Matches can only be appended if they were all played after the last match in this table, so that the
+        table stays in chronological order and existing season ids stay valid. Otherwise the table is unchanged.
+
+        Preconditions:
+            - team_names[:len(self.team_names)] == self.team_names
+        """
+        if matches and self.matches:
+            last_match = self.matches[-1]
+            if (matches[0].season, matches[0].order) < (last_match.season, last_match.order):
+                return False
+
+        self.team_names = team_names
+        self.team_ids = {name: i for i, name in enumerate(team_names)}
+        if not matches:
+            return True
+
+        for season in sorted({match.season for match in matches}):
+            if season not in self.season_names:
+                self.season_names.append(season)
+        season_ids = {season: i for i, season in enumerate(self.season_names)}
+        referee_ids = {name: i for i, name in enumerate(self.referee_names)}
+        for match in matches:
+            referee_ids.setdefault(match.home_details.referee, len(referee_ids))
+        self.referee_names = list(referee_ids)
+
+        self.matches = self.matches + matches
+        self.season = _append(self.season, [season_ids[match.season] for match in matches])
+        self.order = _append(self.order, [match.order for match in matches])
+        self.home_team = _append(self.home_team, [self.team_ids[match.home_team.name] for match in matches])
+        self.away_team = _append(self.away_team, [self.team_ids[match.away_team.name] for match in matches])
+        self.referee = _append(self.referee, [referee_ids[match.home_details.referee] for match in matches])
+        self.result = _append(self.result, [_result_code(match) for match in matches])
+        for stat in DETAIL_STATS:
+            self.home_stats[stat] = _append(self.home_stats[stat], [getattr(m.home_details, stat) for m in matches])
+            self.away_stats[stat] = _append(self.away_stats[stat], [getattr(m.away_details, stat) for m in matches])
+        return True
+
+    def __len__(self) -> int:
+        return len(self.matches)
+
+    def season_mask(self, season: str) -> np.ndarray:
+        """Return a boolean mask selecting the matches played in the given season.
+
+        Preconditions:
+            - season is a season string in the format '20XX-XX'
+        """
+        if season not in self.season_names:
+            return np.zeros(len(self.matches), dtype=bool)
+        return self.season == self.season_names.index(season)
+
+    def season_rows(self, season: Optional[str] = None) -> slice:
+        """Return the slice of rows holding the matches played in the given season, or every row if season is None.
+        The matches of a season are contiguous, as the table is in chronological order and season ids are too.
+        """
+        if season is None:
+            return slice(0, len(self.matches))
+        if season not in self.season_names:
+            return slice(0, 0)
+        season_id = self.season_names.index(season)
+        start, stop = np.searchsorted(self.season, [season_id, season_id + 1])
+        return slice(int(start), int(stop))
+
+    def team_mask(self, team_name: str) -> np.ndarray:
+        """Return a boolean mask selecting the matches played by the team with the given name.
+
+        Preconditions:
+            - team_name in self.team_ids
+        """
+        team_id = self.team_ids[team_name]
+        return (self.home_team == team_id) | (self.away_team == team_id)
+
+    def side_teams(self) -> np.ndarray:
+        """Return the team id of each side of each match, where the home side of match i is at index 2 * i
+        and the away side at index 2 * i + 1. Grouping by this column visits each team's matches in
+        chronological order.
+        """
+        return np.column_stack([self.home_team, self.away_team]).ravel()
+
+    def side_stats(self, stat: str) -> np.ndarray:
+        """Return the value of the given statistic for each side of each match, in the order of side_teams.
+
+        Preconditions:
+            - stat in DETAIL_STATS
+        """
+        return np.column_stack([self.home_stats[stat], self.away_stats[stat]]).ravel()
+
+    def side_results(self) -> np.ndarray:
+        """Return the result of each match from the perspective of each side of it, one of SIDE_WIN, SIDE_DRAW
+        or SIDE_LOSS, in the order of side_teams.
+        """
+        home_results = np.choose(self.result, [SIDE_WIN, SIDE_DRAW, SIDE_LOSS]).astype(np.int8)
+        return np.column_stack([home_results, 2 - home_results]).ravel()
+
+    def side_mask(self, mask: np.ndarray) -> np.ndarray:
+        """Return the given mask over matches as a mask over the sides of matches, in the order of side_teams."""
+        return np.repeat(mask, 2)
+
+
+def _result_code(match: Match) -> int:
+    """Return the result code of the given match."""
+    if match.result is None:
+        return RESULT_DRAW
+    if match.result is match.home_team:
+        return RESULT_HOME
+    return RESULT_AWAY
+
+
+def _append(column: np.ndarray, values: list) -> np.ndarray:
+    """Return the given column with the given values appended, keeping its dtype."""
+    return np.concatenate([column, np.array(values, dtype=column.dtype)])
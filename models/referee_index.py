@@ -0,0 +1,112 @@
+"""Kickoff Project: models / referee_index.py
+
+This module contains the RefereeIndex class.
+
+This file is Copyright (c) 2023 Ram Raghav Sharma, Harshith Latchupatula, Vikram Makkar and Muhammad Ibrahim.
+"""
+
+from __future__ import annotations
+from typing import Optional
+
+import numpy as np
+
+from harshithl1777_kickoff.models.match_table import SIDE_DRAW, SIDE_LOSS, SIDE_WIN, MatchTable
+
+# the statistics counted for each referee, team and season, from the perspective of the team
+REFEREE_STATS = ["games", "wins", "draws", "losses", "fouls", "yellow_cards", "red_cards"]
+
+
+class RefereeIndex:
+    """The counts of each statistic in REFEREE_STATS over the matches each team played under each referee in
+    each season, built from a MatchTable in a single vectorised pass.
+
+    The index is sparse: it only holds an entry for each (referee, team, season) that occurs in a match, sorted
+    by referee, then team, then season, so the entries of each (referee, team) pair are contiguous.
+
+    Instance Attributes:
+        - referee_names: The names of the referees, indexed by referee id as in the MatchTable.
+        - team_names: The names of the teams, indexed by team id as in the MatchTable.
+        - season_names: The seasons, indexed by season id as in the MatchTable.
+        - team_ids: A mapping from each team name to its team id.
+        - match_count: The number of matches the index was built from.
+        - referee: The referee id of each entry.
+        - team: The team id of each entry.
+        - season: The season id of each entry.
+        - values: An array of shape (entries, len(REFEREE_STATS)) holding the count of each statistic.
+        - first_win: The position of the first match of each entry that the team won, counting the home and
+          away side of each match separately, or 2 * match_count if the team never won under the referee.
+
+    Representation Invariants:
+        - len(self.referee) == len(self.team) == len(self.season) == len(self.values) == len(self.first_win)
+    """
+
+    referee_names: list[str]
+    team_names: list[str]
+    season_names: list[str]
+    team_ids: dict[str, int]
+    match_count: int
+    referee: np.ndarray
+    team: np.ndarray
+    season: np.ndarray
+    values: np.ndarray
+    first_win: np.ndarray
+
+    def __init__(self, table: MatchTable) -> None:
+        """Build the index from the given MatchTable."""
+        self.referee_names = list(table.referee_names)
+        self.team_names = list(table.team_names)
+        self.season_names = list(table.season_names)
+        self.team_ids = dict(table.team_ids)
+        self.match_count = len(table)
+
+        teams = table.side_teams()
+        results = table.side_results()
+        shape = (len(self.referee_names), len(self.team_names), len(self.season_names))
+        keys = np.ravel_multi_index((table.side_mask(table.referee), teams, table.side_mask(table.season)), shape)
+        entry_keys, entries = np.unique(keys, return_inverse=True)
+        self.referee, self.team, self.season = (ids.astype(np.int16) for ids in np.unravel_index(entry_keys, shape))
+
+        weights = {
+            "games": np.ones(len(teams)),
+            "wins": results == SIDE_WIN,
+            "draws": results == SIDE_DRAW,
+            "losses": results == SIDE_LOSS,
+            "fouls": table.side_stats("fouls"),
+            "yellow_cards": table.side_stats("yellow_cards"),
+            "red_cards": table.side_stats("red_cards"),
+        }
+        self.values = np.column_stack(
+            [np.bincount(entries, weights=weights[stat], minlength=len(entry_keys)) for stat in REFEREE_STATS]
+        ).astype(np.int32)
+
+        won = results == SIDE_WIN
+        self.first_win = np.full(len(entry_keys), len(teams), dtype=np.int64)
+        np.minimum.at(self.first_win, entries[won], np.flatnonzero(won))
+
+    def get(self, team_name: Optional[str] = None, season: Optional[str] = None) -> dict[str, np.ndarray]:
+        """Return the statistics of each (referee, team) pair over the matches played in the given season, or
+        in every season if it is None, and only of the given team if it is not None.
+
+        The result maps 'referee' and 'team' to the ids of each pair, each name in REFEREE_STATS to its count,
+        and 'first_win' to the position of the team's first win under the referee, as in self.first_win.
+        Pairs are sorted by referee, then team.
+        """
+        selected = np.ones(len(self.referee), dtype=bool)
+        if team_name is not None:
+            selected &= self.team == self.team_ids[team_name]
+        if season is not None:
+            season_id = self.season_names.index(season) if season in self.season_names else -1
+            selected &= self.season == season_id
+
+        entries = np.flatnonzero(selected)
+        if len(entries) == 0:
+            return {stat: np.zeros(0, dtype=np.int64) for stat in ["referee", "team", *REFEREE_STATS, "first_win"]}
+
+        referees, teams = self.referee[entries], self.team[entries]
+        pair_starts = np.flatnonzero(np.r_[True, (referees[1:] != referees[:-1]) | (teams[1:] != teams[:-1])])
+        stats = {"referee": referees[pair_starts], "team": teams[pair_starts]}
+        pair_values = np.add.reduceat(self.values[entries], pair_starts, axis=0)
+        for i, stat in enumerate(REFEREE_STATS):
+            stats[stat] = pair_values[:, i]
+        stats["first_win"] = np.minimum.reduceat(self.first_win[entries], pair_starts)
+        return stats
@@ -0,0 +1,155 @@
+"""Kickoff Project: models / stats_cube.py
+
+This module contains the StatsCube class.
+
+This file is Copyright (c) 2023 Ram Raghav Sharma, Harshith Latchupatula, Vikram Makkar and Muhammad Ibrahim.
+"""
+
+from __future__ import annotations
+from typing import Optional
+
+import numpy as np
+
+from harshithl1777_kickoff.models.match_table import SIDE_DRAW, SIDE_LOSS, SIDE_WIN, MatchTable
+
+VENUE_HOME = 0
+VENUE_AWAY = 1
+
+# the statistics summed in each cell of the cube, from the perspective of the team of the cell
+CUBE_STATS = [
+    "matches",
+    "wins",
+    "draws",
+    "losses",
+    "goals_for",
+    "goals_against",
+    "shots",
+    "shots_on_target",
+    "fouls",
+    "yellow_cards",
+    "red_cards",
+    "accuracy",
+    "accuracy_matches",
+]
+
+
+class StatsCube:
+    """The sums of each statistic in CUBE_STATS over the matches played by each team in each season at each
+    venue, built from a MatchTable in a single vectorised pass.
+
+    A query for one season reads a (team,) slice of the cube, and a query over all seasons or both venues
+    sums over those axes, so aggregate queries take time proportional to the number of teams rather than
+    the number of matches.
+
+    The accuracy statistic is the sum of shots_on_target / shots over the matches in which the team took a
+    shot, and accuracy_matches is the number of those matches.
+
+    Instance Attributes:
+        - team_names: The names of the teams, indexed by team id as in the MatchTable.
+        - season_names: The seasons, indexed by season id as in the MatchTable.
+        - team_ids: A mapping from each team name to its team id.
+        - match_count: The number of matches the cube was built from.
+        - values: An array of shape (teams, seasons, 2, len(CUBE_STATS)) holding the sum of each statistic
+          for each team, season and venue, where venue is VENUE_HOME or VENUE_AWAY.
+        - first_appearance: An array of shape (teams, seasons) holding the position of each team's first
+          match of each season, counting the home and away side of each match separately, or 2 * match_count
+          if the team did not play in that season.
+
+    Representation Invariants:
+        - self.values.shape == (len(self.team_names), len(self.season_names), 2, len(CUBE_STATS))
+        - self.first_appearance.shape == self.values.shape[:2]
+    """
+
+    team_names: list[str]
+    season_names: list[str]
+    team_ids: dict[str, int]
+    match_count: int
+    values: np.ndarray
+    first_appearance: np.ndarray
+
+    def __init__(self, table: MatchTable) -> None:
+        """Build the cube from the given MatchTable."""
+        self.team_names = list(table.team_names)
+        self.season_names = list(table.season_names)
+        self.team_ids = dict(table.team_ids)
+        self.match_count = len(table)
+
+        teams = table.side_teams()
+        seasons = table.side_mask(table.season)
+        venues = np.tile(np.array([VENUE_HOME, VENUE_AWAY]), len(table))
+        results = table.side_results()
+        goals_against = np.column_stack([table.away_stats["full_time_goals"], table.home_stats["full_time_goals"]])
+        shots = table.side_stats("shots")
+        shots_on_target = table.side_stats("shots_on_target")
+        shot_taken = shots > 0
+
+        weights = {
+            "matches": np.ones(len(teams)),
+            "wins": results == SIDE_WIN,
+            "draws": results == SIDE_DRAW,
+            "losses": results == SIDE_LOSS,
+            "goals_for": table.side_stats("full_time_goals"),
+            "goals_against": goals_against.ravel(),
+            "shots": shots,
+            "shots_on_target": shots_on_target,
+            "fouls": table.side_stats("fouls"),
+            "yellow_cards": table.side_stats("yellow_cards"),
+            "red_cards": table.side_stats("red_cards"),
+            "accuracy": np.divide(shots_on_target, shots, out=np.zeros(len(teams)), where=shot_taken),
+            "accuracy_matches": shot_taken,
+        }
+
+        shape = (len(self.team_names), len(self.season_names), 2)
+        cells = np.ravel_multi_index((teams, seasons, venues), shape)
+        self.values = np.stack(
+            [np.bincount(cells, weights=weights[stat], minlength=int(np.prod(shape))) for stat in CUBE_STATS],
+            axis=-1,
+        ).reshape(shape + (len(CUBE_STATS),))
+
+        self.first_appearance = np.full(shape[:2], len(teams), dtype=np.int64)
+        np.minimum.at(self.first_appearance, (teams, seasons), np.arange(len(teams)))
+
+    def get(self, stat: str, season: Optional[str] = None, venue: Optional[int] = None) -> np.ndarray:
+        """Return the sum of the given statistic for each team, indexed by team id, over the matches played in
+        the given season at the given venue. If the season or venue is None, sum over every season or venue.
+
+        Preconditions:
+            - stat in CUBE_STATS
+            - venue in {None, VENUE_HOME, VENUE_AWAY}
+        """
+        values = self.values[..., CUBE_STATS.index(stat)]
+        if season is None:
+            values = values.sum(axis=1)
+        elif season in self.season_names:
+            values = values[:, self.season_names.index(season)]
+        else:
+            values = np.zeros((len(self.team_names), 2))
+
+        if venue is None:
+            return values.sum(axis=1)
+        return values[:, venue]
+
+    def get_team(self, stat: str, team_name: str, season: Optional[str] = None, venue: Optional[int] = None) -> float:
+        """Return the sum of the given statistic for the team with the given name, as described in get.
+
+        Preconditions:
+            - stat in CUBE_STATS
+            - team_name in self.team_ids
+            - venue in {None, VENUE_HOME, VENUE_AWAY}
+        """
+        return float(self.get(stat, season, venue)[self.team_ids[team_name]])
+
+    def get_teams_by_appearance(self, season: Optional[str] = None) -> list[int]:
+        """Return the ids of the teams that played in the given season, or in any season if it is None,
+        in the order in which they played their first match of it.
+        """
+        not_played = 2 * self.match_count
+        if season is None:
+            first_sides = self.first_appearance.min(axis=1, initial=not_played)
+        elif season in self.season_names:
+            first_sides = self.first_appearance[:, self.season_names.index(season)]
+        else:
+            return []
+
+        played = np.flatnonzero(first_sides < not_played)
+        return [int(team_id) for team_id in played[np.argsort(first_sides[played], kind="stable")]]
@@ -6,25 +6,63 @@ This file is Copyright (c) 2023 Ram Raghav Sharma, Harshith Latchupatula, Vikram
 """
 
 from __future__ import annotations
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from typing import Optional
 import harshithl1777_kickoff.models.match as match
 
 
-@dataclass
+@dataclass(slots=True)
 class Team:
-    """A football team playing in a particular season of the Premier League.
+    """A football team playing in particular seasons of a football division.
 
     Instance Attributes:
         - name: The name of this team.
         - matches: A chronologically ordered list of the matches played by this team in the season.
         - seasons: The seasons this team has participated in.
+        - season_matches: A mapping from each season to the chronologically ordered matches played in it.
+        - venue_matches: A mapping from each (season, venue) pair to the chronologically ordered matches
+          played at that venue in that season, where venue is 'home' or 'away' and a season of None
+          stands for all seasons.
 
     Representation Invariants:
         - len(self.matches) > 0
         - len(self.seasons) > 0
         - all({ self == match.home_team or self == match.away_team for match in self.matches })
+        - sum(len(matches) for matches in self.season_matches.values()) == len(self.matches)
     """
 
     name: str
     matches: list[match.Match]
     seasons: set[str]
+    season_matches: dict[str, list[match.Match]] = field(default_factory=dict, repr=False)
+    venue_matches: dict[tuple[Optional[str], str], list[match.Match]] = field(default_factory=dict, repr=False)
+
+    def add_match(self, new_match: match.Match) -> None:
+        """Add the given match to this team's matches and to each of its match indexes, keeping them
+        chronologically ordered.
+
+        Preconditions:
+            - self in {new_match.home_team, new_match.away_team}
+        """
+        venue = "home" if new_match.home_team is self else "away"
+        match.insert_match(self.matches, new_match)
+        match.insert_match(self.season_matches.setdefault(new_match.season, []), new_match)
+        match.insert_match(self.venue_matches.setdefault((None, venue), []), new_match)
+        match.insert_match(self.venue_matches.setdefault((new_match.season, venue), []), new_match)
+
+    def get_matches(self, season: Optional[str] = None, venue: Optional[str] = None) -> list[match.Match]:
+        """Return the chronologically ordered matches played by this team. If the season attribute is provided
+        then only matches played in that season are returned, and if the venue attribute is provided then only
+        matches played at that venue are returned.
+
+        The returned list is the team's own index and must not be mutated.
+
+        Preconditions:
+            - season is a season string in the format '20XX-XX' or season is None
+            - venue in {'home', 'away'} or venue is None
+        """
+        if venue is not None:
+            return self.venue_matches.get((season, venue), [])
+        if season is not None:
+            return self.season_matches.get(season, [])
+        return self.matches
@@ -0,0 +1,87 @@
+"""Kickoff Project: tests / conftest.py
+
+This module contains fixtures that build small Leagues for the tests.
+
+This file is Copyright (c) 2023 Ram Raghav Sharma, Harshith Latchupatula, Vikram Makkar and Muhammad Ibrahim.
+"""
+import random
+from typing import Callable, Optional
+
+import pytest
+
+from harshithl1777_kickoff.models.league import League
+from harshithl1777_kickoff.utils.constants import Constants
+from harshithl1777_kickoff.utils.load import convert_columns_to_graph
+
+Matches = list[tuple[str, str, int, int]]
+
+
+def _make_columns(matches: Matches, referees: Optional[list[str]] = None) -> dict[str, list]:
+    """Return the columns used to build the graph for the given matches, given as tuples of the home team,
+    the away team and the goals they scored, refereed by the given referees. Every other statistic is zero.
+    """
+    constants = Constants()
+    columns = {
+        "HomeTeam": [home for home, _, _, _ in matches],
+        "AwayTeam": [away for _, away, _, _ in matches],
+        "FTR": [
+            "H" if home_goals > away_goals else "A" if home_goals < away_goals else "D"
+            for _, _, home_goals, away_goals in matches
+        ],
+        "Referee": referees if referees is not None else ["M Dean"] * len(matches),
+    }
+    for column in constants.retrieve("HOME_DETAIL_COLUMNS") + constants.retrieve("AWAY_DETAIL_COLUMNS"):
+        columns[column] = [0] * len(matches)
+    columns["FTHG"] = [home_goals for _, _, home_goals, _ in matches]
+    columns["FTAG"] = [away_goals for _, _, _, away_goals in matches]
+    return columns
+
+
+def _build_league(seasons: dict[str, Matches]) -> League:
+    """Return a League of the given matches of each season, as described in _make_columns."""
+    league = League()
+    for season, matches in seasons.items():
+        convert_columns_to_graph(_make_columns(matches), league, season)
+    return league
+
+
+def _build_random_league(seed: int, season_count: int = 3, team_count: int = 6) -> League:
+    """Return a League of random matches, where every pair of teams plays home and away in each season under
+    one of a few referees, and every statistic is random.
+    """
+    generator = random.Random(seed)
+    constants = Constants()
+    teams = [f"Team {i}" for i in range(team_count)]
+    league = League()
+    for season_index in range(season_count):
+        season = f"{2009 + season_index}-{10 + season_index}"
+        pairings = [(home, away) for home in teams for away in teams if home != away]
+        generator.shuffle(pairings)
+        if season_index == 1:
+            pairings = [(home, away) for home, away in pairings if "Team 0" not in (home, away)]
+
+        matches = [(home, away, generator.randint(0, 4), generator.randint(0, 4)) for home, away in pairings]
+        columns = _make_columns(matches, [generator.choice(["A Referee", "B Referee", "C Referee"]) for _ in matches])
+        for column in constants.retrieve("HOME_DETAIL_COLUMNS") + constants.retrieve("AWAY_DETAIL_COLUMNS"):
+            if column not in {"FTHG", "FTAG"}:
+                columns[column] = [generator.randint(0, 15) for _ in matches]
+        convert_columns_to_graph(columns, league, season)
+    return league
+
+
+@pytest.fixture
+def make_columns() -> Callable[..., dict[str, list]]:
+    """Return a function that makes the columns of the given matches, as described in _make_columns."""
+    return _make_columns
+
+
+@pytest.fixture
+def build_league() -> Callable[[dict[str, Matches]], League]:
+    """Return a function that builds a League of the given matches of each season."""
+    return _build_league
+
+
+@pytest.fixture
+def random_leagues() -> list[League]:
+    """Return Leagues of random matches, in which one team sits out a season."""
+    return [_build_random_league(seed) for seed in range(5)]
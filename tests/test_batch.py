@@ -0,0 +1,50 @@
+"""Kickoff Project: tests / test_batch.py
+
+This module contains tests for running commands in a batch.
+
+This file is Copyright (c) 2023 Ram Raghav Sharma, Harshith Latchupatula, Vikram Makkar and Muhammad Ibrahim.
+"""
+import typer
+
+import harshithl1777_kickoff.cmd.output as io
+from harshithl1777_kickoff.cmd.batch import run_batch
+
+
+def _build_app(calls: list[str]) -> typer.Typer:
+    """Return an app with a query command that records each call, and a cache and a serve command."""
+    app = typer.Typer()
+
+    @app.command()
+    def query(team: str = typer.Option(...)) -> None:
+        calls.append(team)
+        io.info(message=team, color="white")
+
+    @app.command()
+    def cache() -> None:
+        calls.append("cache")
+
+    @app.command()
+    def serve() -> None:
+        calls.append("serve")
+
+    return app
+
+
+def test_batch_classifies_commands_by_name() -> None:
+    """Test that option values naming an excluded or modifying command neither reject a command nor discard
+    the outputs of earlier commands, while the commands themselves do.
+    """
+    calls = []
+    lines = [
+        "query --team serve",
+        "query --team cache",
+        "query --team serve",
+        "serve",
+        "cache",
+        "query --team serve",
+    ]
+    results = list(run_batch(_build_app(calls), lines, []))
+
+    assert [result["status"] for result in results] == ["ok", "ok", "ok", "error", "ok", "ok"]
+    assert results[0]["outputs"] == [{"type": "info", "message": "serve"}]
+    assert calls == ["serve", "cache", "cache", "serve"]
@@ -0,0 +1,94 @@
+"""Kickoff Project: tests / test_ingest.py
+
+This module contains tests for ingesting datasets into the Leagues of a data directory, and for the journal
+that keeps the ingested matches.
+
+This file is Copyright (c) 2023 Ram Raghav Sharma, Harshith Latchupatula, Vikram Makkar and Muhammad Ibrahim.
+"""
+import os
+
+import pytest
+
+from harshithl1777_kickoff.models.league import League
+from harshithl1777_kickoff.utils import snapshot
+from harshithl1777_kickoff.utils.load import get_data_dir, ingest_datasets, load_leagues
+
+DETAIL_FIELDS = ["fouls", "shots", "shots_on_target", "red_cards", "yellow_cards", "half_time_goals", "full_time_goals"]
+
+
+def _describe(league: League) -> list[tuple]:
+    """Return the season, order, teams, result, referee and details of every match in the given League."""
+    return [
+        (
+            match.season,
+            match.order,
+            match.home_team.name,
+            match.away_team.name,
+            match.result.name if match.result is not None else None,
+            match.home_details.referee,
+            *(getattr(match.home_details, field) for field in DETAIL_FIELDS),
+            *(getattr(match.away_details, field) for field in DETAIL_FIELDS),
+        )
+        for match in league.get_matches()
+    ]
+
+
+@pytest.fixture
+def datasets(tmp_path, monkeypatch) -> tuple[str, str]:
+    """Return a data directory holding the first 10 matches of the 2009-10 season, and a dataset outside of it
+    holding the 6th to 15th matches, with the cache directory moved into tmp_path.
+    """
+    monkeypatch.setenv("KICKOFF_CACHE_DIR", str(tmp_path / "cache"))
+    with open(os.path.join(get_data_dir(), "2009-10.csv"), encoding="utf-8") as source:
+        lines = source.readlines()
+
+    data_dir = tmp_path / "data"
+    data_dir.mkdir()
+    (data_dir / "base.csv").write_text("".join(lines[:11]), encoding="utf-8")
+    new_path = tmp_path / "new.csv"
+    new_path.write_text("".join(lines[:1] + lines[6:16]), encoding="utf-8")
+    return str(data_dir), str(new_path)
+
+
+def test_ingest_skips_matches_already_in_league(datasets: tuple[str, str]) -> None:
+    """Test that ingesting a dataset adds only the matches not already in the League, and that ingesting it
+    again adds nothing.
+    """
+    data_dir, new_path = datasets
+    assert ingest_datasets([new_path], data_dir, workers=1) == [("E0", "2009-10", 5, 5)]
+    assert ingest_datasets([new_path], data_dir, workers=1) == [("E0", "2009-10", 0, 10)]
+
+    journal = snapshot.load_journal(data_dir)
+    assert [(division, season, len(columns["HomeTeam"])) for division, season, columns in journal] == [
+        ("E0", "2009-10", 5)
+    ]
+    league = load_leagues(data_dir, workers=1)["E0"]
+    assert [match.order for match in league.get_matches()] == list(range(1, 16))
+
+
+def test_reload_replays_journal(datasets: tuple[str, str]) -> None:
+    """Test that rebuilding the Leagues from the datasets and the journal gives the same League as the one
+    ingested into and stored in the snapshot.
+    """
+    data_dir, new_path = datasets
+    ingest_datasets([new_path], data_dir, workers=1)
+
+    cached = load_leagues(data_dir, workers=1)["E0"]
+    rebuilt = load_leagues(data_dir, use_cache=False, workers=1)["E0"]
+    assert len(rebuilt.get_matches()) == 15
+    assert _describe(rebuilt) == _describe(cached)
+
+    combined = load_leagues(os.path.dirname(new_path), use_cache=False, workers=1)["E0"]
+    assert _describe(rebuilt) == _describe(combined)
+
+
+def test_clear_journals_discards_ingested_matches(datasets: tuple[str, str]) -> None:
+    """Test that clearing the journals removes the journal, so rebuilt Leagues only hold the datasets."""
+    data_dir, new_path = datasets
+    ingest_datasets([new_path], data_dir, workers=1)
+    assert os.path.exists(snapshot.get_journal_path(data_dir))
+
+    assert snapshot.clear_journals() == 1
+    assert not os.path.exists(snapshot.get_journal_path(data_dir))
+    assert snapshot.load_journal(data_dir) == []
+    assert len(load_leagues(data_dir, use_cache=False, workers=1)["E0"].get_matches()) == 10
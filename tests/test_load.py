@@ -0,0 +1,24 @@
+"""Kickoff Project: tests / test_load.py
+
+This module contains tests for building Leagues from the partitions of the datasets.
+
+This file is Copyright (c) 2023 Ram Raghav Sharma, Harshith Latchupatula, Vikram Makkar and Muhammad Ibrahim.
+"""
+from typing import Callable
+
+from harshithl1777_kickoff.utils.load import build_leagues
+
+
+def test_build_leagues_season_split_across_partitions(make_columns: Callable) -> None:
+    """Test that the matches of a season split across two partitions are numbered in the order of the partitions,
+    and that a match held by both is only added once.
+    """
+    partitions = [
+        ("E0", "2009-10", make_columns([("A", "B", 1, 0), ("A", "C", 0, 0)])),
+        ("E0", "2009-10", make_columns([("A", "D", 2, 1), ("A", "B", 1, 0)])),
+    ]
+    league = build_leagues(partitions)["E0"]
+
+    matches = league.get_team("A").matches
+    assert [(match.away_team.name, match.order) for match in matches] == [("B", 1), ("C", 2), ("D", 3)]
+    assert [match.order for match in league.get_matches("2009-10")] == [1, 2, 3]
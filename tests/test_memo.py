@@ -0,0 +1,81 @@
+"""Kickoff Project: tests / test_memo.py
+
+This module contains tests for the memoize decorator.
+
+This file is Copyright (c) 2023 Ram Raghav Sharma, Harshith Latchupatula, Vikram Makkar and Muhammad Ibrahim.
+"""
+from typing import Callable
+
+from harshithl1777_kickoff.models.league import League
+from harshithl1777_kickoff.utils.memo import memoize
+
+
+def _make_counted(maxsize: int = 256) -> tuple[Callable, list[tuple[int, int]]]:
+    """Return a memoized function of a League and a number, and the list of the arguments it was computed for,
+    as the id of the League and the number.
+    """
+    calls = []
+
+    @memoize(maxsize=maxsize)
+    def matches_played(league: League, number: int) -> list[int]:
+        calls.append((id(league), number))
+        return [number, len(league.get_matches())]
+
+    return matches_played, calls
+
+
+def test_memo_is_invalidated_by_version_bump(build_league: Callable) -> None:
+    """Test that modifying a League bumps its version and discards the results cached for it."""
+    league = build_league({"2009-10": [("A", "B", 1, 0)]})
+    matches_played, calls = _make_counted()
+
+    assert matches_played(league, 1) == [1, 1]
+    assert matches_played(league, number=1) == [1, 1]
+    assert len(calls) == 1
+
+    version = league.get_version()
+    league.add_team("C")
+    assert league.get_version() > version
+    assert matches_played(league, 1) == [1, 1]
+    assert len(calls) == 2
+    assert matches_played.memo.invalidations == 1
+
+
+def test_memo_is_kept_per_league(build_league: Callable) -> None:
+    """Test that the same arguments on two Leagues are cached separately."""
+    first = build_league({"2009-10": [("A", "B", 1, 0)]})
+    second = build_league({"2009-10": [("A", "B", 1, 0), ("B", "A", 0, 0)]})
+    matches_played, calls = _make_counted()
+
+    assert matches_played(first, 1) == [1, 1]
+    assert matches_played(second, 1) == [1, 2]
+    assert calls == [(id(first), 1), (id(second), 1)]
+
+
+def test_memo_evicts_least_recently_used(build_league: Callable) -> None:
+    """Test that only the maxsize most recently used results are kept."""
+    league = build_league({"2009-10": [("A", "B", 1, 0)]})
+    matches_played, calls = _make_counted(maxsize=2)
+
+    matches_played(league, 1)
+    matches_played(league, 2)
+    matches_played(league, 1)
+    matches_played(league, 3)
+    assert matches_played.memo.evictions == 1
+    assert len(matches_played.memo) == 2
+
+    matches_played(league, 1)
+    matches_played(league, 2)
+    assert [number for _, number in calls] == [1, 2, 3, 2]
+
+
+def test_memo_returns_copies(build_league: Callable) -> None:
+    """Test that modifying a result does not modify the cached result."""
+    league = build_league({"2009-10": [("A", "B", 1, 0)]})
+    matches_played, calls = _make_counted()
+
+    result = matches_played(league, 1)
+    result.append(0)
+    result[0] = 5
+    assert matches_played(league, 1) == [1, 1]
+    assert len(calls) == 1
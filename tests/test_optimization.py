@@ -0,0 +1,73 @@
+"""Kickoff Project: tests / test_optimization.py
+
+This module contains tests for binning the statistics of matches into ranges for the optimization queries.
+
+This file is Copyright (c) 2023 Ram Raghav Sharma, Harshith Latchupatula, Vikram Makkar and Muhammad Ibrahim.
+"""
+from typing import Callable, Optional
+
+import pytest
+
+from harshithl1777_kickoff.controllers.optimization import BINNED_STATISTICS, _bin_statistic, _range_label
+from harshithl1777_kickoff.models.league import League
+from harshithl1777_kickoff.utils.load import convert_columns_to_graph
+
+
+def _brute_force_bins(league: League, stat: str, width: int, team: Optional[str]) -> dict[str, list[int]]:
+    """Return the counts of _bin_statistic by looping over every match of the League."""
+    sides = []
+    for match in sorted(league.get_matches(), key=lambda match: (match.season, match.order)):
+        for details in [match.home_details, match.away_details]:
+            if team is None or details.team.name == team:
+                result = "wins" if match.result is details.team else "draws" if match.result is None else "losses"
+                sides.append((getattr(details, stat) // width, result))
+
+    range_count = max((range_index for range_index, _ in sides), default=-1) + 1
+    bins = {column: [0] * range_count for column in ["games", "wins", "draws", "losses"]}
+    bins["first_win"] = [len(sides)] * range_count
+    for position, (range_index, result) in enumerate(sides):
+        bins["games"][range_index] += 1
+        bins[result][range_index] += 1
+        if result == "wins":
+            bins["first_win"][range_index] = min(bins["first_win"][range_index], position)
+    return bins
+
+
+@pytest.mark.parametrize("width", [1, 2, 3, 4, 7])
+@pytest.mark.parametrize("stat", list(BINNED_STATISTICS))
+def test_bin_statistic_matches_brute_force(random_leagues: list[League], stat: str, width: int) -> None:
+    """Test that _bin_statistic counts the sides in each range like a loop over the matches, for the whole
+    league and for each team.
+    """
+    for league in random_leagues:
+        for team in [None, *league.get_team_names()]:
+            expected = _brute_force_bins(league, stat, width, team)
+            actual = _bin_statistic(league, stat, width, team)
+            assert {column: values.tolist() for column, values in actual.items()} == expected
+
+
+def test_bin_statistic_partly_filled_last_range(make_columns: Callable) -> None:
+    """Test the ranges of a small League whose largest value falls in a range it does not fill."""
+    columns = make_columns([("A", "B", 1, 0), ("B", "A", 0, 0), ("A", "C", 0, 2)])
+    columns["HF"] = [0, 5, 9]
+    columns["AF"] = [3, 4, 1]
+    league = League()
+    convert_columns_to_graph(columns, league, "2009-10")
+
+    bins = _bin_statistic(league, "fouls", 4, None)
+    assert bins["games"].tolist() == [3, 2, 1]
+    assert bins["wins"].tolist() == [2, 0, 0]
+    assert bins["draws"].tolist() == [0, 2, 0]
+    assert bins["losses"].tolist() == [1, 0, 1]
+    assert bins["first_win"].tolist() == [0, 6, 6]
+    assert [_range_label(range_index, 4) for range_index in range(3)] == ["0 - 3", "4 - 7", "8 - 11"]
+
+    team_bins = _bin_statistic(league, "fouls", 4, "C")
+    assert team_bins["games"].tolist() == [1]
+    assert team_bins["wins"].tolist() == [1]
+
+
+@pytest.mark.parametrize("range_index, width, label", [(0, 1, "0"), (7, 1, "7"), (0, 2, "0 - 1"), (3, 5, "15 - 19")])
+def test_range_label(range_index: int, width: int, label: str) -> None:
+    """Test that each range is labelled with its values, or its only value when width is 1."""
+    assert _range_label(range_index, width) == label
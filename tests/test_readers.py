@@ -0,0 +1,56 @@
+"""Kickoff Project: tests / test_readers.py
+
+This module contains tests that the csv readers in CSV_READERS interpret a dataset the same way.
+
+This file is Copyright (c) 2023 Ram Raghav Sharma, Harshith Latchupatula, Vikram Makkar and Muhammad Ibrahim.
+"""
+import os
+
+import pytest
+
+from harshithl1777_kickoff.utils.load import read_csv_columns, read_dataset, read_pandas_columns
+
+FIXTURE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "readers.csv")
+
+
+@pytest.fixture
+def without_division(tmp_path) -> str:
+    """Return the path of a copy of the fixture dataset without its Div column."""
+    with open(FIXTURE_PATH, encoding="utf-8") as source:
+        lines = [line.split(",", 1)[1] if "," in line else line for line in source]
+    path = tmp_path / "without_division.csv"
+    path.write_text("".join(lines), encoding="utf-8")
+    return str(path)
+
+
+def test_readers_agree() -> None:
+    """Test that the csv and pandas readers return the same columns for a dataset with missing values in
+    several of the NA spellings, dates in each of the supported formats and rows without a result or a team.
+    """
+    columns = read_csv_columns(FIXTURE_PATH)
+    assert columns == read_pandas_columns(FIXTURE_PATH)
+
+    assert columns["Div"] == ["E0", "E0", "E1", "E0", "E0"]
+    assert columns["Date"] == ["2009-08-15", "15/08/2009", "15/08/09", "16/08/2009", "2010-01-02"]
+    assert columns["Referee"] == ["M Clattenburg", "", "", "A Wiley", "M Dean"]
+    assert columns["HF"] == [15, 12, 16, 0, 9]
+    assert columns["AY"] == [2, 1, 3, 0, 0]
+    assert columns["HS"][4] == 8
+
+
+def test_readers_agree_without_division(without_division: str) -> None:
+    """Test that both readers assume the default division for a dataset without a Div column."""
+    columns = read_csv_columns(without_division)
+    assert columns == read_pandas_columns(without_division)
+    assert set(columns["Div"]) == {"E0"}
+
+
+def test_readers_partition_alike() -> None:
+    """Test that the datasets read by either reader are split into the same divisions and seasons."""
+    partitions = read_dataset(FIXTURE_PATH, csv_reader="csv")
+    assert partitions == read_dataset(FIXTURE_PATH, csv_reader="pandas")
+    assert [(division, season) for division, season, _ in partitions] == [
+        ("E0", "2009-10"),
+        ("E1", "2009-10"),
+    ]
+    assert len(partitions[0][2]["HomeTeam"]) == 4
@@ -0,0 +1,90 @@
+"""Kickoff Project: tests / test_records.py
+
+This module contains tests for the streaks found by the records controller.
+
+This file is Copyright (c) 2023 Ram Raghav Sharma, Harshith Latchupatula, Vikram Makkar and Muhammad Ibrahim.
+"""
+import random
+from typing import Callable
+
+import numpy as np
+import pytest
+
+from harshithl1777_kickoff.controllers.records import _longest_runs, highest_win_streaks
+from harshithl1777_kickoff.models.league import League
+
+# the goals scored and conceded by Arsenal in each match of a season, against a different opponent each time
+ARSENAL_SCORES = [(1, 0), (2, 0), (1, 1), (1, 0), (0, 1), (0, 2), (0, 0), (3, 0), (2, 1), (1, 0), (0, 1)]
+
+
+def _arsenal_matches(scores: list[tuple[int, int]], first_opponent: int = 0) -> list[tuple[str, str, int, int]]:
+    """Return Arsenal's matches with the given scores, alternating between home and away, against opponents
+    that each play only once so that they never hold a streak longer than one match.
+    """
+    matches = []
+    for i, (scored, conceded) in enumerate(scores):
+        opponent = f"Opponent {first_opponent + i}"
+        if i % 2 == 0:
+            matches.append(("Arsenal", opponent, scored, conceded))
+        else:
+            matches.append((opponent, "Arsenal", conceded, scored))
+    return matches
+
+
+def _streak(league: League, team_name: str, season: str = None, kind: str = "win") -> int:
+    """Return the longest streak of the given kind of the team with the given name."""
+    return dict(highest_win_streaks(league, season, topx=100, kind=kind))[team_name]
+
+
+@pytest.mark.parametrize("kind, expected", [("win", 3), ("unbeaten", 4), ("loss", 2), ("scoring", 4)])
+def test_streak_kinds(build_league: Callable, kind: str, expected: int) -> None:
+    """Test the longest streak of each kind in a season with several runs of each."""
+    league = build_league({"2009-10": _arsenal_matches(ARSENAL_SCORES)})
+    assert _streak(league, "Arsenal", "2009-10", kind) == expected
+
+
+def test_streak_resets_after_shorter_run(build_league: Callable) -> None:
+    """Test that a shorter run after a longer one does not replace it, and that runs do not add up across
+    the match that breaks them.
+    """
+    scores = [(1, 0)] * 4 + [(0, 1)] + [(1, 0)] * 2 + [(0, 0)] + [(1, 0)] * 3
+    league = build_league({"2009-10": _arsenal_matches(scores)})
+    assert _streak(league, "Arsenal", "2009-10") == 4
+
+
+def test_streak_does_not_leak_across_seasons(build_league: Callable) -> None:
+    """Test that a streak running from the end of one season into the next is only counted in full when
+    every season is considered.
+    """
+    first_season = _arsenal_matches([(0, 1), (1, 0), (1, 0), (1, 0)])
+    second_season = _arsenal_matches([(1, 0), (1, 0), (0, 1), (1, 0)], first_opponent=len(first_season))
+    league = build_league({"2009-10": first_season, "2010-11": second_season})
+
+    assert _streak(league, "Arsenal", "2009-10") == 3
+    assert _streak(league, "Arsenal", "2010-11") == 2
+    assert _streak(league, "Arsenal") == 5
+
+
+def test_streaks_are_ordered_by_length(build_league: Callable) -> None:
+    """Test that the topx longest streaks are returned from longest to shortest, and that teams with equal
+    streaks are ordered by their first appearance in the league.
+    """
+    league = build_league({"2009-10": _arsenal_matches(ARSENAL_SCORES)})
+    assert highest_win_streaks(league, "2009-10", topx=3) == [("Arsenal", 3), ("Opponent 4", 1), ("Opponent 5", 1)]
+
+
+def test_longest_runs_matches_brute_force() -> None:
+    """Test _longest_runs against a loop over each group's values on random interleaved groups."""
+    generator = random.Random(2023)
+    for _ in range(200):
+        group_count = generator.randint(1, 5)
+        groups = np.array([generator.randrange(group_count) for _ in range(generator.randint(0, 40))], dtype=np.int64)
+        values = np.array([generator.random() < 0.6 for _ in groups], dtype=bool)
+
+        expected = [0] * group_count
+        current = [0] * group_count
+        for group, value in zip(groups.tolist(), values.tolist()):
+            current[group] = current[group] + 1 if value else 0
+            expected[group] = max(expected[group], current[group])
+
+        assert _longest_runs(groups, values, group_count).tolist() == expected
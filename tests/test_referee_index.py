@@ -0,0 +1,57 @@
+"""Kickoff Project: tests / test_referee_index.py
+
+This module contains tests for the RefereeIndex class.
+
+This file is Copyright (c) 2023 Ram Raghav Sharma, Harshith Latchupatula, Vikram Makkar and Muhammad Ibrahim.
+"""
+from typing import Optional
+
+from harshithl1777_kickoff.models.league import League
+from harshithl1777_kickoff.models.referee_index import REFEREE_STATS
+
+
+def _brute_force_pairs(league: League, team_name: Optional[str], season: Optional[str]) -> dict[tuple, dict]:
+    """Return the statistics of each (referee, team) pair, as ids, by looping over every match of the League."""
+    index = league.get_referee_index()
+    ordered = sorted(league.get_matches(), key=lambda match: (match.season, match.order))
+    pairs = {}
+    for i, match in enumerate(ordered):
+        for position, details, other in [
+            (2 * i, match.home_details, match.away_details),
+            (2 * i + 1, match.away_details, match.home_details),
+        ]:
+            if (team_name is not None and details.team.name != team_name) or (
+                season is not None and match.season != season
+            ):
+                continue
+            key = (index.referee_names.index(details.referee), index.team_ids[details.team.name])
+            stats = pairs.setdefault(key, {stat: 0 for stat in REFEREE_STATS} | {"first_win": 2 * len(ordered)})
+            stats["games"] += 1
+            stats["wins"] += match.result is details.team
+            stats["draws"] += match.result is None
+            stats["losses"] += match.result is other.team
+            stats["fouls"] += details.fouls
+            stats["yellow_cards"] += details.yellow_cards
+            stats["red_cards"] += details.red_cards
+            if match.result is details.team:
+                stats["first_win"] = min(stats["first_win"], position)
+    return pairs
+
+
+def test_get_matches_brute_force(random_leagues: list[League]) -> None:
+    """Test that RefereeIndex.get counts each statistic of each (referee, team) pair like a loop over the
+    matches, for every team and season, including a season that was never played and a team sitting it out.
+    """
+    for league in random_leagues:
+        index = league.get_referee_index()
+        for team_name in [None, *league.get_team_names()]:
+            for season in [None, *league.get_seasons(), "2030-31"]:
+                expected = _brute_force_pairs(league, team_name, season)
+                actual = index.get(team_name, season)
+
+                keys = sorted(expected)
+                assert list(zip(actual["referee"].tolist(), actual["team"].tolist())) == keys
+                for stat in [*REFEREE_STATS, "first_win"]:
+                    assert actual[stat].tolist() == [expected[key][stat] for key in keys]
+
+        assert len(index.get("Team 0", league.get_seasons()[1])["referee"]) == 0
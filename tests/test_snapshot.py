@@ -0,0 +1,109 @@
+"""Kickoff Project: tests / test_snapshot.py
+
+This module contains tests for when the snapshot of a data directory is used and when it is rebuilt.
+
+This file is Copyright (c) 2023 Ram Raghav Sharma, Harshith Latchupatula, Vikram Makkar and Muhammad Ibrahim.
+"""
+import os
+import pickle
+from typing import Callable
+
+import pytest
+
+from harshithl1777_kickoff.models.league import League
+from harshithl1777_kickoff.utils import snapshot
+
+
+@pytest.fixture
+def saved(tmp_path, monkeypatch, build_league: Callable) -> tuple[str, list[str], dict[str, League]]:
+    """Return a data directory with two datasets, their paths and the Leagues saved as its snapshot, with the
+    cache directory moved into tmp_path.
+    """
+    monkeypatch.setenv("KICKOFF_CACHE_DIR", str(tmp_path / "cache"))
+    data_dir = tmp_path / "data"
+    data_dir.mkdir()
+    (data_dir / "a.csv").write_text("first dataset\n", encoding="utf-8")
+    (data_dir / "b.csv").write_text("second dataset\n", encoding="utf-8")
+    file_paths = [str(data_dir / "a.csv"), str(data_dir / "b.csv")]
+
+    leagues = {"E0": build_league({"2009-10": [("A", "B", 1, 0)]})}
+    snapshot.save_snapshot(leagues, str(data_dir), file_paths)
+    return str(data_dir), file_paths, leagues
+
+
+def _load_header(data_dir: str) -> dict:
+    """Return the header of the snapshot of the given data directory."""
+    with open(snapshot.get_snapshot_path(data_dir), "rb") as file:
+        return pickle.load(file)
+
+
+def _touch(path: str) -> None:
+    """Move the modification time of the given file a second forward, leaving its contents alone."""
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+
+
+def test_snapshot_is_used_while_datasets_are_unchanged(saved: tuple) -> None:
+    """Test that the snapshot is loaded when nothing has changed."""
+    data_dir, file_paths, _ = saved
+    loaded = snapshot.load_snapshot(data_dir, file_paths)
+    assert loaded is not None
+    assert [match.home_team.name for match in loaded["E0"].get_matches()] == ["A"]
+
+
+def test_snapshot_is_rebuilt_after_version_bump(saved: tuple, monkeypatch) -> None:
+    """Test that a snapshot written by another SNAPSHOT_VERSION is not used."""
+    data_dir, file_paths, _ = saved
+    monkeypatch.setattr(snapshot, "SNAPSHOT_VERSION", snapshot.SNAPSHOT_VERSION + 1)
+    assert snapshot.load_snapshot(data_dir, file_paths) is None
+
+
+def test_snapshot_is_rebuilt_after_size_change(saved: tuple) -> None:
+    """Test that a dataset growing invalidates the snapshot."""
+    data_dir, file_paths, _ = saved
+    with open(file_paths[0], "a", encoding="utf-8") as file:
+        file.write("another line\n")
+    assert snapshot.load_snapshot(data_dir, file_paths) is None
+
+
+def test_snapshot_is_rebuilt_after_content_change(saved: tuple) -> None:
+    """Test that a dataset rewritten with the same size but different contents invalidates the snapshot."""
+    data_dir, file_paths, _ = saved
+    with open(file_paths[0], "w", encoding="utf-8") as file:
+        file.write("FIRST DATASET\n")
+    _touch(file_paths[0])
+    assert snapshot.load_snapshot(data_dir, file_paths) is None
+
+
+@pytest.mark.parametrize("change", ["added", "removed", "reordered"])
+def test_snapshot_is_rebuilt_after_file_set_change(saved: tuple, change: str) -> None:
+    """Test that adding, removing or reordering the datasets invalidates the snapshot."""
+    data_dir, file_paths, _ = saved
+    if change == "added":
+        extra = os.path.join(data_dir, "c.csv")
+        with open(extra, "w", encoding="utf-8") as file:
+            file.write("third dataset\n")
+        file_paths = file_paths + [extra]
+    elif change == "removed":
+        file_paths = file_paths[:1]
+    else:
+        file_paths = file_paths[::-1]
+    assert snapshot.load_snapshot(data_dir, file_paths) is None
+
+
+def test_snapshot_header_is_rewritten_after_touch(saved: tuple, monkeypatch) -> None:
+    """Test that touching a dataset keeps the snapshot and records the new modification time in its header,
+    so that the next load does not hash the dataset again.
+    """
+    data_dir, file_paths, _ = saved
+    _touch(file_paths[1])
+    assert snapshot.load_snapshot(data_dir, file_paths) is not None
+
+    fingerprints = _load_header(data_dir)["datasets"]
+    assert [fingerprint[2] for fingerprint in fingerprints] == [os.stat(path).st_mtime_ns for path in file_paths]
+
+    def fail(path: str) -> str:
+        raise AssertionError(f"{path} was hashed again")
+
+    monkeypatch.setattr(snapshot, "_hash_file", fail)
+    assert snapshot.load_snapshot(data_dir, file_paths) is not None
@@ -0,0 +1,84 @@
+"""Kickoff Project: tests / test_stats_cube.py
+
+This module contains tests for the StatsCube class.
+
+This file is Copyright (c) 2023 Ram Raghav Sharma, Harshith Latchupatula, Vikram Makkar and Muhammad Ibrahim.
+"""
+from typing import Optional
+
+import pytest
+
+from harshithl1777_kickoff.models.league import League
+from harshithl1777_kickoff.models.match import Match
+from harshithl1777_kickoff.models.stats_cube import CUBE_STATS, VENUE_AWAY, VENUE_HOME
+
+
+def _ordered_matches(league: League, season: Optional[str] = None) -> list[Match]:
+    """Return the matches of the given League in the given season, or in every season, ordered by season and
+    then by order within the season, as in the MatchTable.
+    """
+    return sorted(league.get_matches(season), key=lambda match: (match.season, match.order))
+
+
+def _brute_force_sums(league: League, stat: str, season: Optional[str], venue: Optional[int]) -> dict[str, float]:
+    """Return the sum of the given statistic for each team by looping over every match of the League."""
+    sums = {name: 0.0 for name in league.get_team_names()}
+    for match in _ordered_matches(league, season):
+        for side_venue, details, other in [
+            (VENUE_HOME, match.home_details, match.away_details),
+            (VENUE_AWAY, match.away_details, match.home_details),
+        ]:
+            if venue is not None and side_venue != venue:
+                continue
+            values = {
+                "matches": 1,
+                "wins": match.result is details.team,
+                "draws": match.result is None,
+                "losses": match.result is other.team,
+                "goals_for": details.full_time_goals,
+                "goals_against": other.full_time_goals,
+                "shots": details.shots,
+                "shots_on_target": details.shots_on_target,
+                "fouls": details.fouls,
+                "yellow_cards": details.yellow_cards,
+                "red_cards": details.red_cards,
+                "accuracy": details.shots_on_target / details.shots if details.shots > 0 else 0,
+                "accuracy_matches": details.shots > 0,
+            }
+            sums[details.team.name] += values[stat]
+    return sums
+
+
+@pytest.mark.parametrize("stat", CUBE_STATS)
+def test_get_matches_brute_force(random_leagues: list[League], stat: str) -> None:
+    """Test that StatsCube.get sums each statistic like a loop over the matches, for every season and venue,
+    including a season that was never played.
+    """
+    for league in random_leagues:
+        cube = league.get_stats_cube()
+        for season in [None, *league.get_seasons(), "2030-31"]:
+            for venue in [None, VENUE_HOME, VENUE_AWAY]:
+                expected = _brute_force_sums(league, stat, season, venue)
+                actual = cube.get(stat, season, venue)
+                assert len(actual) == len(cube.team_names)
+                for name, value in expected.items():
+                    assert actual[cube.team_ids[name]] == pytest.approx(value)
+
+
+def test_get_teams_by_appearance_matches_brute_force(random_leagues: list[League]) -> None:
+    """Test that the teams are ordered by their first match in the season, as found by a loop over the matches,
+    and that a team sitting out a season is left out of it.
+    """
+    for league in random_leagues:
+        cube = league.get_stats_cube()
+        for season in [None, *league.get_seasons(), "2030-31"]:
+            expected = []
+            for match in _ordered_matches(league, season):
+                for name in [match.home_team.name, match.away_team.name]:
+                    if cube.team_ids[name] not in expected:
+                        expected.append(cube.team_ids[name])
+            assert cube.get_teams_by_appearance(season) == expected
+
+        absent = cube.team_ids["Team 0"]
+        assert absent not in cube.get_teams_by_appearance(league.get_seasons()[1])
+        assert cube.get("matches", league.get_seasons()[1])[absent] == 0
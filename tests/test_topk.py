@@ -0,0 +1,92 @@
+"""Kickoff Project: tests / test_topk.py
+
+This module contains tests for the top k selection functions, which must break ties exactly as sorted does.
+
+This file is Copyright (c) 2023 Ram Raghav Sharma, Harshith Latchupatula, Vikram Makkar and Muhammad Ibrahim.
+"""
+import heapq
+import random
+
+import numpy as np
+import pytest
+
+from harshithl1777_kickoff.utils import topk
+from harshithl1777_kickoff.utils.topk import HEAP_FRACTION, top_k, top_k_indices
+
+
+def _expected_indices(values: list, k: int, largest: bool) -> list[int]:
+    """Return the first k indices of a stable sort of the given values."""
+    return sorted(range(len(values)), key=lambda i: values[i], reverse=largest)[:k]
+
+
+@pytest.mark.parametrize("largest", [True, False])
+@pytest.mark.parametrize("k", [1, 2, 5, 50, 1000])
+def test_top_k_breaks_ties_like_sorted(k: int, largest: bool) -> None:
+    """Test top_k against sorted on items with many equal keys, including at the boundary of the top k."""
+    generator = random.Random(k)
+    items = [(generator.randint(0, 3), i) for i in range(200)]
+    expected = sorted(items, key=lambda item: item[0], reverse=largest)[:k]
+    assert top_k(items, k, key=lambda item: item[0], largest=largest) == expected
+
+
+@pytest.mark.parametrize("largest", [True, False])
+def test_top_k_uses_heap_for_small_k(monkeypatch: pytest.MonkeyPatch, largest: bool) -> None:
+    """Test that top_k selects with a heap only when k is small compared to the number of items, and breaks
+    ties like sorted on both paths.
+    """
+    selections = []
+
+    def record(select):
+        def recorded_select(*args, **kwargs):
+            selections.append(select.__name__)
+            return select(*args, **kwargs)
+
+        return recorded_select
+
+    monkeypatch.setattr(topk.heapq, "nlargest", record(heapq.nlargest))
+    monkeypatch.setattr(topk.heapq, "nsmallest", record(heapq.nsmallest))
+
+    items = [(i % 3, i) for i in range(int(10 / HEAP_FRACTION))]
+    for k, heap_selections in [(5, 1), (10, 0), (len(items), 0)]:
+        selections.clear()
+        expected = sorted(items, key=lambda item: item[0], reverse=largest)[:k]
+        assert top_k(items, k, key=lambda item: item[0], largest=largest) == expected
+        assert selections == ["nlargest" if largest else "nsmallest"] * heap_selections
+
+
+@pytest.mark.parametrize("largest", [True, False])
+def test_top_k_all_items(largest: bool) -> None:
+    """Test that top_k returns every item, sorted, when k is at least the number of items."""
+    items = [3, 1, 3, 2, 1]
+    assert top_k(items, 5, key=lambda item: item, largest=largest) == sorted(items, reverse=largest)
+    assert top_k(items, 8, key=lambda item: item, largest=largest) == sorted(items, reverse=largest)
+
+
+def test_top_k_no_items() -> None:
+    """Test that top_k of no items is empty."""
+    assert top_k([], 4, key=lambda item: item) == []
+    assert top_k(iter([]), 4, key=lambda item: item, largest=False) == []
+
+
+@pytest.mark.parametrize("largest", [True, False])
+@pytest.mark.parametrize("k", [1, 3, 10, 99, 100, 150])
+def test_top_k_indices_breaks_ties_like_sorted(k: int, largest: bool) -> None:
+    """Test top_k_indices against a stable sort on integer and float values with many ties, including at
+    the boundary of the top k, where the argpartition path is taken for k < len(values).
+    """
+    generator = random.Random(k)
+    for values in [[generator.randint(-2, 2) for _ in range(100)], [generator.choice([0.5, 1.5]) for _ in range(100)]]:
+        result = top_k_indices(np.array(values), k, largest=largest)
+        assert result.tolist() == _expected_indices(values, k, largest)
+
+
+def test_top_k_indices_all_equal() -> None:
+    """Test that when every value is equal, the first k indices are returned in order."""
+    assert top_k_indices(np.zeros(50), 7).tolist() == list(range(7))
+    assert top_k_indices(np.ones(50, dtype=np.int64), 7, largest=False).tolist() == list(range(7))
+
+
+def test_top_k_indices_no_values() -> None:
+    """Test that top_k_indices of no values is empty."""
+    assert top_k_indices(np.array([], dtype=np.int64), 4).tolist() == []
+    assert top_k_indices(np.array([]), 1, largest=False).tolist() == []
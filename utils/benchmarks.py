@@ -0,0 +1,356 @@
+"""Kickoff Project: utils / benchmarks.py
+
+This module contains functions that measure how long the various stages of Kickoff take to run.
+It also holds the pandas implementation of building the graph from a dataframe, which benchmark_build
+compares against the original implementation that indexes the dataframe cell by cell.
+
+This file is Copyright (c) 2023 Ram Raghav Sharma, Harshith Latchupatula, Vikram Makkar and Muhammad Ibrahim.
+"""
+from __future__ import annotations
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from statistics import median
+from typing import TYPE_CHECKING, Callable, Optional
+
+import numpy as np
+
+from harshithl1777_kickoff.models.league import League
+from harshithl1777_kickoff.models.match import Match, MatchDetails
+from harshithl1777_kickoff.utils import snapshot
+from harshithl1777_kickoff.utils.constants import Constants
+from harshithl1777_kickoff.utils.topk import top_k, top_k_indices
+from harshithl1777_kickoff.utils.load import (
+    build_leagues,
+    convert_columns_to_graph,
+    generate_pandas_dataframe,
+    get_data_dir,
+    get_dataset_paths,
+    parse_season,
+    read_datasets,
+)
+
+PACKAGE_NAME = __name__.split(".")[0]
+STARTUP_IMPORTS = [f"{PACKAGE_NAME}.cmd.commands"]
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+
+def benchmark_startup(
+    data_dir: Optional[str] = None, repeat: int = 5, workers: Optional[int] = None, csv_reader: str = "csv"
+) -> list[tuple[str, float, float]]:
+    """Return a list of tuples of each cold start stage, its best time and its median time in milliseconds,
+    when loading the datasets in the given data directory with the given number of workers and csv reader.
+
+    Import and CLI times are measured in fresh interpreters so that modules cached by this process
+    do not hide their cost.
+
+    Preconditions:
+        - repeat > 0
+        - csv_reader in CSV_READERS
+    """
+    data_dir = get_data_dir(data_dir)
+    file_paths = get_dataset_paths(data_dir)
+    partitions = []
+    leagues = []
+
+    def parse() -> None:
+        partitions.clear()
+        partitions.extend(read_datasets(file_paths, workers, csv_reader=csv_reader))
+
+    def build() -> None:
+        leagues.append(build_leagues(partitions))
+
+    def load_snapshot() -> None:
+        snapshot.load_snapshot(data_dir, file_paths)
+
+    stages = [
+        ("Import modules", [_time_subprocess_imports(STARTUP_IMPORTS) for _ in range(repeat)]),
+        ("Parse datasets", _time_function(parse, repeat)),
+        ("Build graph", _time_function(build, repeat)),
+    ]
+    if snapshot.load_snapshot(data_dir, file_paths) is None:
+        snapshot.save_snapshot(leagues[-1], data_dir, file_paths)
+    stages += [
+        ("Load snapshot", _time_function(load_snapshot, repeat)),
+        ("CLI --help", [_time_subprocess_cli(["--help"]) for _ in range(repeat)]),
+    ]
+    return [(stage, round(min(times) * 1000, 2), round(median(times) * 1000, 2)) for stage, times in stages]
+
+
+def benchmark_build(data_dir: Optional[str] = None, repeat: int = 5) -> list[tuple[str, str, float, float, str]]:
+    """Return a list of tuples of each division and season in the given data directory, the best time in
+    milliseconds taken to build its graph by indexing the dataframe cell by cell, the best time taken by
+    convert_to_graph and the speedup.
+
+    Preconditions:
+        - repeat > 0
+    """
+    partitions = []
+    for path in get_dataset_paths(data_dir):
+        partitions.extend(partition_seasons(generate_pandas_dataframe(path)))
+
+    timings = []
+    for division, season, dataframe in sorted(partitions, key=lambda partition: partition[:2]):
+        dataframe = dataframe.reset_index(drop=True)
+        before = min(_time_function(lambda: _convert_to_graph_by_cell(dataframe, League(), season), repeat))
+        after = min(_time_function(lambda: convert_to_graph(dataframe, League(), season), repeat))
+        speedup = f"{round(before / after, 1)}x"
+        timings.append((division, season, round(before * 1000, 2), round(after * 1000, 2), speedup))
+
+    return timings
+
+
+def benchmark_memory(data_dir: Optional[str] = None) -> list[tuple[str, int, float, float]]:
+    """Return a list of tuples of each in-memory representation of the datasets in the given data directory,
+    the number of matches it holds, the total memory it allocates in kilobytes and the memory it allocates
+    per match in bytes.
+
+    The datasets are parsed before tracing starts so that only the representations themselves are measured.
+    """
+    partitions = read_datasets(get_dataset_paths(data_dir))
+
+    tracemalloc.start()
+    leagues = {}
+    for division, season, columns in sorted(partitions, key=lambda partition: partition[:2]):
+        convert_columns_to_graph(columns, leagues.setdefault(division, League()), season)
+    graph_size = tracemalloc.get_traced_memory()[0]
+    for league in leagues.values():
+        league.get_match_table()
+    table_size = tracemalloc.get_traced_memory()[0] - graph_size
+    for league in leagues.values():
+        league.get_stats_cube()
+    cube_size = tracemalloc.get_traced_memory()[0] - graph_size - table_size
+    for league in leagues.values():
+        league.get_referee_index()
+    index_size = tracemalloc.get_traced_memory()[0] - graph_size - table_size - cube_size
+    tracemalloc.stop()
+
+    num_matches = sum(len(league.get_matches()) for league in leagues.values())
+    return [
+        (name, num_matches, round(size / 1024, 1), round(size / num_matches, 1))
+        for name, size in [
+            ("Object graph", graph_size),
+            ("Match table", table_size),
+            ("Statistics cube", cube_size),
+            ("Referee index", index_size),
+        ]
+    ]
+
+
+def benchmark_parse(
+    file_counts: list[int], workers: Optional[int] = None, repeat: int = 3, csv_reader: str = "csv"
+) -> list[tuple[int, float, float, float]]:
+    """Return a list of tuples of each of the given numbers of season files, and the best time in milliseconds
+    taken to parse that many files with the given csv reader serially, with a thread pool and with a process
+    pool of the given number of workers.
+
+    The season files are copies of the bundled datasets written to a temporary directory.
+
+    Preconditions:
+        - all(count > 0 for count in file_counts)
+        - workers is None or workers > 0
+        - repeat > 0
+        - csv_reader in CSV_READERS
+    """
+    source_paths = get_dataset_paths()
+    timings = []
+    with tempfile.TemporaryDirectory() as temp_dir:
+        for count in file_counts:
+            file_paths = []
+            for i in range(count):
+                file_paths.append(os.path.join(temp_dir, f"{count}-{i}.csv"))
+                shutil.copyfile(source_paths[i % len(source_paths)], file_paths[-1])
+
+            serial = min(_time_function(lambda: read_datasets(file_paths, 1, csv_reader=csv_reader), repeat))
+            threads = min(_time_function(lambda: read_datasets(file_paths, workers, "thread", csv_reader), repeat))
+            processes = min(_time_function(lambda: read_datasets(file_paths, workers, "process", csv_reader), repeat))
+            timings.append((count, round(serial * 1000, 2), round(threads * 1000, 2), round(processes * 1000, 2)))
+
+    return timings
+
+
+def benchmark_topk(
+    league: League, topxs: list[int], size: int = 100000, repeat: int = 5
+) -> list[tuple[int, int, float, float, float]]:
+    """Return a list of tuples of each of the given topx values, the number of items selected from, and the best
+    time in milliseconds taken to select the topx items by sorting all of them, with top_k, and with
+    top_k_indices on a NumPy array.
+
+    The items are the goals scored by each team in each match of the given League, repeated until there are
+    size of them, so that they have as many ties as the records commands select from.
+
+    Preconditions:
+        - len(league.get_matches()) > 0
+        - all(topx > 0 for topx in topxs)
+        - size > 0
+        - repeat > 0
+    """
+    goals = np.resize(league.get_match_table().side_stats("full_time_goals").astype(np.int64), size)
+    items = list(enumerate(goals.tolist()))
+
+    timings = []
+    for topx in topxs:
+        sort_times = _time_function(lambda: sorted(items, key=lambda item: item[1], reverse=True)[:topx], repeat)
+        heap_times = _time_function(lambda: top_k(items, topx, key=lambda item: item[1]), repeat)
+        array_times = _time_function(lambda: top_k_indices(goals, topx), repeat)
+        best_times = [round(min(times) * 1000, 2) for times in [sort_times, heap_times, array_times]]
+        timings.append((topx, size, *best_times))
+    return timings
+
+
+def _time_function(function: Callable[[], None], repeat: int) -> list[float]:
+    """Return the wall-clock time in seconds of each of repeat calls to the given function."""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        times.append(time.perf_counter() - start)
+    return times
+
+
+def _subprocess_env() -> dict[str, str]:
+    """Return an environment in which a fresh interpreter can import this package."""
+    env = dict(os.environ)
+    package_parent = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [package_parent, env.get("PYTHONPATH")]))
+    return env
+
+
+def _time_subprocess_imports(modules: list[str]) -> float:
+    """Return the time in seconds a fresh interpreter takes to import the given modules."""
+    script = (
+        "import time\n"
+        "start = time.perf_counter()\n"
+        f"import {', '.join(modules)}\n"
+        "print(time.perf_counter() - start)\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", script], capture_output=True, text=True, env=_subprocess_env(), check=True
+    )
+    return float(result.stdout.strip().splitlines()[-1])
+
+
+def _time_subprocess_cli(args: list[str]) -> float:
+    """Return the wall-clock time in seconds of running the kickoff CLI with the given arguments."""
+    start = time.perf_counter()
+    subprocess.run(
+        [sys.executable, "-m", PACKAGE_NAME, *args], capture_output=True, env=_subprocess_env(), check=True
+    )
+    return time.perf_counter() - start
+
+
+def partition_seasons(dataframe: pd.DataFrame) -> list[tuple[str, str, pd.DataFrame]]:
+    """Split the given dataframe by division and season, and return a list of tuples of each division,
+    season and the dataframe of its matches. The season of each match is parsed from its date.
+    """
+    return [
+        (division, season, partition_dataframe)
+        for (division, season), partition_dataframe in dataframe.groupby(
+            ["Div", get_match_seasons(dataframe)], sort=False
+        )
+    ]
+
+
+def get_match_seasons(dataframe: pd.DataFrame) -> pd.Series:
+    """Return the season string of each match in the given dataframe, e.g. '2009-10' for a match played
+    between August 2009 and May 2010. Each distinct date is only parsed once.
+    """
+    dates = dataframe["Date"]
+    return dates.map({match_date: parse_season(match_date) for match_date in dates.unique()})
+
+
+def extract_columns(dataframe: pd.DataFrame) -> dict[str, list]:
+    """Return a mapping from each column of the given dataframe used to build the graph to its values,
+    extracted once as a list of Python values.
+
+    Preconditions:
+        - dataframe was generated by generate_pandas_dataframe
+    """
+    constants = Constants()
+    columns = ["HomeTeam", "AwayTeam", "FTR", "Referee"]
+    columns += constants.retrieve("HOME_DETAIL_COLUMNS") + constants.retrieve("AWAY_DETAIL_COLUMNS")
+    return {column: dataframe[column].tolist() for column in columns}
+
+
+def convert_to_graph(dataframe: pd.DataFrame, league: League, season: str) -> None:
+    """Populate the graph with the provided dataframe representing the match and overall season statistics
+
+    Preconditions:
+        - dataframe was generated by generate_pandas_dataframe and holds the matches of one division and season
+        - season is in the format '20XX-XX'
+    """
+    convert_columns_to_graph(extract_columns(dataframe), league, season)
+
+
+def _convert_to_graph_by_cell(dataframe: pd.DataFrame, league: League, season: str) -> None:
+    """The original implementation of convert_to_graph, which indexes the dataframe one cell at a time.
+    It is kept only as a baseline for benchmark_build.
+
+    Preconditions:
+        - dataframe is a valid representation of a csv file stored in the assets folder
+        - season is in the format '20XX-XX'
+    """
+    for i in range(len(dataframe.index)):
+        ht_name = dataframe["HomeTeam"][i]
+        at_name = dataframe["AwayTeam"][i]
+
+        if not league.team_in_league(ht_name):
+            home_team = league.add_team(ht_name)
+        else:
+            home_team = league.get_team(ht_name)
+
+        if not league.team_in_league(at_name):
+            away_team = league.add_team(at_name)
+        else:
+            away_team = league.get_team(at_name)
+
+        league.add_season_to_team(ht_name, season)
+        league.add_season_to_team(at_name, season)
+
+        home_team_details = MatchDetails(
+            team=home_team,
+            fouls=dataframe["HF"][i],
+            shots=int(dataframe["HS"][i]),
+            shots_on_target=int(dataframe["HST"][i]),
+            red_cards=int(dataframe["HR"][i]),
+            yellow_cards=int(dataframe["HY"][i]),
+            half_time_goals=int(dataframe["HTHG"][i]),
+            full_time_goals=int(dataframe["FTHG"][i]),
+            referee=dataframe["Referee"][i],
+        )
+        away_team_details = MatchDetails(
+            team=away_team,
+            fouls=dataframe["AF"][i],
+            shots=int(dataframe["AS"][i]),
+            shots_on_target=int(dataframe["AST"][i]),
+            red_cards=int(dataframe["AR"][i]),
+            yellow_cards=int(dataframe["AY"][i]),
+            half_time_goals=int(dataframe["HTAG"][i]),
+            full_time_goals=int(dataframe["FTAG"][i]),
+            referee=dataframe["Referee"][i],
+        )
+
+        if dataframe["FTR"][i] == "H":
+            result = home_team
+        elif dataframe["FTR"][i] == "A":
+            result = away_team
+        else:
+            result = None
+
+        match = Match(
+            season=season,
+            home_team=home_team,
+            away_team=away_team,
+            order=(i + 1),
+            home_details=home_team_details,
+            away_details=away_team_details,
+            result=result,
+        )
+
+        league.add_match(ht_name, at_name, match)
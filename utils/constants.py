@@ -14,6 +14,8 @@ class Constants:
 
     def __init__(self) -> None:
         self._constants["USE_COLUMNS"] = [
+            "Div",
+            "Date",
             "HomeTeam",
             "AwayTeam",
             "FTHG",
@@ -34,30 +36,85 @@ class Constants:
             "AR",
             "Referee",
         ]
+        self._constants["REQUIRED_COLUMNS"] = ["Date", "HomeTeam", "AwayTeam", "FTHG", "FTAG", "FTR"]
+        # the division code of the Premier League in the football-data.co.uk datasets
+        self._constants["DEFAULT_DIVISION"] = "E0"
+        # the name of each division code in the football-data.co.uk datasets, used to label command output
+        self._constants["DIVISION_NAMES"] = {
+            "E0": "Premier League",
+            "E1": "Championship",
+            "E2": "League One",
+            "E3": "League Two",
+            "EC": "National League",
+            "SC0": "Scottish Premiership",
+            "SC1": "Scottish Championship",
+            "SC2": "Scottish League One",
+            "SC3": "Scottish League Two",
+            "D1": "Bundesliga",
+            "D2": "2. Bundesliga",
+            "SP1": "La Liga",
+            "SP2": "Segunda Division",
+            "I1": "Serie A",
+            "I2": "Serie B",
+            "F1": "Ligue 1",
+            "F2": "Ligue 2",
+            "N1": "Eredivisie",
+            "B1": "Belgian First Division A",
+            "P1": "Primeira Liga",
+            "T1": "Super Lig",
+            "G1": "Super League Greece",
+        }
+        self._constants["DATE_FORMATS"] = ["%Y-%m-%d", "%d/%m/%Y", "%d/%m/%y"]
+        # the format of the datasets with each file extension
+        self._constants["DATASET_EXTENSIONS"] = {
+            ".csv": "csv",
+            ".parquet": "parquet",
+            ".arrow": "arrow",
+            ".feather": "arrow",
+        }
+        # the cells of a csv dataset that are treated as missing, as pandas does by default
+        self._constants["NA_VALUES"] = [
+            "",
+            "#N/A",
+            "#N/A N/A",
+            "#NA",
+            "-1.#IND",
+            "-1.#QNAN",
+            "-NaN",
+            "-nan",
+            "1.#IND",
+            "1.#QNAN",
+            "<NA>",
+            "N/A",
+            "NA",
+            "NULL",
+            "NaN",
+            "None",
+            "n/a",
+            "nan",
+            "null",
+        ]
+        # the columns holding each MatchDetails statistic, in the order those fields are declared
+        self._constants["HOME_DETAIL_COLUMNS"] = ["HF", "HS", "HST", "HR", "HY", "HTHG", "FTHG"]
+        self._constants["AWAY_DETAIL_COLUMNS"] = ["AF", "AS", "AST", "AR", "AY", "HTAG", "FTAG"]
         self._constants[
             "HELP_COMMAND_INTRO"
         ] = "Kickoff is a football data analysis app that provides records and insights to football fans everywhere!"
         self._constants[
             "AGGREGATE_COMMAND_INTRO"
-        ] = "The aggregate commands compile basic but useful statistics from the premier league datasets."
+        ] = "The aggregate commands compile basic but useful statistics from the football datasets."
         self._constants[
             "RECORDS_COMMAND_INTRO"
         ] = "The records commands find the top X records for a given area or statistic in the past 10 years."
         self._constants[
             "OPTIMAL_COMMAND_INTRO"
         ] = "The optimal commands optimize the range of a specific statistic to achieve a specific goal."
-        self._constants["VALID_SEASONS"] = [
-            "2009-10",
-            "2010-11",
-            "2011-12",
-            "2012-13",
-            "2013-14",
-            "2014-15",
-            "2015-16",
-            "2016-17",
-            "2017-18",
-            "2018-19",
-        ]
+        self._constants[
+            "BENCH_COMMAND_INTRO"
+        ] = "The bench commands measure how long the various stages of Kickoff take to run."
+        self._constants[
+            "CACHE_COMMAND_INTRO"
+        ] = "The cache commands inspect and clear the snapshot that lets Kickoff skip rebuilding its graph."
 
     def retrieve(self, key: str) -> Any:
         """This function returns the corresponding constant when given the constant name.
@@ -10,13 +10,4 @@ from harshithl1777_kickoff.models.league import League
 
 def get_all_matches(league: League) -> list[Match]:
     """Return a list of all the matches in the entire League class"""
-    matches = []
-
-    teams = league.get_team_names()
-    for team in teams:
-        team_matches = league.get_team(team).matches
-        for match in team_matches:
-            if match not in matches:
-                matches.append(match)
-
-    return matches
+    return league.get_matches()
@@ -2,67 +2,462 @@
 
 This file contains various functions that load the dataset CSV files into a graph.
 
+Datasets are read from a configurable directory, and the seasons and divisions they cover are discovered
+from the data itself, with one League built per division.
+
+Each dataset is read by a reader chosen by its file extension, which returns the columns Kickoff uses as lists
+of Python values. csv files are read with the standard library by default, so loading them never imports pandas,
+while Parquet and Arrow files are read with pyarrow, which is only required when such files are present.
+
 This file is Copyright (c) 2023 Ram Raghav Sharma, Harshith Latchupatula, Vikram Makkar and Muhammad Ibrahim.
 """
 
+from __future__ import annotations
+import csv
+import importlib
 import os
-import time
-import pandas as pd
-from rich.progress import Progress, SpinnerColumn, TextColumn
+import sys
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from datetime import date, datetime
+from functools import partial
+from types import ModuleType
+from typing import TYPE_CHECKING, Any, Callable, Optional
 
 from harshithl1777_kickoff.utils.constants import Constants
+from harshithl1777_kickoff.utils import snapshot
 from harshithl1777_kickoff.models.league import League
 from harshithl1777_kickoff.models.match import Match, MatchDetails
 
+if TYPE_CHECKING:
+    import pandas as pd
+
+
+def load_csv_files(
+    data_dir: Optional[str] = None,
+    division: Optional[str] = None,
+    use_cache: bool = True,
+    workers: Optional[int] = None,
+    csv_reader: str = "csv",
+) -> League:
+    """Loads all csv files in the data directory into a League class for each division and returns the League
+    of the given division. If division is None, the default division is returned.
+
+    See load_leagues for how the data directory, the snapshot, the workers and the csv reader are used.
+
+    Preconditions:
+        - division is None or division in load_leagues(data_dir)
+    """
+    leagues = load_leagues(data_dir, use_cache, workers, csv_reader)
+    if division is None:
+        division = get_default_division(leagues)
+    return leagues[division]
+
+
+def load_leagues(
+    data_dir: Optional[str] = None, use_cache: bool = True, workers: Optional[int] = None, csv_reader: str = "csv"
+) -> dict[str, League]:
+    """Loads all csv files in the data directory and returns a mapping from each division found in them
+    to the League of that division. See get_data_dir for how the data directory is chosen.
+
+    If use_cache is True, the Leagues are read from the snapshot when the snapshot was built from the current
+    csv files, and otherwise the snapshot is rebuilt once the Leagues have been generated.
+    The datasets are parsed by the given number of worker processes, as described in read_datasets.
+    Matches added by ingest_datasets are replayed from the journal of the data directory after the
+    datasets have been loaded.
+
+    Preconditions:
+        - csv_reader in CSV_READERS
+    """
+    data_dir = get_data_dir(data_dir)
+    file_paths = get_dataset_paths(data_dir)
+    if use_cache:
+        leagues = snapshot.load_snapshot(data_dir, file_paths)
+        if leagues is not None:
+            return leagues
+
+    leagues = build_leagues(read_datasets(file_paths, workers, csv_reader=csv_reader))
+    journal = snapshot.load_journal(data_dir)
+    for division, season, columns in journal:
+        append_columns_to_graph(columns, leagues.setdefault(division, League()), season)
+    if journal:
+        for league in leagues.values():
+            league.get_stats_cube()
+            league.get_referee_index()
+
+    if use_cache:
+        snapshot.save_snapshot(leagues, data_dir, file_paths)
+    return leagues
+
+
+def ingest_datasets(
+    file_paths: list[str], data_dir: Optional[str] = None, workers: Optional[int] = None, csv_reader: str = "csv"
+) -> list[tuple[str, str, int, int]]:
+    """Append the matches in the given datasets to the Leagues of the data directory, and return a list of
+    tuples of each division and season in the datasets, the number of matches added to it and the number
+    of matches skipped because they were already in its League.
+
+    The Leagues are loaded as in load_leagues and the new matches are appended to them in place, rather than
+    rebuilding them from every dataset. The new matches are recorded in the journal of the data directory,
+    so they are kept when the Leagues are next rebuilt, and the snapshot is updated to include them.
+
+    Raises ValueError if any of the given files is not a supported dataset.
+
+    Preconditions:
+        - csv_reader in CSV_READERS
+    """
+    extensions = Constants().retrieve("DATASET_EXTENSIONS")
+    for path in file_paths:
+        if os.path.splitext(path)[1].lower() not in extensions:
+            raise ValueError(f"The dataset {path} is not one of the supported formats: {', '.join(extensions)}.")
+
+    data_dir = get_data_dir(data_dir)
+    partitions = read_datasets(file_paths, workers, csv_reader=csv_reader)
+    leagues = load_leagues(data_dir, workers=workers, csv_reader=csv_reader)
+
+    summary = []
+    journal = []
+    for division, season, columns in partitions:
+        new_columns = append_columns_to_graph(columns, leagues.setdefault(division, League()), season)
+        added = len(new_columns["HomeTeam"])
+        summary.append((division, season, added, len(columns["HomeTeam"]) - added))
+        if added > 0:
+            journal.append((division, season, new_columns))
+
+    if journal:
+        snapshot.append_journal(data_dir, journal)
+        for league in leagues.values():
+            league.get_stats_cube()
+            league.get_referee_index()
+        snapshot.save_snapshot(leagues, data_dir, get_dataset_paths(data_dir))
+    return summary
+
+
+def read_datasets(
+    file_paths: list[str], workers: Optional[int] = None, executor: str = "process", csv_reader: str = "csv"
+) -> list[tuple[str, str, dict[str, list]]]:
+    """Parse the given datasets and return a list of tuples of each division and season in them and the
+    columns of its matches, in the order of file_paths. csv files are parsed by the given csv reader.
+
+    The files are independent, so they are parsed concurrently by the given number of workers of the given
+    executor, one of 'process' or 'thread'. If workers is None, one worker is used per CPU. With a single
+    worker, or a single file, the files are parsed serially in this process.
+
+    Preconditions:
+        - workers is None or workers > 0
+        - executor in {'process', 'thread'}
+        - csv_reader in CSV_READERS
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+    workers = min(workers, len(file_paths))
+
+    read = partial(read_dataset, csv_reader=csv_reader)
+    if workers <= 1:
+        results = [read(path) for path in file_paths]
+    else:
+        pool_class = ProcessPoolExecutor if executor == "process" else ThreadPoolExecutor
+        with pool_class(max_workers=workers) as pool:
+            results = list(pool.map(read, file_paths))
+
+    return [partition for result in results for partition in result]
 
-def load_csv_files() -> League:
-    """Loads all csv files in /assets into a League class and returns it"""
-    with Progress(SpinnerColumn(), TextColumn("[progress.description]{task.description}"), transient=True) as progress:
-        progress.add_task(description="Retrieving datasets...", total=None)
 
-        files = [
-            file for file in os.listdir(os.path.dirname(os.path.abspath(__file__)) + "/../assets") if "csv" in file
-        ]
-        file_paths = [os.path.dirname(os.path.abspath(__file__)) + "/../assets/" + file for file in files]
-        time.sleep(0.5)
+def read_dataset(file_path: str, csv_reader: str = "csv") -> list[tuple[str, str, dict[str, list]]]:
+    """Parse the given dataset and return a list of tuples of each division and season in it and the
+    columns of its matches, as returned by partition_columns.
 
-        progress.add_task(description="Parsing data...", total=None)
-        dataframes = [generate_pandas_dataframe(path) for path in file_paths]
-        time.sleep(0.5)
+    This function runs in the worker processes of read_datasets, so it only returns plain Python data.
+
+    Preconditions:
+        - os.path.splitext(file_path)[1].lower() in Constants().retrieve("DATASET_EXTENSIONS")
+        - csv_reader in CSV_READERS
+    """
+    return partition_columns(get_reader(file_path, csv_reader)(file_path))
+
+
+def get_reader(file_path: str, csv_reader: str = "csv") -> Callable[[str], dict[str, list]]:
+    """Return the reader of the given dataset, chosen by its file extension. csv files are read by the given
+    csv reader.
+
+    Preconditions:
+        - os.path.splitext(file_path)[1].lower() in Constants().retrieve("DATASET_EXTENSIONS")
+        - csv_reader in CSV_READERS
+    """
+    file_format = Constants().retrieve("DATASET_EXTENSIONS")[os.path.splitext(file_path)[1].lower()]
+    if file_format == "csv":
+        return CSV_READERS[csv_reader]
+    return READERS[file_format]
+
+
+def partition_columns(columns: dict[str, list]) -> list[tuple[str, str, dict[str, list]]]:
+    """Split the given columns by division and season, and return a list of tuples of each division, season
+    and the columns of its matches used to build the graph. The season of each match is parsed from its date,
+    so a dataset can hold any number of seasons. Partitions are listed in the order they first appear.
+
+    Preconditions:
+        - columns was returned by a reader
+    """
+    date_seasons = {}
+    partition_rows = {}
+    for row, (division, match_date) in enumerate(zip(columns["Div"], columns["Date"])):
+        if match_date not in date_seasons:
+            date_seasons[match_date] = parse_season(match_date)
+        partition_rows.setdefault((division, date_seasons[match_date]), []).append(row)
+
+    partitions = []
+    for (division, season), rows in partition_rows.items():
+        if len(rows) == len(columns["Div"]):
+            season_columns = {column: columns[column] for column in _graph_columns()}
+        else:
+            season_columns = {column: [columns[column][row] for row in rows] for column in _graph_columns()}
+        partitions.append((division, season, season_columns))
+    return partitions
+
+
+def build_leagues(partitions: list[tuple[str, str, dict[str, list]]]) -> dict[str, League]:
+    """Return a mapping from each division in the given partitions, as returned by read_datasets,
+    to a League of its matches. Seasons are added to each League in chronological order regardless
+    of the order of the partitions, and partitions of the same season keep their relative order.
+
+    The matches of a partition of a season that is already in its League are appended after that season's
+    matches as in append_columns_to_graph, so matches held by several partitions are only added once.
+    """
+    leagues = {}
+    for division, season, columns in sorted(partitions, key=lambda partition: partition[:2]):
+        if division not in leagues:
+            leagues[division] = League()
+        if leagues[division].get_matches(season):
+            append_columns_to_graph(columns, leagues[division], season)
+        else:
+            convert_columns_to_graph(columns, leagues[division], season)
+
+    for league in leagues.values():
+        league.get_stats_cube()
+        league.get_referee_index()
+    return leagues
+
+
+def get_default_division(leagues: dict[str, League]) -> str:
+    """Return the division used when none is specified: the Premier League if it was loaded,
+    otherwise the first division in alphabetical order.
+
+    Preconditions:
+        - len(leagues) > 0
+    """
+    default_division = Constants().retrieve("DEFAULT_DIVISION")
+    if default_division in leagues:
+        return default_division
+    return min(leagues)
 
-        progress.add_task(description="Generating graph...", total=None)
-        league = League()
-        for i, dataframe in enumerate(dataframes):
-            season = files[i][:7]
-            convert_to_graph(dataframe, league, season)
 
-        time.sleep(0.5)
+def get_data_dir(data_dir: Optional[str] = None) -> str:
+    """Return the absolute path of the directory datasets are loaded from: the given data_dir if provided,
+    otherwise $KICKOFF_DATA_DIR if set, otherwise the assets folder shipped with Kickoff.
+    """
+    if data_dir is None:
+        data_dir = os.environ.get("KICKOFF_DATA_DIR")
+    if data_dir is None:
+        data_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "assets")
+    return os.path.normpath(os.path.abspath(data_dir))
+
+
+def get_dataset_paths(data_dir: Optional[str] = None) -> list[str]:
+    """Return the sorted paths of all datasets in the data directory and its subdirectories, which are the files
+    with an extension in Constants().retrieve("DATASET_EXTENSIONS").
+    """
+    extensions = Constants().retrieve("DATASET_EXTENSIONS")
+    file_paths = []
+    for directory, _, files in os.walk(get_data_dir(data_dir)):
+        file_paths.extend(
+            os.path.join(directory, file) for file in files if os.path.splitext(file)[1].lower() in extensions
+        )
+    return sorted(file_paths)
+
+
+def get_dataset_signature(data_dir: Optional[str] = None) -> list[tuple[str, int, int]]:
+    """Return the path, size and modification time of every dataset in the data directory and of its journal.
+    The signature changes whenever a dataset is added, removed or modified, or matches are ingested, which
+    is cheap to check without reading any file.
+    """
+    data_dir = get_data_dir(data_dir)
+    file_paths = get_dataset_paths(data_dir) + [snapshot.get_journal_path(data_dir)]
+    signature = []
+    for path in file_paths:
+        try:
+            stat = os.stat(path)
+        except FileNotFoundError:
+            continue
+        signature.append((path, stat.st_size, stat.st_mtime_ns))
+    return signature
 
-    return league
+
+def parse_season(match_date: str) -> str:
+    """Return the season string of a match played on the given date, e.g. '2009-10' for a match played
+    between August 2009 and May 2010.
+
+    Preconditions:
+        - match_date is in one of the formats in Constants().retrieve("DATE_FORMATS")
+    """
+    for date_format in Constants().retrieve("DATE_FORMATS"):
+        try:
+            parsed_date = datetime.strptime(match_date, date_format)
+            break
+        except ValueError:
+            continue
+    else:
+        raise ValueError(f"The match date '{match_date}' is not in a supported format.")
+
+    start_year = parsed_date.year if parsed_date.month >= 7 else parsed_date.year - 1
+    return f"{start_year}-{str(start_year + 1)[-2:]}"
 
 
 def generate_pandas_dataframe(csv_file: str) -> pd.DataFrame:
-    """Initializes a DataTable class with the provided csv_file name and season.
+    """Read the columns Kickoff uses from the provided csv_file into a dataframe.
+
+    Rows without a result, such as the blank rows at the end of some datasets, are dropped. Older datasets
+    that do not record some statistics or the referee get zeroes and an empty referee name instead,
+    and datasets without a Div column are assumed to be of the default division.
 
     Preconditions:
-        - csv_file is a valid csv file stored in the assets folder
+        - csv_file is a valid csv file with a header row
     """
+    import pandas as pd
+
     constants = Constants()
-    dataframe = pd.read_csv(csv_file, usecols=constants.retrieve("USE_COLUMNS"))
+    use_columns = constants.retrieve("USE_COLUMNS")
+    dataframe = pd.read_csv(csv_file, usecols=lambda column: column in use_columns, encoding_errors="replace")
+
+    missing_columns = [column for column in constants.retrieve("REQUIRED_COLUMNS") if column not in dataframe]
+    if missing_columns:
+        raise ValueError(f"The dataset {csv_file} is missing the columns {', '.join(missing_columns)}.")
+
+    dataframe = dataframe.dropna(subset=constants.retrieve("REQUIRED_COLUMNS"))
+    stat_columns = constants.retrieve("HOME_DETAIL_COLUMNS") + constants.retrieve("AWAY_DETAIL_COLUMNS")
+    for column in stat_columns:
+        dataframe[column] = dataframe[column].fillna(0).astype(int) if column in dataframe else 0
+    dataframe["Referee"] = dataframe["Referee"].fillna("").astype(str) if "Referee" in dataframe else ""
+    default_division = constants.retrieve("DEFAULT_DIVISION")
+    dataframe["Div"] = dataframe["Div"].fillna(default_division) if "Div" in dataframe else default_division
     return dataframe
 
 
-def convert_to_graph(dataframe: pd.DataFrame, league: League, season: str) -> None:
-    """Populate the graph with the provided dataframe representing the match and overall season statistics
+def read_csv_columns(csv_file: str) -> dict[str, list]:
+    """Read the columns Kickoff uses from the provided csv_file with the standard library csv module,
+    and return them as described in _normalize_columns.
+
+    This reader interprets the file the same way as generate_pandas_dataframe: cells holding any of
+    Constants().retrieve("NA_VALUES") are missing, and blank lines are skipped.
+
+    Preconditions:
+        - csv_file is a valid csv file with a header row
+    """
+    use_columns = set(Constants().retrieve("USE_COLUMNS"))
+    na_values = set(Constants().retrieve("NA_VALUES"))
+    with open(csv_file, newline="", encoding="utf-8-sig", errors="replace") as file:
+        reader = csv.reader(file)
+        indices = {}
+        for i, column in enumerate(next(reader, [])):
+            if column in use_columns:
+                indices.setdefault(column, i)
+
+        raw_columns = {column: [] for column in indices}
+        for row in reader:
+            if not row:
+                continue
+            for column, i in indices.items():
+                value = row[i] if i < len(row) else ""
+                raw_columns[column].append(None if value in na_values else value)
+
+    return _normalize_columns(raw_columns, csv_file)
+
+
+def read_pandas_columns(csv_file: str) -> dict[str, list]:
+    """Read the columns Kickoff uses from the provided csv_file with pandas, and return them as described in
+    _normalize_columns.
 
     Preconditions:
-        - dataframe is a valid representation of a csv file stored in the assets folder
-        - season is in the format '20XX-XX' between 2009-10 and 2018-19
+        - csv_file is a valid csv file with a header row
     """
-    for i in range(len(dataframe.index)):
-        ht_name = dataframe["HomeTeam"][i]
-        at_name = dataframe["AwayTeam"][i]
+    dataframe = generate_pandas_dataframe(csv_file)
+    return {column: dataframe[column].tolist() for column in ["Div", "Date"] + _graph_columns()}
 
+
+def read_parquet_columns(parquet_file: str) -> dict[str, list]:
+    """Read the columns Kickoff uses from the provided Parquet file, and return them as described in
+    _normalize_columns. The columns are expected to have the same names as in the csv datasets.
+
+    Preconditions:
+        - parquet_file is a valid Parquet file
+    """
+    parquet = _import_pyarrow("pyarrow.parquet", parquet_file)
+    use_columns = Constants().retrieve("USE_COLUMNS")
+    columns = [column for column in parquet.read_schema(parquet_file).names if column in use_columns]
+    return _normalize_columns(parquet.read_table(parquet_file, columns=columns).to_pydict(), parquet_file)
+
+
+def read_arrow_columns(arrow_file: str) -> dict[str, list]:
+    """Read the columns Kickoff uses from the provided Arrow IPC (Feather) file, and return them as described in
+    _normalize_columns. The columns are expected to have the same names as in the csv datasets.
+
+    Preconditions:
+        - arrow_file is a valid Arrow IPC file
+    """
+    feather = _import_pyarrow("pyarrow.feather", arrow_file)
+    use_columns = Constants().retrieve("USE_COLUMNS")
+    table = feather.read_table(arrow_file)
+    table = table.select([column for column in table.column_names if column in use_columns])
+    return _normalize_columns(table.to_pydict(), arrow_file)
+
+
+# the readers of csv files, one of which is chosen by the user
+CSV_READERS: dict[str, Callable[[str], dict[str, list]]] = {"csv": read_csv_columns, "pandas": read_pandas_columns}
+
+# the readers of every other format in Constants().retrieve("DATASET_EXTENSIONS")
+READERS: dict[str, Callable[[str], dict[str, list]]] = {"parquet": read_parquet_columns, "arrow": read_arrow_columns}
+
+
+def append_columns_to_graph(columns: dict[str, list], league: League, season: str) -> dict[str, list]:
+    """Append the matches in the provided columns to the given season of the graph, skipping any match between
+    the same home and away teams as a match already in that season, and return the columns of the matches
+    that were appended. The appended matches are played after every match already in the season.
+
+    Preconditions:
+        - columns was returned by partition_columns for the matches of one division and season
+        - season is in the format '20XX-XX'
+    """
+    season_matches = league.get_matches(season)
+    played = {(match.home_team.name, match.away_team.name) for match in season_matches}
+    rows = []
+    for row, pairing in enumerate(zip(columns["HomeTeam"], columns["AwayTeam"])):
+        if pairing not in played:
+            played.add(pairing)
+            rows.append(row)
+
+    new_columns = {column: [values[row] for row in rows] for column, values in columns.items()}
+    first_order = season_matches[-1].order + 1 if season_matches else 1
+    convert_columns_to_graph(new_columns, league, season, first_order)
+    return new_columns
+
+
+def convert_columns_to_graph(columns: dict[str, list], league: League, season: str, first_order: int = 1) -> None:
+    """Populate the graph with the provided columns representing the match and overall season statistics.
+    The matches are numbered in order starting from first_order.
+
+    The matches are built in a single pass over the rows formed by the columns, rather than by indexing
+    a dataframe cell by cell.
+
+    Preconditions:
+        - columns was returned by partition_columns for the matches of one division and season
+        - season is in the format '20XX-XX'
+        - first_order >= 1
+    """
+    constants = Constants()
+    match_columns = zip(*(columns[column] for column in ["HomeTeam", "AwayTeam", "FTR", "Referee"]))
+    home_columns = zip(*(columns[column] for column in constants.retrieve("HOME_DETAIL_COLUMNS")))
+    away_columns = zip(*(columns[column] for column in constants.retrieve("AWAY_DETAIL_COLUMNS")))
+    rows = enumerate(zip(match_columns, home_columns, away_columns), start=first_order)
+
+    for order, ((ht_name, at_name, full_time_result, referee), home_stats, away_stats) in rows:
         if not league.team_in_league(ht_name):
             home_team = league.add_team(ht_name)
         else:
@@ -76,39 +471,103 @@ def convert_to_graph(dataframe: pd.DataFrame, league: League, season: str) -> No
         league.add_season_to_team(ht_name, season)
         league.add_season_to_team(at_name, season)
 
-        home_team_details = MatchDetails(
-            team=home_team,
-            fouls=dataframe["HF"][i],
-            shots=int(dataframe["HS"][i]),
-            shots_on_target=int(dataframe["HST"][i]),
-            red_cards=int(dataframe["HR"][i]),
-            yellow_cards=int(dataframe["HY"][i]),
-            half_time_goals=int(dataframe["HTHG"][i]),
-            full_time_goals=int(dataframe["FTHG"][i]),
-            referee=dataframe["Referee"][i],
-        )
-        away_team_details = MatchDetails(
-            team=away_team,
-            fouls=dataframe["AF"][i],
-            shots=int(dataframe["AS"][i]),
-            shots_on_target=int(dataframe["AST"][i]),
-            red_cards=int(dataframe["AR"][i]),
-            yellow_cards=int(dataframe["AY"][i]),
-            half_time_goals=int(dataframe["HTAG"][i]),
-            full_time_goals=int(dataframe["FTAG"][i]),
-            referee=dataframe["Referee"][i],
-        )
+        referee = sys.intern(referee)
+        home_team_details = MatchDetails(home_team, *home_stats, referee=referee)
+        away_team_details = MatchDetails(away_team, *away_stats, referee=referee)
 
-        if dataframe["FTR"][i] == "H":
+        if full_time_result == "H":
             result = home_team
-        elif dataframe["FTR"][i] == "A":
+        elif full_time_result == "A":
             result = away_team
         else:
             result = None
 
-        details = {ht_name: home_team_details, at_name: away_team_details}
         match = Match(
-            season=season, home_team=home_team, away_team=away_team, order=(i + 1), details=details, result=result
+            season=season,
+            home_team=home_team,
+            away_team=away_team,
+            order=order,
+            home_details=home_team_details,
+            away_details=away_team_details,
+            result=result,
         )
 
         league.add_match(ht_name, at_name, match)
+
+
+def _graph_columns() -> list[str]:
+    """Return the names of the columns used to build the graph."""
+    constants = Constants()
+    columns = ["HomeTeam", "AwayTeam", "FTR", "Referee"]
+    return columns + constants.retrieve("HOME_DETAIL_COLUMNS") + constants.retrieve("AWAY_DETAIL_COLUMNS")
+
+
+def _normalize_columns(raw_columns: dict[str, list], file_path: str) -> dict[str, list]:
+    """Return the columns Kickoff uses, given the raw values read from the dataset at file_path, in which
+    missing values are None or NaN.
+
+    As in generate_pandas_dataframe, rows without a result are dropped, missing statistics become zeroes,
+    a missing referee becomes an empty name and a missing division becomes the default division. Dates are
+    returned as strings and statistics as ints.
+
+    Raises ValueError if the dataset is missing any of the required columns.
+    """
+    constants = Constants()
+    required_columns = constants.retrieve("REQUIRED_COLUMNS")
+    missing_columns = [column for column in required_columns if column not in raw_columns]
+    if missing_columns:
+        raise ValueError(f"The dataset {file_path} is missing the columns {', '.join(missing_columns)}.")
+
+    required_rows = zip(*(raw_columns[column] for column in required_columns))
+    rows = [i for i, values in enumerate(required_rows) if not any(_is_missing(value) for value in values)]
+
+    def column_values(column: str, convert: Callable[[Any], Any], default: Any) -> list:
+        if column not in raw_columns:
+            return [default] * len(rows)
+        values = raw_columns[column]
+        return [default if _is_missing(values[i]) else convert(values[i]) for i in rows]
+
+    columns = {
+        "Div": column_values("Div", str, constants.retrieve("DEFAULT_DIVISION")),
+        "Date": column_values("Date", _format_date, ""),
+        "HomeTeam": column_values("HomeTeam", str, ""),
+        "AwayTeam": column_values("AwayTeam", str, ""),
+        "FTR": column_values("FTR", str, ""),
+        "Referee": column_values("Referee", str, ""),
+    }
+    for column in constants.retrieve("HOME_DETAIL_COLUMNS") + constants.retrieve("AWAY_DETAIL_COLUMNS"):
+        columns[column] = column_values(column, _to_int, 0)
+    return columns
+
+
+def _is_missing(value: Any) -> bool:
+    """Return whether the given raw value is missing, i.e. None or NaN."""
+    return value is None or value != value
+
+
+def _to_int(value: Any) -> int:
+    """Return the given raw statistic as an int, truncating it if it is a decimal."""
+    try:
+        return int(value)
+    except ValueError:
+        return int(float(value))
+
+
+def _format_date(value: Any) -> str:
+    """Return the given raw match date as a string in one of the formats in Constants().retrieve("DATE_FORMATS")."""
+    if isinstance(value, date):
+        return value.strftime("%Y-%m-%d")
+    return str(value)
+
+
+def _import_pyarrow(module: str, file_path: str) -> ModuleType:
+    """Return the given pyarrow module, which is needed to read the dataset at file_path.
+
+    Raises ValueError if pyarrow is not installed.
+    """
+    try:
+        return importlib.import_module(module)
+    except ImportError as import_error:
+        raise ValueError(
+            f"Reading the dataset {file_path} requires pyarrow, which can be installed with 'pip install pyarrow'."
+        ) from import_error
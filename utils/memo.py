@@ -0,0 +1,142 @@
+"""Kickoff Project: utils / memo.py
+
+This module contains the memoize decorator, which caches the results of the controller queries on a League so
+that repeating a query, or running one that is built from others, does not recompute it from the matches.
+
+Results are cached per League and are discarded as soon as the League is modified, which is detected with the
+version League bumps on every add_team and add_match call, so a cached result is never stale.
+
+This file is Copyright (c) 2023 Ram Raghav Sharma, Harshith Latchupatula, Vikram Makkar and Muhammad Ibrahim.
+"""
+import functools
+import inspect
+from collections import OrderedDict
+from typing import Any, Callable, TypeVar
+from weakref import WeakKeyDictionary
+
+from harshithl1777_kickoff.models.league import League
+
+# the number of results kept for each memoized function and League before the least recently used is evicted
+MEMO_MAXSIZE = 256
+
+Function = TypeVar("Function", bound=Callable[..., Any])
+
+
+class Memo:
+    """The cached results of a memoized function, and counters of how they were used.
+
+    Instance Attributes:
+        - name: The name of the memoized function, qualified by the name of its module.
+        - maxsize: The number of results kept for each League.
+        - hits: The number of calls answered from the cache.
+        - misses: The number of calls that computed their result.
+        - evictions: The number of results discarded to stay within maxsize.
+        - invalidations: The number of times the results for a League were discarded because it was modified.
+
+    Representation Invariants:
+        - self.maxsize > 0
+    """
+
+    name: str
+    maxsize: int
+    hits: int
+    misses: int
+    evictions: int
+    invalidations: int
+    _results: WeakKeyDictionary
+
+    def __init__(self, name: str, maxsize: int) -> None:
+        self.name = name
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+        self._results = WeakKeyDictionary()
+
+    def get(self, league: League, key: tuple, compute: Callable[[], Any]) -> Any:
+        """Return the result cached for the given key and the current version of the given League, calling
+        compute to produce and cache it if there is none.
+        """
+        version, results = self._results.get(league, (None, None))
+        if version != league.get_version():
+            if results:
+                self.invalidations += 1
+            results = OrderedDict()
+            self._results[league] = (league.get_version(), results)
+
+        if key in results:
+            self.hits += 1
+            results.move_to_end(key)
+            return results[key]
+
+        self.misses += 1
+        result = compute()
+        results[key] = result
+        if len(results) > self.maxsize:
+            results.popitem(last=False)
+            self.evictions += 1
+        return result
+
+    def __len__(self) -> int:
+        return sum(len(results) for _, results in self._results.values())
+
+    def clear(self) -> None:
+        """Discard every cached result and reset the counters."""
+        self._results.clear()
+        self.hits = self.misses = self.evictions = self.invalidations = 0
+
+
+# the memo of every memoized function, in the order the functions were defined
+_memos: list[Memo] = []
+
+
+def memoize(maxsize: int = MEMO_MAXSIZE) -> Callable[[Function], Function]:
+    """Return a decorator that caches the results of a function with a parameter named league, keyed on the
+    League, its version and the values of every other argument, keeping the maxsize most recently used results
+    for each League.
+
+    Lists and dictionaries are returned as shallow copies, so callers can modify what they receive without
+    affecting the cache, but must not modify the elements of the result.
+
+    Preconditions:
+        - maxsize > 0
+        - the decorated function has a parameter named league, and all of its other arguments are hashable
+    """
+
+    def decorator(function: Function) -> Function:
+        signature = inspect.signature(function)
+        memo = Memo(f"{function.__module__.rsplit('.', 1)[-1]}.{function.__name__}", maxsize)
+        _memos.append(memo)
+
+        @functools.wraps(function)
+        def memoized(*args: Any, **kwargs: Any) -> Any:
+            arguments = signature.bind(*args, **kwargs)
+            arguments.apply_defaults()
+            league = arguments.arguments.pop("league")
+            result = memo.get(league, tuple(arguments.arguments.items()), lambda: function(*args, **kwargs))
+            if isinstance(result, (list, dict)):
+                return result.copy()
+            return result
+
+        memoized.memo = memo
+        return memoized
+
+    return decorator
+
+
+def get_memo_stats() -> list[tuple[str, int, int, int, int, int]]:
+    """Return a list of tuples of each memoized function that has been called, its number of hits, misses,
+    cached results, evictions and invalidations.
+    """
+    return [
+        (memo.name, memo.hits, memo.misses, len(memo), memo.evictions, memo.invalidations)
+        for memo in _memos
+        if memo.hits + memo.misses > 0
+    ]
+
+
+def clear_memos() -> None:
+    """Discard the cached results of every memoized function and reset their counters."""
+    for memo in _memos:
+        memo.clear()
@@ -0,0 +1,33 @@
+"""Kickoff Project: utils / paths.py
+
+This file contains functions that locate the files Kickoff keeps outside of its data directory.
+
+It only uses the standard library, so that the CLI can locate a running server without importing the rest of
+Kickoff.
+
+This file is Copyright (c) 2023 Ram Raghav Sharma, Harshith Latchupatula, Vikram Makkar and Muhammad Ibrahim.
+"""
+import os
+
+SOCKET_NAME = "kickoff.sock"
+
+
+def get_cache_dir() -> str:
+    """Return the directory snapshots are stored in.
+
+    This is $KICKOFF_CACHE_DIR if set, otherwise kickoff/ inside $XDG_CACHE_HOME or ~/.cache.
+    """
+    if os.environ.get("KICKOFF_CACHE_DIR"):
+        return os.environ["KICKOFF_CACHE_DIR"]
+    cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(cache_home, "kickoff")
+
+
+def get_socket_path() -> str:
+    """Return the path of the Unix socket the Kickoff server listens on.
+
+    This is $KICKOFF_SOCKET if set, otherwise kickoff.sock inside the cache directory.
+    """
+    if os.environ.get("KICKOFF_SOCKET"):
+        return os.environ["KICKOFF_SOCKET"]
+    return os.path.join(get_cache_dir(), SOCKET_NAME)
@@ -0,0 +1,235 @@
+"""Kickoff Project: utils / snapshot.py
+
+This file contains functions that persist the Leagues built from a data directory to a binary snapshot in the
+user's cache directory, so that later runs can skip parsing the datasets and building the graph.
+Each data directory has its own snapshot.
+
+A snapshot is only used while the datasets it was built from are unchanged. Each dataset is fingerprinted by its
+size and modification time, and by a hash of its contents that is only recomputed when those two disagree.
+
+Matches ingested into a data directory are also recorded in its journal, which is kept alongside the snapshot
+and replayed whenever the Leagues are rebuilt. The journal is fingerprinted like a dataset.
+
+This file is Copyright (c) 2023 Ram Raghav Sharma, Harshith Latchupatula, Vikram Makkar and Muhammad Ibrahim.
+"""
+import hashlib
+import json
+import os
+import pickle
+import tempfile
+from datetime import datetime
+from typing import Any, Optional
+
+from harshithl1777_kickoff.models.league import League
+from harshithl1777_kickoff.utils.paths import get_cache_dir
+
+# bump whenever the pickled model classes change shape so that old snapshots are rebuilt
+SNAPSHOT_VERSION = 10
+SNAPSHOT_PREFIX = "league-"
+SNAPSHOT_SUFFIX = ".pickle"
+JOURNAL_PREFIX = "journal-"
+JOURNAL_SUFFIX = ".jsonl"
+
+Fingerprint = tuple[str, int, int, str]
+
+
+def get_snapshot_path(data_dir: str) -> str:
+    """Return the path of the snapshot file of the given data directory."""
+    return os.path.join(get_cache_dir(), SNAPSHOT_PREFIX + _hash_data_dir(data_dir) + SNAPSHOT_SUFFIX)
+
+
+def get_journal_path(data_dir: str) -> str:
+    """Return the path of the journal of matches ingested into the given data directory."""
+    return os.path.join(get_cache_dir(), JOURNAL_PREFIX + _hash_data_dir(data_dir) + JOURNAL_SUFFIX)
+
+
+def load_snapshot(data_dir: str, file_paths: list[str]) -> Optional[dict[str, League]]:
+    """Return the Leagues stored in the snapshot of the given data directory if they were built from the given
+    datasets, otherwise None.
+
+    If a dataset was only touched, so that its modification time changed but its contents did not, the header
+    of the snapshot is rewritten with its new modification time so that later loads do not hash it again.
+    """
+    path = get_snapshot_path(data_dir)
+    try:
+        with open(path, "rb") as snapshot:
+            header = pickle.load(snapshot)
+            fingerprints = _get_fresh_fingerprints(header, _get_inputs(data_dir, file_paths))
+            if fingerprints is None:
+                return None
+            if fingerprints == header["datasets"]:
+                return pickle.load(snapshot)
+            body = snapshot.read()
+        _write_snapshot(path, {**header, "datasets": fingerprints}, body)
+        return pickle.loads(body)
+    except (OSError, EOFError, AttributeError, ImportError, ValueError, pickle.PickleError):
+        return None
+
+
+def save_snapshot(leagues: dict[str, League], data_dir: str, file_paths: list[str]) -> None:
+    """Persist the given Leagues, built from the given datasets, as the snapshot of the given data directory.
+    Failing to write the snapshot is not an error, as the Leagues can always be rebuilt.
+    """
+    header = {
+        "version": SNAPSHOT_VERSION,
+        "created": datetime.now().isoformat(timespec="seconds"),
+        "datasets": [_fingerprint(path) for path in _get_inputs(data_dir, file_paths)],
+    }
+    _write_snapshot(get_snapshot_path(data_dir), header, pickle.dumps(leagues, protocol=pickle.HIGHEST_PROTOCOL))
+
+
+def load_journal(data_dir: str) -> list[tuple[str, str, dict[str, list]]]:
+    """Return the ingested matches recorded in the journal of the given data directory, as a list of tuples of
+    each division and season and the columns of its matches, in the order they were ingested.
+    """
+    try:
+        with open(get_journal_path(data_dir), encoding="utf-8") as journal:
+            entries = [json.loads(line) for line in journal if line.strip()]
+    except FileNotFoundError:
+        return []
+    return [(entry["division"], entry["season"], entry["columns"]) for entry in entries]
+
+
+def append_journal(data_dir: str, partitions: list[tuple[str, str, dict[str, list]]]) -> None:
+    """Record the given ingested matches, as tuples of each division and season and the columns of its matches,
+    in the journal of the given data directory.
+
+    Unlike the snapshot, the journal cannot be rebuilt from the datasets, so failing to write it raises OSError.
+    """
+    os.makedirs(get_cache_dir(), exist_ok=True)
+    with open(get_journal_path(data_dir), "a", encoding="utf-8") as journal:
+        for division, season, columns in partitions:
+            journal.write(json.dumps({"division": division, "season": season, "columns": columns}) + "\n")
+
+
+def clear_snapshots() -> int:
+    """Delete the snapshots of every data directory and return the number of snapshots deleted."""
+    return _clear_files(SNAPSHOT_PREFIX, SNAPSHOT_SUFFIX)
+
+
+def clear_journals() -> int:
+    """Delete the journals of every data directory, discarding all ingested matches, and return the number
+    of journals deleted.
+    """
+    return _clear_files(JOURNAL_PREFIX, JOURNAL_SUFFIX)
+
+
+def get_snapshot_status(data_dir: str, file_paths: list[str]) -> list[tuple[str, str]]:
+    """Return a list of tuples describing the snapshot of the given data directory: its path, state, size,
+    creation time, datasets and the number of ingested matches.
+
+    The state is one of 'missing', 'valid' or 'stale'.
+    """
+    path = get_snapshot_path(data_dir)
+    ingested = sum(len(columns["HomeTeam"]) for _, _, columns in load_journal(data_dir))
+    try:
+        with open(path, "rb") as snapshot:
+            header = pickle.load(snapshot)
+        size = os.path.getsize(path)
+    except (OSError, EOFError, AttributeError, ImportError, ValueError, pickle.PickleError):
+        return [
+            ("Data directory", data_dir),
+            ("Snapshot", path),
+            ("State", "missing"),
+            ("Ingested matches", str(ingested)),
+        ]
+
+    state = "valid" if _is_fresh(header, _get_inputs(data_dir, file_paths)) else "stale"
+    return [
+        ("Data directory", data_dir),
+        ("Snapshot", path),
+        ("State", state),
+        ("Size (KB)", str(round(size / 1024, 1))),
+        ("Created", str(header.get("created"))),
+        ("Datasets", str(len(file_paths))),
+        ("Ingested matches", str(ingested)),
+    ]
+
+
+def _get_inputs(data_dir: str, file_paths: list[str]) -> list[str]:
+    """Return the paths of the files the snapshot of the given data directory is built from: the given datasets,
+    followed by the journal if any matches have been ingested.
+    """
+    journal_path = get_journal_path(data_dir)
+    return file_paths + [journal_path] if os.path.exists(journal_path) else file_paths
+
+
+def _clear_files(prefix: str, suffix: str) -> int:
+    """Delete the files in the cache directory with the given prefix and suffix and return the number deleted."""
+    try:
+        files = os.listdir(get_cache_dir())
+    except FileNotFoundError:
+        return 0
+
+    cleared = 0
+    for file in files:
+        if file.startswith(prefix) and file.endswith(suffix):
+            os.remove(os.path.join(get_cache_dir(), file))
+            cleared += 1
+    return cleared
+
+
+def _write_snapshot(path: str, header: dict[str, Any], body: bytes) -> None:
+    """Write a snapshot with the given header and pickled Leagues to the given path.
+
+    The snapshot is written to a temporary file first so that a concurrent reader never sees a partial file.
+    Failing to write the snapshot is not an error, as the Leagues can always be rebuilt.
+    """
+    cache_dir = get_cache_dir()
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        with tempfile.NamedTemporaryFile(dir=cache_dir, suffix=".tmp", delete=False) as snapshot:
+            pickle.dump(header, snapshot, protocol=pickle.HIGHEST_PROTOCOL)
+            snapshot.write(body)
+        os.replace(snapshot.name, path)
+    except OSError:
+        return
+
+
+def _is_fresh(header: Any, file_paths: list[str]) -> bool:
+    """Return whether the snapshot with the given header was built from exactly the given datasets."""
+    return _get_fresh_fingerprints(header, file_paths) is not None
+
+
+def _get_fresh_fingerprints(header: Any, file_paths: list[str]) -> Optional[list[Fingerprint]]:
+    """Return the current fingerprints of the given datasets if the snapshot with the given header was built from
+    exactly them, otherwise None.
+
+    A dataset is only hashed if its modification time differs from the one in the header, in which case its
+    fingerprint is returned with the new modification time if its contents are unchanged.
+    """
+    if not isinstance(header, dict) or header.get("version") != SNAPSHOT_VERSION:
+        return None
+
+    fingerprints = header["datasets"]
+    if [fingerprint[0] for fingerprint in fingerprints] != file_paths:
+        return None
+
+    fresh_fingerprints = []
+    for (path, size, mtime, digest) in fingerprints:
+        stat = os.stat(path)
+        if stat.st_size != size:
+            return None
+        if stat.st_mtime_ns != mtime:
+            if _hash_file(path) != digest:
+                return None
+            mtime = stat.st_mtime_ns
+        fresh_fingerprints.append((path, size, mtime, digest))
+    return fresh_fingerprints
+
+
+def _fingerprint(path: str) -> Fingerprint:
+    """Return the path, size, modification time and content hash of the given dataset."""
+    stat = os.stat(path)
+    return (path, stat.st_size, stat.st_mtime_ns, _hash_file(path))
+
+
+def _hash_data_dir(data_dir: str) -> str:
+    """Return a short hash of the given data directory, which names its snapshot and journal."""
+    return hashlib.blake2b(data_dir.encode(), digest_size=8).hexdigest()
+
+
+def _hash_file(path: str) -> str:
+    """Return a hash of the contents of the given file."""
+    with open(path, "rb") as file:
+        return hashlib.blake2b(file.read(), digest_size=16).hexdigest()
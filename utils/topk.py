@@ -0,0 +1,63 @@
+"""Kickoff Project: utils / topk.py
+
+This module contains functions to select the k best items of a collection without sorting all of it, which the
+records and optimal commands use to find their topx results.
+
+Both functions break ties the way sorted does, so that their results are exactly sorted(...)[:k]: items with
+equal keys keep the order in which they were given, whether the largest or the smallest items are selected.
+
+This file is Copyright (c) 2023 Ram Raghav Sharma, Harshith Latchupatula, Vikram Makkar and Muhammad Ibrahim.
+"""
+import heapq
+from typing import Any, Callable, Iterable, TypeVar
+
+import numpy as np
+
+# a heap is only used when k is at most this fraction of the items, as sorting is faster for larger k
+HEAP_FRACTION = 1 / 32
+
+Item = TypeVar("Item")
+
+
+def top_k(items: Iterable[Item], k: int, key: Callable[[Item], Any], largest: bool = True) -> list[Item]:
+    """Return the k items with the largest keys, or the smallest if largest is False, ordered from best to worst.
+    Items with equal keys are returned in the order they were given.
+
+    This is equivalent to sorted(items, key=key, reverse=largest)[:k], but only keeps a heap of k items when
+    k is small compared to the number of items.
+
+    Preconditions:
+        - k > 0
+    """
+    items = list(items)
+    if k >= len(items) * HEAP_FRACTION:
+        return sorted(items, key=key, reverse=largest)[:k]
+    if largest:
+        return heapq.nlargest(k, items, key=key)
+    return heapq.nsmallest(k, items, key=key)
+
+
+def top_k_indices(values: np.ndarray, k: int, largest: bool = True) -> np.ndarray:
+    """Return the indices of the k largest values, or the smallest if largest is False, ordered from best to
+    worst. Equal values are returned in the order of their indices.
+
+    The k best values are found with np.argpartition in linear time, and only those are sorted. Ties at the
+    boundary of the k best values are broken in favour of the smaller indices, so the result is always
+    equal to the first k indices of a stable sort of the values.
+
+    Preconditions:
+        - values is a one-dimensional array of signed integers or floats, and holds no nan values
+        - k > 0
+    """
+    if k >= len(values):
+        candidates = np.arange(len(values))
+    else:
+        scores = -values if largest else values
+        threshold = scores[np.argpartition(scores, k - 1)[k - 1]]
+        better = np.flatnonzero(scores < threshold)
+        tied = np.flatnonzero(scores == threshold)[: k - len(better)]
+        candidates = np.sort(np.concatenate([better, tied]))
+
+    candidate_values = values[candidates]
+    order = np.argsort(-candidate_values if largest else candidate_values, kind="stable")
+    return candidates[order]